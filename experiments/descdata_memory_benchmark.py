@@ -0,0 +1,66 @@
+""" Measures the per-descriptor memory overhead of a deserialized descriptor data store (100k entries by default).
+Compares the current DescriptorDataImpl against the former __dict__-based record with a fresh list of tag UID copies.
+Run from the repository root: python experiments/descdata_memory_benchmark.py [entriesCount] """
+import sys, json, random, tracemalloc, uuid, gc
+from pathlib import Path
+from typing import Any
+
+qavmPath = Path("./source").resolve()
+if str(qavmPath) not in sys.path:
+	sys.path.insert(0, str(qavmPath))
+
+from qavm.manager_descriptor_data import DescriptorDataImpl
+
+class LegacyDescriptorDataImpl(object):
+	""" The record as it was before: per-instance __dict__, own list of tag UIDs, no interning. """
+	def __init__(self) -> None:
+		self.tags: list[str] = []
+		self.noteSmall: str = ''
+		self.noteDetail: str = ''
+
+	@staticmethod
+	def Deserialize(data: dict[str, Any]) -> 'LegacyDescriptorDataImpl':
+		descData = LegacyDescriptorDataImpl()
+		descData.tags = data.get('tags', descData.tags)
+		descData.noteSmall = data.get('noteSmall', descData.noteSmall)
+		descData.noteDetail = data.get('noteDetail', descData.noteDetail)
+		return descData
+
+def GenerateStoreJson(entriesCount: int, tagsCount: int = 300) -> str:
+	""" Most descriptors have no data at all, some have a few tags and only a handful have notes. """
+	rnd: random.Random = random.Random(42)
+	tagUIDs: list[str] = [uuid.UUID(int=rnd.getrandbits(128)).hex for _ in range(tagsCount)]
+	store: dict[str, dict[str, Any]] = dict()
+	for i in range(entriesCount):
+		entry: dict[str, Any] = {'tags': [], 'noteSmall': '', 'noteDetail': ''}
+		if rnd.random() < 0.4:
+			entry['tags'] = rnd.sample(tagUIDs, rnd.randint(1, 4))
+		if rnd.random() < 0.05:
+			entry['noteSmall'] = f'note {i}'
+		store[f'{i:064x}'] = entry
+	return json.dumps(store)
+
+def MeasureStore(storeJson: str, recordClass: type) -> int:
+	""" Returns the number of bytes held by the deserialized store (the dict with all records). """
+	gc.collect()
+	tracemalloc.start()
+	store: dict[str, Any] = {descUID: recordClass.Deserialize(dd) for descUID, dd in json.loads(storeJson).items()}
+	gc.collect()
+	size, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	del store
+	return size
+
+def main():
+	entriesCount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+	storeJson: str = GenerateStoreJson(entriesCount)
+	results: dict[str, int] = {
+		'before (dict + list)': MeasureStore(storeJson, LegacyDescriptorDataImpl),
+		'after (slots + interned tuple)': MeasureStore(storeJson, DescriptorDataImpl),
+	}
+	print(f'Descriptor data store with {entriesCount} entries:')
+	for title, size in results.items():
+		print(f'  {title:32} {size / 2**20:8.2f} MiB total, {size / entriesCount:7.1f} bytes per descriptor')
+
+if __name__ == '__main__':
+	main()
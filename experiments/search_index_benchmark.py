@@ -0,0 +1,69 @@
+""" Measures the descriptor search index (50k descriptors by default): building it and searching on every keystroke
+while typing queries into the filter bar, and filtering by tag combinations. Run from the repository root: python experiments/search_index_benchmark.py [descriptorsCount] """
+import sys, random, string, tempfile, time
+from pathlib import Path
+
+qavmPath = Path("./source").resolve()
+if str(qavmPath) not in sys.path:
+	sys.path.insert(0, str(qavmPath))
+
+from qavm.qavmapi import BaseDescriptor
+from qavm.manager_descriptor_data import DescriptorDataManager
+from qavm.manager_tags import BaseTagImpl
+from qavm.manager_search import DescriptorSearchIndex
+
+class FakeTagsManager(object):
+	def __init__(self, tags: list[BaseTagImpl]) -> None:
+		self.tags: dict[str, BaseTagImpl] = {tag.GetUID(): tag for tag in tags}
+
+	def GetTag(self, tagUID: str) -> BaseTagImpl | None:
+		return self.tags.get(tagUID)
+
+def GenerateDescriptors(descsCount: int, descDataManager: DescriptorDataManager, tagsManager: FakeTagsManager) -> list[BaseDescriptor]:
+	""" Builds of a few products in versioned folders; some have tags, only a handful have notes. """
+	rnd: random.Random = random.Random(42)
+	words: list[str] = [''.join(rnd.choice(string.ascii_lowercase) for _ in range(rnd.randint(3, 9))) for _ in range(500)]
+	products: list[str] = words[:20]
+	descs: list[BaseDescriptor] = []
+	for i in range(descsCount):
+		dirPath: Path = Path('/builds') / rnd.choice(products) / f'{rnd.choice(words)}_{rnd.randint(1, 2025)}.{rnd.randint(0, 99)}_{i}'
+		desc: BaseDescriptor = BaseDescriptor(dirPath, None, {})
+		descData = descDataManager.GetDescriptorData(desc)
+		if rnd.random() < 0.3:
+			descData.SetTagUIDs(rnd.sample(list(tagsManager.tags), 2))
+		if rnd.random() < 0.05:
+			descData.noteSmall = f'{rnd.choice(words)} {rnd.choice(words)}'
+		descs.append(desc)
+	return descs
+
+def main():
+	descsCount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+	with tempfile.TemporaryDirectory() as tmpDirName:
+		descDataManager: DescriptorDataManager = DescriptorDataManager(Path(tmpDirName) / 'descdata.json')
+		descDataManager.LoadData()
+		tagsManager: FakeTagsManager = FakeTagsManager([BaseTagImpl(f'tag{i}', f'Tag {i}', '#ff0000') for i in range(30)])
+		descs: list[BaseDescriptor] = GenerateDescriptors(descsCount, descDataManager, tagsManager)
+		index: DescriptorSearchIndex = DescriptorSearchIndex(descDataManager, tagsManager)
+
+		startTime: float = time.perf_counter()
+		index.SetDescriptors(descs)
+		print(f'{descsCount} descriptors: added to the index in {(time.perf_counter() - startTime) * 1000:.0f} ms')
+		startTime = time.perf_counter()
+		index.Search('x')
+		print(f'  texts collected and words indexed by the first search in {(time.perf_counter() - startTime) * 1000:.0f} ms')
+
+		for query in [descs[123].dirPath.name, 'tag 1', str(descs[7].dirPath.parent.name), '_1', '.5']:
+			keystrokeTimes: list[float] = []
+			for length in range(1, len(query) + 1):
+				startTime = time.perf_counter()
+				matchesCount: int = len(index.Search(query[:length]) or ())
+				keystrokeTimes.append(time.perf_counter() - startTime)
+			print(f'  typing {query!r:28} max {max(keystrokeTimes) * 1000:6.2f} ms per keystroke, first {keystrokeTimes[0] * 1000:6.2f} ms, {matchesCount} matches')
+
+		for requiredTagUIDs, excludedTagUIDs in [(['tag1'], []), (['tag1', 'tag2'], []), ([], ['tag3']), (['tag1'], ['tag2', 'tag3'])]:
+			startTime = time.perf_counter()
+			matchesCount = len(index.Search('', requiredTagUIDs, excludedTagUIDs))
+			print(f'  tags {requiredTagUIDs} without {excludedTagUIDs}: {(time.perf_counter() - startTime) * 1000:.2f} ms, {matchesCount} matches')
+
+if __name__ == '__main__':
+	main()
@@ -10,14 +10,14 @@ from typing import Any, Optional
 
 from qavm.qavmapi import (
 	BaseQualifier, BaseDescriptor, BaseTileBuilder, SoftwareBaseSettings, BaseTableBuilder,
-	BaseCustomView,	QualifierIdentificationConfig, BaseMenuItem, QIConfigTargetType, TableColumnInfo, 
+	BaseCustomView,	QualifierIdentificationConfig, BaseMenuItem, QIConfigTargetType, TableColumnInfo, AsyncValue,
 )
 from qavm.qavmapi.gui import (
 	StaticBorderWidget, RunningBorderWidget, PathTableWidgetItem, 
 )
 
 from qavm.qavmapi.utils import (
-	PlatformWindows, OpenFolderInExplorer, StartProcess, IsProcessRunning,
+	PlatformWindows, OpenFolderInExplorer, StartProcess, IsProcessRunning, GetWinExeVersionInfo,
 )
 
 from PyQt6.QtCore import (
@@ -82,6 +82,10 @@ class ExampleDescriptorBase(BaseDescriptor):
 			else:
 				logger.warning(f'No target files found in {self.dirPath}')
 
+	def GetFingerprint(self) -> str:
+		# The target files are found on the disk rather than in the identification files: a rescan should see them change
+		return f'{super().GetFingerprint()}|{"|".join(map(str, self.targetPaths))}'
+
 	def _getGlobPattern(self) -> str:
 		raise NotImplementedError('This method should be implemented in the subclass to return the glob pattern for the descriptor.')
 	
@@ -229,9 +233,17 @@ class ExampleTableBuilderEXE(BaseTableBuilder):
 	def GetTableColumnInfo(self) -> list[TableColumnInfo]:
 		return [
 			TableColumnInfo('Folder name', lambda desc: desc.dirPath.name),
-			TableColumnInfo('Version', lambda desc: "unknown"),
+			TableColumnInfo('Version', self._getVersionCellData, defaultWidth=80),
 			TableColumnInfo('Path', lambda desc: PathTableWidgetItem(desc.dirPath)),
+			TableColumnInfo('Notes', self.CellDataGetterDefault_NotesCellData, defaultWidth=120),
 		]
+
+	def _getVersionCellData(self, desc: ExampleDescriptorEXE) -> str | AsyncValue:
+		exePath: Path | None = desc.targetPaths[0] if desc.targetPaths else None
+		if not PlatformWindows() or exePath is None or exePath.suffix.lower() != '.exe':
+			return 'unknown'
+		# Reading the version resource can take a while (e.g. on network drives), so it's done off the GUI thread
+		return AsyncValue(lambda: GetWinExeVersionInfo(exePath)[0] or 'unknown', 'version', '...')
 	
 class ExampleTableBuilderPNG(ExampleTableBuilderEXE):
 	def GetSupportedDescriptorTypes(self, descriptorTypes: list[str]) -> list[str]:
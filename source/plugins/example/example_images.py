@@ -10,7 +10,8 @@ from typing import Any, Optional
 
 from qavm.qavmapi import (
 	BaseQualifier, BaseDescriptor, BaseTileBuilder, SoftwareBaseSettings, BaseTableBuilder,
-	BaseCustomView,	QualifierIdentificationConfig, BaseMenuItem, QIConfigTargetType, TableColumnInfo, 
+	BaseCustomView,	QualifierIdentificationConfig, BaseMenuItem, QIConfigTargetType, TableColumnInfo, BaseSettingsEntry,
+	TileDetailLevel,
 )
 from qavm.qavmapi.gui import (
 	StaticBorderWidget, RunningBorderWidget, PathTableWidgetItem, NumberTableWidgetItem, 
@@ -70,6 +71,10 @@ class ExampleDescriptorImages(BaseDescriptor):
 						logger.error(f'Error reading image {self.dirPath}: {e}')
 						self.imageResolution = None
 
+	def GetFingerprint(self) -> str:
+		# The size and resolution are read from the file itself: a rescan should see them change
+		return f'{super().GetFingerprint()}|{self.fileSize}|{self.imageResolution}'
+
 	def __str__(self):
 		return f'{self.__class__.__name__}: {os.path.basename(self.dirPath)}'
 	
@@ -101,15 +106,10 @@ class ExampleContextMenuBase(object):
 	# 		desc.updated_old.emit()
 
 class ExampleTileBuilderImages(BaseTileBuilder, ExampleContextMenuBase):
-	def __init__(self, settings: SoftwareBaseSettings):
-		super().__init__(settings)
-
-		# From BaseTileBuilder:
-		# self.settings: SoftwareBaseSettings
-		# self.descDataAccessor: DescriptonrDataAccessor
-		# self.themeData: dict
-
-		self.settings.settingChanged.connect(self._onSettingsChanged)
+	# From BaseTileBuilder:
+	# self.settings: SoftwareBaseSettings
+	# self.descDataAccessor: DescriptonrDataAccessor
+	# self.themeData: dict
 
 	def GetContextMenu(self, desc: ExampleDescriptorImages) -> QMenu | None:
 		return self._getContextMenu(desc)
@@ -125,6 +125,15 @@ class ExampleTileBuilderImages(BaseTileBuilder, ExampleContextMenuBase):
 
 		animatedBorderWidget = self._wrapWidgetInAnimatedBorder(descWidget, borderColor, isProcessRunning, parent)
 		return animatedBorderWidget
+
+	def CreateDetailLevelTileWidget(self, descriptor: ExampleDescriptorImages, detailLevel: TileDetailLevel, parent) -> QWidget | None:
+		if detailLevel != TileDetailLevel.COMPACT:
+			return None  # the generic icon grid is fine for the DENSE level
+		# Compact tiles skip loading the image, which is what makes the full tiles expensive
+		resStr: str = f'{descriptor.imageResolution[0]}x{descriptor.imageResolution[1]}' if descriptor.imageResolution else '?'
+		lblCompact = QLabel(f'{descriptor.dirPath.name}  <i>{resStr}</i>', parent)
+		lblCompact.setStyleSheet(f"background-color: {self.themeData['secondaryDarkColor']}; padding: 3px;")
+		return lblCompact
 	
 	def _createDescWidget(self, desc: ExampleDescriptorImages, parent: QWidget):
 		descWidget = QWidget(parent)
@@ -152,7 +161,8 @@ class ExampleTileBuilderImages(BaseTileBuilder, ExampleContextMenuBase):
 		descLayout.addWidget(lblName)
 		if pxmImage:
 			lblImage = QLabel(parent)
-			lblImage.setPixmap(pxmImage.scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+			tileSize: int = self.settings.GetSetting('tile_size')  # the tiles are rebuilt when it changes (see SETTINGS_ENTRIES)
+			lblImage.setPixmap(pxmImage.scaled(tileSize, tileSize, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
 			lblImage.setAlignment(Qt.AlignmentFlag.AlignCenter)
 			descLayout.addWidget(lblImage)
 		else:
@@ -192,11 +202,6 @@ class ExampleTileBuilderImages(BaseTileBuilder, ExampleContextMenuBase):
 
 		return animBorderWidget
 
-	def _onSettingsChanged(self, settingName: str, newValue: Any):
-		# if settingName == 'tile_size':
-		# 	self.updateTileRequired.emit()
-		pass
-
 class ExampleTableBuilderImages(BaseTableBuilder):
 	def GetName(self) -> str:
 		return '(Example) Table Images'
@@ -216,6 +221,9 @@ class ExampleSettingsImages(SoftwareBaseSettings):
 	CONTAINER_DEFAULTS: dict[str, Any] = {
 		'tile_size': 50,  # default tile size in pixels
 	}
+	SETTINGS_ENTRIES: dict[str, BaseSettingsEntry] = {
+		'tile_size': BaseSettingsEntry(50, 'Tile Size (px)', 'Adjust the size of the image tiles in pixels', isTileUpdateRequired=True),
+	}
 
 	def CreateWidgets(self, parent: QWidget) -> list[tuple[str, QWidget | None]]:
 		commonSettingsWidgets: list[tuple[str, QWidget]] = super().CreateWidgets(parent)
@@ -244,7 +252,7 @@ class ExampleSettingsImages(SoftwareBaseSettings):
 		def tileSizeSliderUpdated(newValue: int):
 			self.SetSetting('tile_size', newValue)
 			self.tileSizeLabel.setText(f'Tile Size (px): {newValue}')
-		tileSizeSliderUpdated(tileSize)
+		self.tileSizeLabel.setText(f'Tile Size (px): {tileSize}')
 
 		tileSizeSlider = QSlider(Qt.Orientation.Horizontal, settingsWidget)
 		tileSizeSlider.setMinimum(20)
@@ -30,6 +30,10 @@ class SimpleDescriptor(BaseDescriptor):
 		self.filesCount: int = len(list(self.dirPath.glob('*.*')))
 		self.foldersCount: int = len(list(self.dirPath.glob('*/')))
 
+	def GetFingerprint(self) -> str:
+		# The counts are read from the disk rather than from the identification files: a rescan should see them change
+		return f'{super().GetFingerprint()}|{self.filesCount}|{self.foldersCount}'
+
 class ContextBase(object):
 	def _getContextMenu(self, desc: BaseDescriptor) -> QMenu | None:
 		menu = QMenu()
@@ -71,6 +75,13 @@ class SimpleTileBuilder(BaseTileBuilder, ContextBase):
 	
 	def GetContextMenu(self, desc: BaseDescriptor) -> Optional[QMenu]:
 		return self._getContextMenu(desc)
+
+	def GetTilePixmapCacheKey(self, desc: BaseDescriptor) -> str | None:
+		# The default tile only shows the descriptor's path, so it's static and can be rendered once to a pixmap
+		return ''
+
+	def IsTilePixmapDiskCacheEnabled(self) -> bool:
+		return True
 	
 class SimpleSettings(SoftwareBaseSettings):
 	def GetSettingsVersion(self) -> int:
@@ -7,6 +7,7 @@ logger = logs.logger
 
 from qavm.qavm_version import LoadVersionInfo, GetBuildVersion, GetQAVMVersion, GetPackageVersion, GetQAVMVariant
 from qavm.qavm_app import QAVMApp
+from qavm.manager_descriptor_data import DescriptorDataManager, DescriptorDataCompactionReport
 import qavm.qavmapi.utils as utils
 from qavm.qavmapi.gui import GetThemeName, SetTheme
 
@@ -32,6 +33,10 @@ def ParseArgs() -> argparse.Namespace:
 	parser.add_argument('--ignoreBuiltinPlugins', action='store_true', help='Ignore (i.e. don\'t load) the built-in plugins (Default: False)')
 	# TODO: remove this from release, this is a backdoor!
 	parser.add_argument('--ignoreCustomPluginsSetting', action='store_true', help='Ignore the custom plugins setting and always allow custom plugins to be loaded (Default: False)')
+	parser.add_argument('--compactDescriptorData', action='store_true', help='Report and prune orphaned descriptor data without starting the GUI, then exit (Default: False)')
+	parser.add_argument('--compactDryRun', action='store_true', help='Only report what --compactDescriptorData would prune (Default: False)')
+	parser.add_argument('--compactRetentionDays', type=float, help=f'Days a descriptor may be absent from scans before its data is pruned (Default: {DescriptorDataManager.ORPHAN_RETENTION_DAYS:g})', default=DescriptorDataManager.ORPHAN_RETENTION_DAYS)
+	parser.add_argument('--compactPruneUnknownRoots', action='store_true', help='Also prune absent entries that were never seen in a scan, e.g. data from older versions (Default: False)')
 	
 	args = parser.parse_args()
 	
@@ -43,6 +48,16 @@ def ParseArgs() -> argparse.Namespace:
 
 	return args
 
+def CompactDescriptorData(args: argparse.Namespace) -> None:
+	""" Headless descriptor data compaction (--compactDescriptorData). """
+	descDataManager: DescriptorDataManager = DescriptorDataManager(utils.GetQAVMDescriptorDataFilepath())
+	descDataManager.LoadData()
+	report: DescriptorDataCompactionReport = descDataManager.CompactData(args.compactRetentionDays, not args.compactDryRun, args.compactPruneUnknownRoots)
+	for title, entries in [('Orphaned', report.orphanedEntries), ('Empty', report.emptyEntries), ('Unknown root', report.unknownRootEntries)]:
+		for shardKey, descUID, descPath in entries:
+			print(f'{title}: [{shardKey or "legacy"}] {descUID} {descPath or ""}')
+	print(report.GetSummary())
+
 def main():
 	LoadVersionInfo(utils.GetQAVMRootPath())
 	print(f'QAVM Version: {GetQAVMVersion()}')
@@ -55,6 +70,10 @@ def main():
 	
 	args = ParseArgs()
 
+	if args.compactDescriptorData:
+		CompactDescriptorData(args)
+		return
+
 	# profiler = cProfile.Profile()
 	# profiler.enable()
 
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+from qavm.qavmapi import BaseDescriptor, AsyncValue
+
+import qavm.logs as logs
+logger = logs.logger
+
+class AsyncValuesLoader(QObject):
+	""" Computes the AsyncValues returned by builders on a pool of worker threads and caches their results per
+	descriptor. Views call Resolve whenever a builder returns an AsyncValue: the cached result is served right away,
+	otherwise the getter is started (once, however often the value is requested meanwhile) and the view shows the
+	placeholder until asyncValuesReady lists the descriptor; the view then asks the builder again. Results are
+	delivered on the GUI thread, in one batch per event loop tick. """
+	MAX_WORKERS: int = 4
+	MAX_CACHED_RESULTS: int = 20000
+	asyncValuesReady = pyqtSignal(object)  # (set[str]) UIDs of the descriptors whose async values got computed
+	_resultComputed = pyqtSignal()  # emitted from the worker threads
+
+	def __init__(self, parent: QObject | None = None):
+		super().__init__(parent)
+		self._executor: ThreadPoolExecutor | None = None
+		self._futures: dict[tuple[str, str, str], Future] = dict()  # (descUID, fingerprint, key) -> running getter
+		self._results: OrderedDict[tuple[str, str, str], tuple[bool, Any]] = OrderedDict()  # same key -> (succeeded, result)
+		self._resultComputed.connect(self._deliverResults, Qt.ConnectionType.QueuedConnection)
+
+	def Resolve(self, desc: BaseDescriptor, asyncValue: AsyncValue) -> tuple[bool, Any]:
+		""" Returns (True, final value) if the result is cached, otherwise starts computing it and returns (False, placeholder). """
+		key: tuple[str, str, str] = (desc.GetUID(), desc.GetFingerprint(), asyncValue.key)
+		if (entry := self._results.get(key)) is not None:
+			self._results.move_to_end(key)
+			succeeded, result = entry
+			return True, asyncValue.GetValue(result) if succeeded else asyncValue.placeholder
+		if key not in self._futures:
+			if self._executor is None:
+				self._executor = ThreadPoolExecutor(self.MAX_WORKERS, thread_name_prefix='qavm-async')
+			future: Future = self._executor.submit(asyncValue.getter)
+			future.add_done_callback(lambda _: self._resultComputed.emit())
+			self._futures[key] = future
+		return False, asyncValue.placeholder
+
+	def Flush(self, timeout: float | None = None):
+		""" Waits for the running getters (at most timeout seconds) and delivers their results right away. """
+		wait(list(self._futures.values()), timeout)
+		self._deliverResults()
+
+	def Clear(self):
+		self._results.clear()
+
+	def Shutdown(self):
+		""" Drops the getters that haven't started yet, the running ones are not waited for. """
+		if self._executor is not None:
+			self._executor.shutdown(wait=False, cancel_futures=True)
+			self._executor = None
+		self._futures.clear()
+
+	def _deliverResults(self):
+		descUIDs: set[str] = set()
+		for key, future in [(key, future) for key, future in self._futures.items() if future.done()]:
+			del self._futures[key]
+			if future.cancelled():
+				continue
+			if (e := future.exception()) is not None:
+				logger.warning(f'Failed to compute async value {key[2]!r} of {key[0]}: {e}')
+				self._results[key] = (False, None)
+			else:
+				self._results[key] = (True, future.result())
+			descUIDs.add(key[0])
+		while len(self._results) > self.MAX_CACHED_RESULTS:
+			self._results.popitem(last=False)
+		if descUIDs:
+			self.asyncValuesReady.emit(descUIDs)
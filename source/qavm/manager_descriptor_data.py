@@ -1,19 +1,28 @@
-import json
+import json, sys, time, hashlib
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 from PyQt6.QtWidgets import (
 	QApplication,
 )
 
 from qavm.qavmapi import BaseDescriptor, BaseDescriptorData, BaseTag, DescriptonrDataAccessor
+from qavm.qavmapi.descriptor_signals import DescriptorSignalsHub, GetDescriptorSignalsHub
+
+import qavm.logs as logs
+logger = logs.logger
 
 if TYPE_CHECKING:
 	from qavm.manager_tags import TagsManager, BaseTagImpl
 
 class DescriptorDataImpl(BaseDescriptorData):
+	# There is one record per descriptor ever seen, so they are kept compact: no per-instance __dict__, tag UIDs are
+	# interned (the same few tags are assigned to thousands of descriptors) and stored as an immutable tuple, so that
+	# the empty tuple and the empty string are shared by all records that have no tags/notes.
+	__slots__ = ('tags', 'noteSmall', 'noteDetail')
+
 	def __init__(self) -> None:
-		self.tags: list[str] = []  # List of tag UIDs
+		self.tags: tuple[str, ...] = ()  # Tag UIDs, use SetTagUIDs/AddTagUID/RemoveTagUID to modify
 		self.noteSmall: str = ''  # A small note (purpose: to be visible on the descriptor tile)
 		self.noteDetail: str = ''  # The full note text, which can be edited in the note editor dialog
 		
@@ -23,17 +32,41 @@ class DescriptorDataImpl(BaseDescriptorData):
 		return [tag for tag in tags if tag]  # Filter out None values in case of missing tags
 	
 	def GetTagsScoped(self, pluginID: str, softwareID: str, viewUID: str) -> list[BaseTag]:
-		return [tag for tag in self.GetTags() if tag and tag.IsApplicableInContext(pluginID, softwareID, viewUID)]
+		tagsManager: TagsManager = QApplication.instance().GetTagsManager()
+		applicableUIDs: set[str] = tagsManager.GetApplicableTagUIDs(pluginID, softwareID, viewUID)
+		tags: list[BaseTag | None] = [tagsManager.GetTag(tagUID) for tagUID in self.tags if tagUID in applicableUIDs]
+		return [tag for tag in tags if tag]
 		
 	def GetNoteSmall(self) -> str:
 		return self.noteSmall
 	def GetNoteDetail(self) -> str:
 		return self.noteDetail
 	
+	def SetTagUIDs(self, tagUIDs: Iterable[str]) -> None:
+		self.tags = tuple(sys.intern(tagUID) for tagUID in tagUIDs)
+
+	def AddTagUID(self, tagUID: str) -> None:
+		if tagUID not in self.tags:
+			self.tags = self.tags + (sys.intern(tagUID),)
+
+	def RemoveTagUID(self, tagUID: str) -> None:
+		if tagUID in self.tags:
+			self.tags = tuple(uid for uid in self.tags if uid != tagUID)
+
+	def GetVersion(self) -> str:
+		""" Digest of the data and of the assigned tags' names and colors; stable across sessions. """
+		tagsState: list[tuple[str, str, str]] = [(tag.GetUID(), tag.GetName(), tag.GetColor()) for tag in self.GetTags()] if self.tags else []
+		state: str = json.dumps([self.tags, self.noteSmall, self.noteDetail, tagsState])
+		return hashlib.blake2b(state.encode('utf-8'), digest_size=8).hexdigest()
+
+	def IsEmpty(self) -> bool:
+		""" Returns True if there is nothing worth storing, i.e. the data is the same as a freshly created one. """
+		return not self.tags and not self.noteSmall and not self.noteDetail
+	
 	def Serialize(self) -> dict[str, Any]:
 		""" Serializes the descriptor data to a dictionary. """
 		return {
-			'tags': self.tags,
+			'tags': list(self.tags),
 			'noteSmall': self.noteSmall,
 			'noteDetail': self.noteDetail
 		}
@@ -48,15 +81,17 @@ class DescriptorDataImpl(BaseDescriptorData):
 		if 'tags' in data:
 			if not isinstance(data['tags'], list):
 				raise TypeError(f'Expected list for tags, got {type(data["tags"])}')
-			descData.tags = data['tags']
+			if not all(isinstance(tagUID, str) for tagUID in data['tags']):
+				raise TypeError(f'Expected list of str for tags, got {data["tags"]}')
+			descData.SetTagUIDs(data['tags'])
 		if 'noteSmall' in data:
 			if not isinstance(data['noteSmall'], str):
 				raise TypeError(f'Expected str for noteSmall, got {type(data["noteSmall"])}')
-			descData.noteSmall = data['noteSmall']
+			descData.noteSmall = data['noteSmall'] or ''  # keep the shared empty string
 		if 'noteDetail' in data:
 			if not isinstance(data['noteDetail'], str):
 				raise TypeError(f'Expected str for noteDetail, got {type(data["noteDetail"])}')
-			descData.noteDetail = data['noteDetail']
+			descData.noteDetail = data['noteDetail'] or ''
 		return descData
 
 class DescriptonrDataAccessorImpl(DescriptonrDataAccessor):
@@ -66,39 +101,209 @@ class DescriptonrDataAccessorImpl(DescriptonrDataAccessor):
 	def GetDescriptorData(self, desc: BaseDescriptor) -> DescriptorDataImpl:
 		return self.descDataManager.GetDescriptorData(desc)
 
+class DescriptorDataCompactionReport(object):
+	""" Result of DescriptorDataManager.CompactData(). Entries are (shardKey, descriptor UID, last known path or None) tuples. """
+	def __init__(self, retentionDays: float, pruned: bool) -> None:
+		self.retentionDays: float = retentionDays
+		self.pruned: bool = pruned  # False for a dry run
+		self.emptyEntries: list[tuple[str, str, str | None]] = []  # hold no data at all, removed regardless of the retention
+		self.orphanedEntries: list[tuple[str, str, str | None]] = []  # absent from scans for longer than the retention window
+		self.unreachableRootEntries: list[tuple[str, str, str | None]] = []  # absent, but their search root was unreachable or not scanned, always kept
+		self.unknownRootEntries: list[tuple[str, str, str | None]] = []  # absent for too long, but were never seen in a scan (e.g. legacy data)
+		self.keptCount: int = 0
+
+	def GetSummary(self) -> str:
+		action: str = 'Pruned' if self.pruned else 'Would prune'
+		return '\n'.join([
+			f'{action} {len(self.orphanedEntries)} orphaned entries (absent for more than {self.retentionDays:g} days) and {len(self.emptyEntries)} empty entries.',
+			f'Kept {len(self.unreachableRootEntries)} absent entries under unreachable or unscanned search roots.',
+			f'Kept {len(self.unknownRootEntries)} absent entries with unknown search roots.',
+			f'Kept {self.keptCount} entries in total.',
+		])
+
 class DescriptorDataManager(object):
+	"""
+	Descriptor data is sharded per software handler: every 'plugin.id#software.id' gets its own json file in the
+	shards folder (next to the legacy descdata.json), which is only parsed once that handler's descriptors are
+	scanned, and dropped again after it hasn't been used for SHARD_IDLE_TIMEOUT seconds. Descriptors that aren't
+	registered with any handler (and data from before sharding) live in the legacy shard, from which entries are
+	migrated to the handler's shard whenever a matching descriptor is registered (e.g. also once an offline search
+	root comes back). The UIDs of the legacy shard are remembered when it is unloaded, so later scans only parse it
+	again if they actually find descriptors to migrate.
+
+	For every shard a scan record (in the scans subfolder) keeps when and under which search root each entry was last
+	seen, and which search roots were unreachable during the last scan. CompactData() uses it to prune entries of
+	descriptors that were deleted or moved away.
+	"""
+	LEGACY_SHARD_KEY: str = ''
+	SHARD_IDLE_TIMEOUT: float = 600.0  # seconds
+	ORPHAN_RETENTION_DAYS: float = 30.0  # how long an entry may be absent from scans before CompactData() prunes it
+
 	def __init__(self, dataFilepath: Path) -> None:
 		self.dataFilepath: Path = dataFilepath
-		self.data: dict[str, DescriptorDataImpl] = {}  # UID -> DescriptorDataImpl
+		self.shardsFolderPath: Path = dataFilepath.parent / dataFilepath.stem  # e.g. .../qavm/descdata/
+		self.scansFolderPath: Path = self.shardsFolderPath / 'scans'
+		self.shards: dict[str, dict[str, DescriptorDataImpl]] = dict()  # shardKey -> {UID -> DescriptorDataImpl}, only loaded shards
+		self.shardsLastUsed: dict[str, float] = dict()  # shardKey -> time.monotonic() of the last access
+		self.descShardKeys: dict[str, str] = dict()  # descriptor UID -> shardKey
+		self.legacyUIDs: set[str] | None = None  # UIDs of the legacy shard when it's not loaded, None if unknown yet
 		self.descDataAccessor: DescriptonrDataAccessorImpl = DescriptonrDataAccessorImpl(self)
 
 	def GetDescriptorDataAccessor(self) -> DescriptonrDataAccessorImpl:
 		return self.descDataAccessor
 	
+	@staticmethod
+	def GetShardKey(pluginID: str, softwareID: str) -> str:
+		return f'{pluginID}#{softwareID}'
+	
 	def GetDescriptorData(self, desc: BaseDescriptor) -> DescriptorDataImpl:
 		descUID: str = desc.GetUID()
-		if descUID not in self.data:
-			self.data[descUID] = DescriptorDataImpl()
-		return self.data[descUID]
+		shard: dict[str, DescriptorDataImpl] = self._getShard(self.descShardKeys.get(descUID, self.LEGACY_SHARD_KEY))
+		descData: DescriptorDataImpl | None = shard.get(descUID, None)
+		if descData is None:
+			descData = shard[descUID] = DescriptorDataImpl()
+		return descData
 	
 	def SetDescriptorData(self, desc: BaseDescriptor, data: DescriptorDataImpl) -> None:
 		if not isinstance(data, DescriptorDataImpl):
 			raise TypeError(f'Expected DescriptorDataImpl, got {type(data)}')
 		descUID: str = desc.GetUID()
-		self.data[descUID] = data
+		self._getShard(self.descShardKeys.get(descUID, self.LEGACY_SHARD_KEY))[descUID] = data
+
+	def RegisterDescriptors(self, pluginID: str, softwareID: str, descs: Iterable[BaseDescriptor], searchRoots: Iterable[Path] = ()) -> None:
+		""" Binds the descriptors to the shard of the given software handler, loading it if needed, and records them
+		as seen under searchRoots. Called when the handler's descriptors are scanned. """
+		shardKey: str = self.GetShardKey(pluginID, softwareID)
+		shard: dict[str, DescriptorDataImpl] = self._getShard(shardKey)
+		descsList: list[BaseDescriptor] = list(descs)
+		searchRootsList: list[Path] = list(searchRoots)
+		now: float = time.time()
+		scan: dict[str, Any] = self._loadShardScan(shardKey)
+		legacyShard: dict[str, DescriptorDataImpl] = dict()
+		legacyUIDs: Iterable[str] = self._getLegacyUIDs()
+		if any(desc.GetUID() in legacyUIDs for desc in descsList):
+			legacyShard = self._getShard(self.LEGACY_SHARD_KEY)
+		scan['time'] = now
+		scan['unreachableRoots'] = [str(root) for root in searchRootsList if not root.is_dir()]
+		scannedRoots: set[str] = {str(root) for root in searchRootsList}
+		scanEntries: dict[str, dict[str, Any]] = scan.setdefault('entries', dict())
+		migrated: bool = False
+		for desc in descsList:
+			descUID: str = desc.GetUID()
+			self.descShardKeys[descUID] = shardKey
+			if descUID in legacyShard and descUID not in shard:
+				shard[descUID] = legacyShard.pop(descUID)
+				migrated = True
+			descPath: Path | None = getattr(desc, 'dirPath', None)
+			descRoot: Path | None = next((root for root in searchRootsList if descPath and descPath.is_relative_to(root)), None)
+			if descPath and descRoot is None:
+				descRoot = descPath.parent  # e.g. search paths were altered by the qualifier
+			if descRoot:
+				scannedRoots.add(str(descRoot))
+			scanEntries[descUID] = {
+				'path': str(descPath) if descPath else None,
+				'root': str(descRoot) if descRoot else None,
+				'lastSeen': now,
+			}
+		scan['scannedRoots'] = sorted(scannedRoots)
+		if migrated:
+			self._saveShard(shardKey)
+			self._saveShard(self.LEGACY_SHARD_KEY)
+		self._saveShardScan(shardKey, scan)
+
+	def UnloadIdleShards(self, keepShardKeys: Iterable[str] = ()) -> None:
+		""" Saves and drops loaded shards that haven't been accessed for SHARD_IDLE_TIMEOUT seconds, except for keepShardKeys. """
+		keepShardKeysSet: set[str] = set(keepShardKeys)
+		now: float = time.monotonic()
+		for shardKey in list(self.shards.keys()):
+			if shardKey in keepShardKeysSet:
+				continue
+			if now - self.shardsLastUsed.get(shardKey, 0.0) < self.SHARD_IDLE_TIMEOUT:
+				continue
+			self._saveShard(shardKey)
+			self._dropShard(shardKey)
+			logger.info(f'Unloaded idle descriptor data shard: {shardKey or "<legacy>"}')
+
+	def GetLoadedShardKeys(self) -> list[str]:
+		return list(self.shards.keys())
+
+	def IterDescriptorData(self, loadAll: bool = False) -> Iterator[tuple[str, DescriptorDataImpl]]:
+		""" Yields (UID, DescriptorDataImpl) pairs of the loaded shards, or of all shards on disk if loadAll is set. """
+		if loadAll:
+			for shardKey in self._getShardKeysOnDisk():
+				self._getShard(shardKey)
+		for shard in list(self.shards.values()):
+			yield from shard.items()
+
+	def CompactData(self, retentionDays: float | None = None, prune: bool = True, pruneUnknownRoots: bool = False) -> DescriptorDataCompactionReport:
+		"""
+		Cross-checks all stored entries (of every shard on disk) against the scan records and removes the ones that
+		hold no data or whose descriptor hasn't been seen by a scan for more than retentionDays. Entries under search
+		roots that were unreachable during the last scan, weren't scanned at all or are unreachable now are never removed, neither are
+		entries that were never seen in a scan (e.g. legacy data) unless pruneUnknownRoots is set. With prune=False
+		only the report is produced and nothing is written to disk.
+		"""
+		if retentionDays is None:
+			retentionDays = self.ORPHAN_RETENTION_DAYS
+		report: DescriptorDataCompactionReport = DescriptorDataCompactionReport(retentionDays, prune)
+		now: float = time.time()
+		loadedShardKeys: set[str] = set(self.shards.keys())
+		for shardKey in self._getShardKeysOnDisk():
+			shard: dict[str, DescriptorDataImpl] = self._getShard(shardKey)
+			scan: dict[str, Any] = self._loadShardScan(shardKey)
+			unreachableRoots: set[str] = set(scan.get('unreachableRoots', []))
+			scannedRoots: set[str] = set(scan.get('scannedRoots', []))
+			lastScanTime: float = scan.get('time', now)
+			scanEntries: dict[str, dict[str, Any]] = scan.setdefault('entries', dict())
+			removedUIDs: list[str] = []
+			for descUID, descData in shard.items():
+				if self.descShardKeys.get(descUID, None) == shardKey:
+					report.keptCount += 1  # registered (i.e. scanned) during this session
+					continue
+				scanEntry: dict[str, Any] | None = scanEntries.get(descUID, None)
+				if scanEntry is None:
+					# Never seen in a scan since tracking started, so the retention window starts now (recorded only when pruning)
+					scanEntry = {'path': None, 'root': None, 'lastSeen': now}
+					if prune:
+						scanEntries[descUID] = scanEntry
+				entryInfo: tuple[str, str, str | None] = (shardKey, descUID, scanEntry.get('path', None))
+				if descData.IsEmpty():
+					report.emptyEntries.append(entryInfo)
+					removedUIDs.append(descUID)
+					continue
+				lastSeen: float = scanEntry.get('lastSeen', now)
+				if lastSeen >= lastScanTime or now - lastSeen < retentionDays * 86400:
+					report.keptCount += 1  # present in the last scan, or not absent for long enough
+					continue
+				root: str | None = scanEntry.get('root', None)
+				if root is None:
+					report.unknownRootEntries.append(entryInfo)
+					if not pruneUnknownRoots:
+						report.keptCount += 1
+						continue
+				elif root not in scannedRoots or root in unreachableRoots or not Path(root).is_dir():
+					report.unreachableRootEntries.append(entryInfo)
+					report.keptCount += 1
+					continue
+				report.orphanedEntries.append(entryInfo)
+				removedUIDs.append(descUID)
+			if prune:
+				for descUID in removedUIDs:
+					del shard[descUID]
+					scanEntries.pop(descUID, None)
+				if removedUIDs:
+					self._saveShard(shardKey)
+				self._saveShardScan(shardKey, scan)
+			if shardKey not in loadedShardKeys:
+				self._dropShard(shardKey)  # don't keep shards that were only loaded for the compaction
+		logger.info(f'Descriptor data compaction:\n{report.GetSummary()}')
+		return report
 
 	def NotifyDescriptorsDataUpdated(self, descUIDs: 'Iterable[str]') -> None:
-		""" Emits descDataUpdated on every live descriptor whose UID is in descUIDs, so all subscribed views re-render. """
-		descUIDsSet: set[str] = set(descUIDs)
-		if not descUIDsSet:
-			return
-		app = QApplication.instance()
-		getAllDescriptors = getattr(app, 'GetAllSoftwareDescriptors', None)
-		if getAllDescriptors is None:
-			return
-		for desc in getAllDescriptors():
-			if desc.GetUID() in descUIDsSet:
-				desc.descDataUpdated.emit()
+		""" Emits descDataUpdated of the descriptors with the given UIDs, so all subscribed views re-render. """
+		descSignalsHub: DescriptorSignalsHub = GetDescriptorSignalsHub()
+		for descUID in set(descUIDs):
+			descSignalsHub.Emit('descDataUpdated', descUID)
 
 	def NotifyAllDescriptorsDataUpdated(self) -> None:
 		""" Emits descDataUpdated on every live descriptor, so all subscribed views re-render. """
@@ -110,26 +315,96 @@ class DescriptorDataManager(object):
 			desc.descDataUpdated.emit()
 
 	def LoadData(self) -> None:
+		""" Resets the store. Shards themselves are loaded lazily, when first accessed. """
+		self.shards = dict()
+		self.shardsLastUsed = dict()
+		self.descShardKeys = dict()
+		self.legacyUIDs = None
 		if not self.dataFilepath.exists():
-			self.SaveData()  # Create the file if it doesn't exist
-			return
-		try:
-			self.data = self.DeserializeData(json.loads(self.dataFilepath.read_text(encoding='utf-8')))
-		except json.JSONDecodeError as e:
-			raise RuntimeError(f'Failed to load descriptor data from {self.dataFilepath}: {e}') from e
+			self._saveShard(self.LEGACY_SHARD_KEY)  # Create the file if it doesn't exist
 		
 	def SaveData(self) -> None:
-		try:
-			self.dataFilepath.write_text(json.dumps(self.SerializeData(), indent=4), encoding='utf-8')
-		except Exception as e:
-			raise RuntimeError(f'Failed to save descriptor data to {self.dataFilepath}: {e}') from e
+		""" Saves all loaded shards. """
+		for shardKey in self.shards.keys():
+			self._saveShard(shardKey)
 		
-	def SerializeData(self) -> dict[str, Any]:
+	def SerializeData(self, data: dict[str, DescriptorDataImpl]) -> dict[str, Any]:
 		""" Serializes the descriptor data to a dictionary. """
-		return {descUID: dd.Serialize() for descUID, dd in self.data.items()}
+		return {descUID: dd.Serialize() for descUID, dd in data.items()}
 	
 	def DeserializeData(self, data: dict[str, Any]) -> dict[str, DescriptorDataImpl]:
 		""" Deserializes the descriptor data from a dictionary. """
 		if not isinstance(data, dict):
 			raise TypeError(f'Expected dict, got {type(data)}')
-		return {descUID: DescriptorDataImpl.Deserialize(dd) for descUID, dd in data.items()}
\ No newline at end of file
+		return {descUID: DescriptorDataImpl.Deserialize(dd) for descUID, dd in data.items()}
+	
+	def _getShard(self, shardKey: str) -> dict[str, DescriptorDataImpl]:
+		self.shardsLastUsed[shardKey] = time.monotonic()
+		shard: dict[str, DescriptorDataImpl] | None = self.shards.get(shardKey, None)
+		if shard is None:
+			shard = self.shards[shardKey] = self._loadShard(shardKey)
+		return shard
+
+	def _dropShard(self, shardKey: str) -> None:
+		shard: dict[str, DescriptorDataImpl] = self.shards.pop(shardKey)
+		self.shardsLastUsed.pop(shardKey, None)
+		if shardKey == self.LEGACY_SHARD_KEY:
+			self.legacyUIDs = set(shard.keys())
+
+	def _getLegacyUIDs(self) -> Iterable[str]:
+		""" Returns the UIDs in the legacy shard, parsing it only if it was never loaded before. """
+		if (legacyShard := self.shards.get(self.LEGACY_SHARD_KEY, None)) is not None:
+			return legacyShard.keys()
+		if self.legacyUIDs is not None:
+			return self.legacyUIDs
+		return self._getShard(self.LEGACY_SHARD_KEY).keys()
+
+	def _getShardFilepath(self, shardKey: str) -> Path:
+		if shardKey == self.LEGACY_SHARD_KEY:
+			return self.dataFilepath
+		return self.shardsFolderPath / f'{shardKey}.json'
+	
+	def _getShardKeysOnDisk(self) -> list[str]:
+		shardKeys: list[str] = [self.LEGACY_SHARD_KEY]
+		if self.shardsFolderPath.is_dir():
+			shardKeys.extend(p.stem for p in self.shardsFolderPath.glob('*.json'))
+		return shardKeys
+
+	def _getShardScanFilepath(self, shardKey: str) -> Path:
+		return self.scansFolderPath / f'{shardKey or "legacy"}.json'
+
+	def _loadShardScan(self, shardKey: str) -> dict[str, Any]:
+		scanFilepath: Path = self._getShardScanFilepath(shardKey)
+		if not scanFilepath.exists():
+			return dict()
+		try:
+			scan: Any = json.loads(scanFilepath.read_text(encoding='utf-8'))
+		except json.JSONDecodeError as e:
+			logger.error(f'Failed to load descriptor data scan record from {scanFilepath}: {e}')
+			return dict()
+		return scan if isinstance(scan, dict) else dict()
+
+	def _saveShardScan(self, shardKey: str, scan: dict[str, Any]) -> None:
+		scanFilepath: Path = self._getShardScanFilepath(shardKey)
+		try:
+			scanFilepath.parent.mkdir(parents=True, exist_ok=True)
+			scanFilepath.write_text(json.dumps(scan), encoding='utf-8')
+		except Exception as e:
+			raise RuntimeError(f'Failed to save descriptor data scan record to {scanFilepath}: {e}') from e
+
+	def _loadShard(self, shardKey: str) -> dict[str, DescriptorDataImpl]:
+		shardFilepath: Path = self._getShardFilepath(shardKey)
+		if not shardFilepath.exists():
+			return dict()
+		try:
+			return self.DeserializeData(json.loads(shardFilepath.read_text(encoding='utf-8')))
+		except json.JSONDecodeError as e:
+			raise RuntimeError(f'Failed to load descriptor data from {shardFilepath}: {e}') from e
+
+	def _saveShard(self, shardKey: str) -> None:
+		shardFilepath: Path = self._getShardFilepath(shardKey)
+		try:
+			shardFilepath.parent.mkdir(parents=True, exist_ok=True)
+			shardFilepath.write_text(json.dumps(self.SerializeData(self.shards.get(shardKey, dict())), indent=4), encoding='utf-8')
+		except Exception as e:
+			raise RuntimeError(f'Failed to save descriptor data to {shardFilepath}: {e}') from e
@@ -0,0 +1,42 @@
+from typing import Iterable
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from qavm.qavmapi.descriptor_signals import GetDescriptorSignalsHub
+
+import qavm.logs as logs
+logger = logs.logger
+
+class DescriptorUpdateBus(QObject):
+	""" Central channel for descriptor data updates. Rather than every view subscribing to the descDataUpdated signal of
+	every descriptor it shows and re-rendering on each emit, the bus listens to the signal of all descriptors (see
+	DescriptorSignalsHub): it collects the UIDs of the updated ones and delivers them, deduplicated, as one
+	descriptorsUpdated batch on the next event loop tick. A bulk change (e.g. a tag assigned to hundreds of
+	descriptors) is thus re-rendered by every view in a single pass. """
+	descriptorsUpdated = pyqtSignal(object)  # (set[str]) UIDs of the descriptors updated since the previous batch
+
+	def __init__(self, parent: QObject | None = None):
+		super().__init__(parent)
+		self._pendingDescUIDs: set[str] = set()
+		self._deliveryScheduled: bool = False
+		GetDescriptorSignalsHub().ConnectAll('descDataUpdated', self._onDescDataUpdated)
+
+	def NotifyDescriptorsUpdated(self, descUIDs: Iterable[str]):
+		""" Queues an update of the given descriptors, to be delivered with the next batch. """
+		self._pendingDescUIDs.update(descUIDs)
+		if self._pendingDescUIDs and not self._deliveryScheduled:
+			self._deliveryScheduled = True
+			QTimer.singleShot(0, self._deliverUpdates)
+
+	def Flush(self):
+		""" Delivers the pending updates right away. """
+		self._deliverUpdates()
+
+	def _deliverUpdates(self):
+		self._deliveryScheduled = False
+		descUIDs, self._pendingDescUIDs = self._pendingDescUIDs, set()
+		if descUIDs:
+			self.descriptorsUpdated.emit(descUIDs)
+
+	def _onDescDataUpdated(self, descUID: str):
+		self.NotifyDescriptorsUpdated((descUID,))
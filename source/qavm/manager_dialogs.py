@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 from qavm.window_pluginselect import WorkspaceManagerWindow
 from qavm.window_main import MainWindow
 from qavm.window_settings import PreferencesWindow
@@ -12,20 +14,28 @@ import qavm.logs as logs
 logger = logs.logger
 
 class DialogsManager:
+	# Main windows of the recently shown workspaces are kept (hidden) with all their views built, so switching back to
+	# one of them is instant. The descriptors count of the cached windows stands in for their memory footprint.
+	MAX_CACHED_WORKSPACES: int = 3
+	MAX_CACHED_DESCRIPTORS: int = 20000
+
 	def __init__(self) -> None:
 		self.selectPluginWindow: WorkspaceManagerWindow = None
 		self.mainWindow: MainWindow = None
 		self.windowPrefs: PreferencesWindow = None
+		self.cachedMainWindows: OrderedDict[tuple, MainWindow] = OrderedDict()  # workspace key -> hidden main window, least recently used first
 
 	def ShowWorkspace(self, workspace: QAVMWorkspace):
 		app = QApplication.instance()
 		app.GetSettingsManager().LoadWorkspaceSoftwareSettings(workspace)
 		app.SetWorkspace(workspace)
+		if self.mainWindow is None:
+			self.mainWindow = self._takeCachedMainWindow(workspace)
 		self.GetMainWindow().show()
 
 	def ShowWorkspaceManager(self):
 		self.ResetPreferencesWindow()
-		self.ResetMainWindow()
+		self._cacheMainWindow()
 		self.GetPluginSelectionWindow().show()
 
 	def ShowPreferences(self):
@@ -52,6 +62,36 @@ class DialogsManager:
 		self._resetWindow(self.mainWindow)
 		self.mainWindow = None
 
+	def _cacheMainWindow(self):
+		""" Hides the main window and keeps it for its workspace, evicting the least recently used windows over the limits. """
+		if self.mainWindow is None:
+			return
+		self.mainWindow.close()  # saves the UI state, the window is only hidden
+		self.cachedMainWindows[self._getWorkspaceKey(self.mainWindow.workspace)] = self.mainWindow
+		self.mainWindow = None
+		while self.cachedMainWindows and (len(self.cachedMainWindows) > self.MAX_CACHED_WORKSPACES
+				or sum(window.GetDescriptorsCount() for window in self.cachedMainWindows.values()) > self.MAX_CACHED_DESCRIPTORS):
+			wsKey, window = self.cachedMainWindows.popitem(last=False)
+			logger.info(f'Evicting cached main window of workspace: {wsKey[0]}')
+			self._resetWindow(window)
+
+	def _takeCachedMainWindow(self, workspace: QAVMWorkspace) -> MainWindow | None:
+		window: MainWindow | None = self.cachedMainWindows.pop(self._getWorkspaceKey(workspace), None)
+		if window is None:
+			return None
+		if not window.IsUpToDate():
+			logger.info(f'Cached main window of workspace {workspace.GetID()} is outdated, rebuilding it')
+			self._resetWindow(window)
+			return None
+		window.RestoreUIState()
+		return window
+
+	@staticmethod
+	def _getWorkspaceKey(workspace: QAVMWorkspace) -> tuple:
+		""" Workspaces are told apart by their views too, since ad-hoc workspaces may share (or lack) an ID. """
+		wsData: dict = workspace.Serialize()
+		return (wsData['id'], tuple(wsData['ids']))
+
 	def ResetPreferencesWindow(self):
 		self._resetWindow(self.windowPrefs)
 		self.windowPrefs = None
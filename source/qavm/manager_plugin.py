@@ -1,5 +1,5 @@
 from __future__ import annotations
-import importlib.util, os, re, sys
+import functools, importlib.util, os, re, sys
 from pathlib import Path
 from typing import Type, Optional, Any
 
@@ -27,6 +27,10 @@ class UID:
 	- software.id: e.g. 'software.example1'
 	- data/path: e.g. 'view/tiles/c4d'
 	Supports wildcard matching (* and ?) in the data path.
+
+	UID.Parse() returns an interned, hashable UID object with all parts resolved once, so the static Fetch*/DataPath*
+	helpers (which are called on hot paths with the same few IDs over and over) are plain attribute lookups. A UID
+	object compares and hashes equal to its string, so it can be used interchangeably as a dict key.
 	"""
 
 	DOMAIN_ID_REGEX = r'[a-zA-Z0-9_-]+(?:\.[a-zA-Z0-9_-]+)*'
@@ -40,6 +44,48 @@ class UID:
 
 	WILDCARD_SAFE_CHARS = '[a-zA-Z0-9_\\-/]'
 
+	PARSED_CACHE_SIZE = 8192  # number of interned UID objects kept alive
+	WILDCARD_CACHE_SIZE = 512  # number of compiled wildcard matchers kept alive
+
+	__slots__ = ('uid', 'pluginID', 'softwareID', 'dataPath', 'dataPathParts', 'pluginSoftwareID', 'softwareIDDataPath', 'isWildcard', '_hash')
+
+	def __init__(self, uid: str) -> None:
+		if not isinstance(uid, str):
+			raise TypeError(f'Expected str, got {type(uid)}')
+		self.uid: str = uid
+		self.pluginID: Optional[str] = UID._parsePluginID(uid)
+		self.softwareID: Optional[str] = UID._parseSoftwareID(uid)
+		self.dataPath: Optional[str] = UID._parseDataPath(uid)
+		self.dataPathParts: tuple[str, ...] = tuple(self.dataPath.split('/')) if self.dataPath else tuple()
+		self.pluginSoftwareID: Optional[str] = UID._parsePluginSoftwareID(uid)
+		self.softwareIDDataPath: Optional[str] = UID._parseSoftwareIDDataPath(uid)
+		self.isWildcard: bool = bool(self.dataPath) and ('*' in self.dataPath or '?' in self.dataPath)
+		self._hash: int = hash(uid)
+
+	@staticmethod
+	@functools.lru_cache(maxsize=PARSED_CACHE_SIZE)
+	def Parse(uid: str | UID) -> UID:
+		""" Returns the interned UID object for the given string, e.g. UID.Parse('com.example.plugin#software.example1#view/tiles/c4d').dataPath -> 'view/tiles/c4d' """
+		if isinstance(uid, UID):
+			return uid
+		return UID(uid)
+
+	def __str__(self) -> str:
+		return self.uid
+
+	def __repr__(self) -> str:
+		return f'UID({self.uid!r})'
+
+	def __hash__(self) -> int:
+		return self._hash
+
+	def __eq__(self, other: object) -> bool:
+		if isinstance(other, UID):
+			return self.uid == other.uid
+		if isinstance(other, str):
+			return self.uid == other
+		return NotImplemented
+
 	@staticmethod
 	def _datapath_wildcard_to_regex(pattern: str) -> str:
 		"""Convert pattern with * and ? to regex limited to UID-safe characters + slashes."""		
@@ -53,6 +99,11 @@ class UID:
 				regex += re.escape(char)
 		return f'^{regex}$'
 
+	@staticmethod
+	@functools.lru_cache(maxsize=WILDCARD_CACHE_SIZE)
+	def _compileDataPathWildcard(pattern: str) -> re.Pattern:
+		return re.compile(UID._datapath_wildcard_to_regex(pattern))
+
 	@staticmethod
 	def IsPluginIDValid(plugin_id: str) -> bool:
 		""" Checks if the plugin ID is valid, e.g. 'com.example.plugin' """
@@ -84,8 +135,7 @@ class UID:
 		return UID.SOFTWARE_DATAPATH_PATTERN.fullmatch(uid) is not None
 
 	@staticmethod
-	def FetchPluginID(uid: str) -> Optional[str]:
-		""" Fetches the plugin ID from a UID string, e.g. 'com.example.plugin#software.example1#view/tiles/c4d' -> 'com.example.plugin' """
+	def _parsePluginID(uid: str) -> Optional[str]:
 		parts = uid.split('#')
 		if len(parts) == 3 and UID.IsPluginIDValid(parts[0]):
 			return parts[0]
@@ -99,8 +149,7 @@ class UID:
 		return uid if UID.IsPluginIDValid(uid) else None
 
 	@staticmethod
-	def FetchSoftwareID(uid: str) -> Optional[str]:
-		""" Fetches the software ID from a UID string, e.g. 'com.example.plugin#software.example1#view/tiles/c4d' -> 'software.example1' """
+	def _parseSoftwareID(uid: str) -> Optional[str]:
 		parts = uid.split('#')
 		if len(parts) == 3 and UID.IsSoftwareIDValid(parts[1]):
 			return parts[1]
@@ -113,8 +162,7 @@ class UID:
 		return uid if UID.IsSoftwareIDValid(uid) else None
 
 	@staticmethod
-	def FetchDataPath(uid: str) -> Optional[str]:
-		""" Fetches the data path from a UID string, e.g. 'com.example.plugin#software.example1#view/tiles/c4d' -> 'view/tiles/c4d' """
+	def _parseDataPath(uid: str) -> Optional[str]:
 		parts = uid.split('#')
 		if len(parts) == 3 and UID.IsDataPathValid(parts[2]):
 			return parts[2]
@@ -123,8 +171,7 @@ class UID:
 		return uid if UID.IsDataPathValid(uid) else None
 
 	@staticmethod
-	def FetchPluginSoftwareID(uid: str) -> Optional[str]:
-		""" Fetches the Plugin#Software ID from a UID string, e.g. 'com.example.plugin#software.example1#view/tiles/c4d' -> 'com.example.plugin#software.example1' """
+	def _parsePluginSoftwareID(uid: str) -> Optional[str]:
 		if UID.IsPluginSoftwareIDValid(uid):
 			return uid
 		parts = uid.split('#')
@@ -133,50 +180,65 @@ class UID:
 		return None
 
 	@staticmethod
-	def FetchSoftwareIDDataPath(uid: str) -> Optional[str]:
-		""" Fetches the Software#DataPath ID from a UID string, e.g. 'com.example.plugin#software.example1#view/tiles/c4d' -> 'software.example1#view/tiles/c4d' """
+	def _parseSoftwareIDDataPath(uid: str) -> Optional[str]:
 		if UID.IsSoftwareIDDataPathValid(uid):
 			return uid
 		parts = uid.split('#')
 		if len(parts) == 3:
 			return f"{parts[1]}#{parts[2]}" if UID.IsSoftwareIDValid(parts[1]) and UID.IsDataPathValid(parts[2]) else None
 		return None
+
+	@staticmethod
+	def FetchPluginID(uid: str | UID) -> Optional[str]:
+		""" Fetches the plugin ID from a UID string, e.g. 'com.example.plugin#software.example1#view/tiles/c4d' -> 'com.example.plugin' """
+		return UID.Parse(uid).pluginID
+
+	@staticmethod
+	def FetchSoftwareID(uid: str | UID) -> Optional[str]:
+		""" Fetches the software ID from a UID string, e.g. 'com.example.plugin#software.example1#view/tiles/c4d' -> 'software.example1' """
+		return UID.Parse(uid).softwareID
+
+	@staticmethod
+	def FetchDataPath(uid: str | UID) -> Optional[str]:
+		""" Fetches the data path from a UID string, e.g. 'com.example.plugin#software.example1#view/tiles/c4d' -> 'view/tiles/c4d' """
+		return UID.Parse(uid).dataPath
+
+	@staticmethod
+	def FetchPluginSoftwareID(uid: str | UID) -> Optional[str]:
+		""" Fetches the Plugin#Software ID from a UID string, e.g. 'com.example.plugin#software.example1#view/tiles/c4d' -> 'com.example.plugin#software.example1' """
+		return UID.Parse(uid).pluginSoftwareID
+
+	@staticmethod
+	def FetchSoftwareIDDataPath(uid: str | UID) -> Optional[str]:
+		""" Fetches the Software#DataPath ID from a UID string, e.g. 'com.example.plugin#software.example1#view/tiles/c4d' -> 'software.example1#view/tiles/c4d' """
+		return UID.Parse(uid).softwareIDDataPath
 	
 	@staticmethod
-	def IsDataPathWildcard(dataPath: str) -> bool:
+	def IsDataPathWildcard(dataPath: str | UID) -> bool:
 		""" Checks if the data path contains wildcards (* or ?). """
-		if dPath := UID.FetchDataPath(dataPath):
-			return '*' in dPath or '?' in dPath
-		return False
+		return UID.Parse(dataPath).isWildcard
 
 	@staticmethod
-	def MatchDataPath(pattern: str, path: str) -> bool:
+	def MatchDataPath(pattern: str | UID, path: str | UID) -> bool:
 		"""Checks if a data path matches the wildcard pattern."""
-		regex = re.compile(UID._datapath_wildcard_to_regex(pattern))
-		return regex.fullmatch(path) is not None
+		return UID._compileDataPathWildcard(str(pattern)).fullmatch(str(path)) is not None
 
 	@staticmethod
-	def DataPathGetParts(dataPath: str) -> list[str]:
+	def DataPathGetParts(dataPath: str | UID) -> list[str]:
 		""" Returns the parts of the data path as a list, e.g. 'view/tiles/c4d' -> ['view', 'tiles', 'c4d'] """
-		if dataPathFetched := UID.FetchDataPath(dataPath):
-			return dataPathFetched.split('/')
-		return []
+		return list(UID.Parse(dataPath).dataPathParts)
 
 	@staticmethod
-	def DataPathGetFirstPart(dataPath: str) -> Optional[str]:
+	def DataPathGetFirstPart(dataPath: str | UID) -> Optional[str]:
 		""" Returns the first part of the data path, e.g. 'view/tiles/c4d' -> 'view' """
-		if dataPathFetched := UID.FetchDataPath(dataPath):
-			parts = dataPathFetched.split('/')
-			return parts[0] if parts else None
-		return None
+		parts: tuple[str, ...] = UID.Parse(dataPath).dataPathParts
+		return parts[0] if parts else None
 
 	@staticmethod
-	def DataPathGetLastPart(dataPath: str) -> Optional[str]:
+	def DataPathGetLastPart(dataPath: str | UID) -> Optional[str]:
 		""" Returns the last part of the data path, e.g. 'view/tiles/c4d' -> 'c4d' """
-		if dataPathFetched := UID.FetchDataPath(dataPath):
-			parts = dataPathFetched.split('/')
-			return parts[-1] if parts else None
-		return None
+		parts: tuple[str, ...] = UID.Parse(dataPath).dataPathParts
+		return parts[-1] if parts else None
 
 # TODO: move this to qavmapi and make use of it
 # TODO: use serializable decorator (check experiments/serializable_decorator.py)
@@ -205,13 +267,13 @@ class QAVMWorkspace(SerializableBase):
 				logger.error(f"Invalid workspace item UID: {uid} (should be a string)")
 				continue
 
-			plID: str = UID.FetchPluginID(uid)
-			if not plID:
+			parsedUID: UID = UID.Parse(uid)
+			if not parsedUID.pluginID:
 				logger.error(f"Invalid workspace item UID '{uid}': plugin ID is missing or invalid.")
 				continue
 
-			if dataPath := UID.FetchDataPath(uid):
-				parts: list[str] = UID.DataPathGetParts(dataPath)
+			if parsedUID.dataPath:
+				parts: tuple[str, ...] = parsedUID.dataPathParts
 				if not parts:
 					logger.error(f"Invalid workspace item UID '{uid}': data path is invalid.")
 					continue
@@ -628,11 +690,12 @@ class QAVMPlugin:
 
 	def _expandWildcardUID(self, uid: str) -> list[str]:
 		""" Expands a wildcard UID to a list of valid UIDs. """
-		if not UID.IsDataPathWildcard(uid):
+		parsedUID: UID = UID.Parse(uid)
+		if not parsedUID.isWildcard:
 			return []
 		
 		fullWildcardUid: str = uid
-		plID: str = UID.FetchPluginID(uid)
+		plID: str = parsedUID.pluginID
 		if not plID:
 			plID = self.pluginID  # use current plugin ID if not specified
 			fullWildcardUid = f'{plID}#{uid}'
@@ -0,0 +1,260 @@
+import re
+from typing import Iterable
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from qavm.qavmapi import BaseDescriptor
+from qavm.qavmapi.descriptor_signals import GetDescriptorSignalsHub
+from qavm.manager_descriptor_data import DescriptorDataManager, DescriptorDataImpl
+from qavm.manager_tags import TagsManager, BaseTagImpl
+
+import qavm.logs as logs
+logger = logs.logger
+
+class DescriptorSearchIndex(QObject):
+	""" In-memory index over the loaded descriptors for filtering views: by text (their paths, notes and assigned
+	tag names) and by combinations of assigned tags.
+
+	Each descriptor's text is split into words (runs of word characters). The index maps every word to the
+	descriptors containing it and every trigram to the words containing it, so a search term only scans the
+	few words sharing its trigrams instead of every descriptor text; the candidates are then verified against
+	the whole text. Paths share most of their words, which keeps the word vocabulary (and building the index)
+	small. Terms too short for trigrams are matched against the descriptor texts directly.
+
+	Every tag has a bitset (a Python int) over the descriptor ordinals, so a tag combination ("has A and B but not C")
+	is evaluated by a few big integer operations rather than by going through the tags of every descriptor.
+
+	The index is built on the first search (or Build) and kept up to date incrementally afterwards (descriptors
+	added/removed on scans, descDataUpdated). """
+	WORD_PATTERN: re.Pattern = re.compile(r'\w+')
+	TRIGRAM_LENGTH: int = 3
+	indexChanged = pyqtSignal()  # the text of some descriptors changed, so search results may have changed too
+
+	def __init__(self, descDataManager: DescriptorDataManager, tagsManager: TagsManager, parent: QObject | None = None):
+		super().__init__(parent)
+		self.descDataManager: DescriptorDataManager = descDataManager
+		self.tagsManager: TagsManager = tagsManager
+
+		self._descs: dict[str, BaseDescriptor] = dict()  # descUID -> descriptor
+		self._ordinals: dict[str, int] = dict()  # descUID -> ordinal
+		self._descUIDs: list[str | None] = []  # ordinal -> descUID, None for free ordinals
+		self._texts: list[str] = []  # ordinal -> casefolded searchable text
+		self._descTagUIDs: list[tuple[str, ...]] = []  # ordinal -> assigned tag UIDs
+		self._freeOrdinals: list[int] = []
+		self._wordOrdinals: dict[str, set[int]] | None = None  # word -> ordinals of the texts containing it, None until built
+		self._trigramWords: dict[str, set[str]] = dict()  # trigram -> words containing it
+		self._tagBitsets: dict[str, int] | None = None  # tagUID -> bitset of the ordinals it is assigned to, None until needed
+		self._lastQuery: str = ''
+		self._lastOrdinals: set[int] | None = None  # result of the last query, refined while the query is being typed
+		GetDescriptorSignalsHub().ConnectAll('descDataUpdated', self._onDescDataUpdated)
+
+	def SetDescriptors(self, descs: Iterable[BaseDescriptor]):
+		""" Makes the index cover exactly the given descriptors: the ones no longer present are removed, new ones are
+		added and the ones already indexed are only re-indexed if their text changed (e.g. after a rescan). """
+		descsByUID: dict[str, BaseDescriptor] = {desc.GetUID(): desc for desc in descs}
+		for descUID in [descUID for descUID in self._descs if descUID not in descsByUID]:
+			del self._descs[descUID]
+			self._removeEntry(descUID)
+		for descUID, desc in descsByUID.items():
+			self._descs[descUID] = desc
+			if self.IsBuilt():
+				self._setEntry(descUID, *self._getEntry(desc))
+		self._resetLastQuery()
+		self.indexChanged.emit()
+
+	def UpdateDescriptor(self, desc: BaseDescriptor):
+		""" Re-indexes the text of an indexed descriptor. """
+		descUID: str = desc.GetUID()
+		if descUID not in self._descs or not self.IsBuilt():
+			return
+		if self._setEntry(descUID, *self._getEntry(desc)):
+			self._resetLastQuery()
+			self.indexChanged.emit()
+
+	def GetDescriptorsCount(self) -> int:
+		return len(self._descs)
+
+	def IsBuilt(self) -> bool:
+		return self._wordOrdinals is not None
+
+	def Build(self):
+		""" Collects the texts and tags of all descriptors and indexes their words, unless already done. """
+		if self.IsBuilt():
+			return
+		for descUID, desc in self._descs.items():
+			self._setEntry(descUID, *self._getEntry(desc))
+		self._wordOrdinals = dict()
+		for ordinal, text in enumerate(self._texts):
+			self._indexWords(ordinal, text)
+
+	def Search(self, query: str, requiredTagUIDs: Iterable[str] = (), excludedTagUIDs: Iterable[str] = ()) -> set[str] | None:
+		""" Returns the UIDs of the descriptors whose text contains every whitespace separated term of the query
+		(case-insensitive substring match), that have all the required tags and none of the excluded ones. Returns
+		None if neither the query has terms nor tags are given, i.e. nothing is filtered out. """
+		requiredTagUIDs, excludedTagUIDs = tuple(requiredTagUIDs), tuple(excludedTagUIDs)
+		ordinals: set[int] | None = self._searchText(query)
+		if requiredTagUIDs or excludedTagUIDs:
+			self.Build()
+			tagOrdinals: set[int] = set(self._getBitsetOrdinals(self._evaluateTagBitset(requiredTagUIDs, excludedTagUIDs)))
+			ordinals = tagOrdinals if ordinals is None else ordinals & tagOrdinals
+		if ordinals is None:
+			return None
+		descUIDs: list[str | None] = self._descUIDs
+		return {descUID for ordinal in ordinals if (descUID := descUIDs[ordinal]) is not None}
+
+	def _searchText(self, query: str) -> set[int] | None:
+		query = query.casefold()
+		terms: list[str] = query.split()
+		if not terms:
+			self._resetLastQuery()
+			return None
+		self.Build()
+		ordinals: set[int] | None = None
+		if self._lastOrdinals is not None and self._lastQuery and query.startswith(self._lastQuery):
+			ordinals = self._lastOrdinals  # typing further only narrows the results down
+		for term in sorted(terms, key=len, reverse=True):  # longer terms are more selective
+			if ordinals is None:
+				ordinals = self._lookupTerm(term)
+			else:
+				texts: list[str] = self._texts
+				ordinals = {ordinal for ordinal in ordinals if term in texts[ordinal]}
+			if not ordinals:
+				break
+		self._lastQuery, self._lastOrdinals = query, ordinals
+		return ordinals
+
+	def _evaluateTagBitset(self, requiredTagUIDs: tuple[str, ...], excludedTagUIDs: tuple[str, ...]) -> int:
+		tagBitsets: dict[str, int] = self._getTagBitsets()
+		bitset: int = (1 << len(self._texts)) - 1
+		for tagUID in requiredTagUIDs:
+			bitset &= tagBitsets.get(tagUID, 0)
+		for tagUID in excludedTagUIDs:
+			bitset &= ~tagBitsets.get(tagUID, 0)
+		return bitset  # free ordinals have no tags, they are skipped when mapped to descriptor UIDs
+
+	@staticmethod
+	def _getBitsetOrdinals(bitset: int) -> list[int]:
+		return [ordinal for ordinal, bit in enumerate(bin(bitset)[:1:-1]) if bit == '1']
+
+	def _getTagBitsets(self) -> dict[str, int]:
+		if self._tagBitsets is None:
+			tagOrdinals: dict[str, list[int]] = dict()
+			for ordinal, tagUIDs in enumerate(self._descTagUIDs):
+				for tagUID in tagUIDs:
+					tagOrdinals.setdefault(tagUID, []).append(ordinal)
+			self._tagBitsets = dict()
+			for tagUID, ordinals in tagOrdinals.items():
+				bits: bytearray = bytearray((len(self._texts) + 7) // 8)  # setting bits in place rather than OR-ing ints
+				for ordinal in ordinals:
+					bits[ordinal >> 3] |= 1 << (ordinal & 7)
+				self._tagBitsets[tagUID] = int.from_bytes(bits, 'little')
+		return self._tagBitsets
+
+	def _setTagBits(self, ordinal: int, oldTagUIDs: tuple[str, ...], newTagUIDs: tuple[str, ...]):
+		if self._tagBitsets is None:
+			return
+		bit: int = 1 << ordinal
+		for tagUID in set(oldTagUIDs).difference(newTagUIDs):
+			if tagBitset := self._tagBitsets.get(tagUID, 0) & ~bit:
+				self._tagBitsets[tagUID] = tagBitset
+			else:
+				self._tagBitsets.pop(tagUID, None)
+		for tagUID in set(newTagUIDs).difference(oldTagUIDs):
+			self._tagBitsets[tagUID] = self._tagBitsets.get(tagUID, 0) | bit
+
+	def _lookupTerm(self, term: str) -> set[int]:
+		""" Returns the ordinals of the texts containing the term, looked up by its longest word. """
+		texts: list[str] = self._texts
+		longestWord: str = max(self.WORD_PATTERN.findall(term), key=len, default='')
+		if len(longestWord) < self.TRIGRAM_LENGTH:  # matches too many words to be worth going through them
+			return {ordinal for ordinal, text in enumerate(texts) if term in text}
+		wordOrdinals: dict[str, set[int]] = self._wordOrdinals
+		ordinals: set[int] = set().union(*[wordOrdinals[word] for word in self._findWordsContaining(longestWord)])
+		if term != longestWord:
+			ordinals = {ordinal for ordinal in ordinals if term in texts[ordinal]}
+		return ordinals
+
+	def _findWordsContaining(self, part: str) -> Iterable[str]:
+		trigramWords: list[set[str] | None] = [self._trigramWords.get(trigram) for trigram in self._getTrigrams(part)]
+		if None in trigramWords:
+			return []
+		trigramWords.sort(key=len)
+		words: set[str] = set.intersection(*trigramWords)
+		if len(part) == self.TRIGRAM_LENGTH:
+			return words
+		return [word for word in words if part in word]
+
+	def _getEntry(self, desc: BaseDescriptor) -> tuple[str, tuple[str, ...]]:
+		""" Returns the searchable text and the assigned tag UIDs of a descriptor. """
+		descData: DescriptorDataImpl = self.descDataManager.GetDescriptorData(desc)
+		tags: list[BaseTagImpl | None] = [self.tagsManager.GetTag(tagUID) for tagUID in descData.tags]
+		parts: list[str] = [str(desc.dirPath), descData.noteSmall, descData.noteDetail] + [tag.GetName() for tag in tags if tag]
+		return '\n'.join(parts).casefold(), descData.tags
+
+	def _setEntry(self, descUID: str, text: str, tagUIDs: tuple[str, ...]) -> bool:
+		""" Indexes the text and tags of a descriptor, returns whether they changed. """
+		ordinal: int | None = self._ordinals.get(descUID)
+		if ordinal is None:
+			ordinal = self._freeOrdinals.pop() if self._freeOrdinals else len(self._texts)
+			if ordinal == len(self._texts):
+				self._texts.append('')
+				self._descTagUIDs.append(())
+				self._descUIDs.append(None)
+			self._ordinals[descUID] = ordinal
+			self._descUIDs[ordinal] = descUID
+		elif self._texts[ordinal] == text and self._descTagUIDs[ordinal] == tagUIDs:
+			return False
+		if self.IsBuilt():
+			self._unindexWords(ordinal, self._texts[ordinal])
+			self._indexWords(ordinal, text)
+		self._setTagBits(ordinal, self._descTagUIDs[ordinal], tagUIDs)
+		self._texts[ordinal] = text
+		self._descTagUIDs[ordinal] = tagUIDs
+		return True
+
+	def _removeEntry(self, descUID: str):
+		ordinal: int | None = self._ordinals.pop(descUID, None)
+		if ordinal is None:
+			return
+		if self.IsBuilt():
+			self._unindexWords(ordinal, self._texts[ordinal])
+		self._setTagBits(ordinal, self._descTagUIDs[ordinal], ())
+		self._texts[ordinal] = ''
+		self._descTagUIDs[ordinal] = ()
+		self._descUIDs[ordinal] = None
+		self._freeOrdinals.append(ordinal)
+
+	def _indexWords(self, ordinal: int, text: str):
+		for word in set(self.WORD_PATTERN.findall(text)):
+			if (ordinals := self._wordOrdinals.get(word)) is not None:
+				ordinals.add(ordinal)
+				continue
+			self._wordOrdinals[word] = {ordinal}
+			for trigram in self._getTrigrams(word):
+				self._trigramWords.setdefault(trigram, set()).add(word)
+
+	def _unindexWords(self, ordinal: int, text: str):
+		for word in set(self.WORD_PATTERN.findall(text)):
+			ordinals: set[int] | None = self._wordOrdinals.get(word)
+			if ordinals is None:
+				continue
+			ordinals.discard(ordinal)
+			if ordinals:
+				continue
+			del self._wordOrdinals[word]
+			for trigram in self._getTrigrams(word):
+				if (words := self._trigramWords.get(trigram)) is not None:
+					words.discard(word)
+					if not words:
+						del self._trigramWords[trigram]
+
+	@classmethod
+	def _getTrigrams(cls, word: str) -> set[str]:
+		return {word[i:i + cls.TRIGRAM_LENGTH] for i in range(len(word) - cls.TRIGRAM_LENGTH + 1)}
+
+	def _resetLastQuery(self):
+		self._lastQuery, self._lastOrdinals = '', None
+
+	def _onDescDataUpdated(self, descUID: str):
+		if (desc := self._descs.get(descUID)) is not None:
+			self.UpdateDescriptor(desc)
@@ -164,6 +164,12 @@ class TagsManager(QObject):
 		self.descDataManager: DescriptorDataManager = descDataManager
 
 		self.tags: dict[str, BaseTagImpl] = dict()  # Using a dict for faster lookups by tag uid
+		# (pluginID, softwareID, viewUID) -> UIDs of the tags applicable in that context. Resolving scopes (with
+		# wildcard view matching) is by far the most expensive part of building tag cells/tiles, and the result
+		# only depends on the tags themselves, so it's kept until the tags change. Mutators invalidate it explicitly
+		# too, since callers may emit with tagsChanged blocked (e.g. tag cloning in the palette).
+		self._applicableTagUIDsCache: dict[tuple[str, str, str], set[str]] = dict()
+		self.tagsChanged.connect(self._invalidateApplicableTagsCache)
 
 		# PLUGIN_ID = 'in.wi1k.tools.qavm.plugin.maxon'
 		# # TODO: remove this
@@ -192,6 +198,7 @@ class TagsManager(QObject):
 			data = self.tagsDataFilepath.read_text(encoding='utf-8')
 			tagList = json.loads(data)
 			self.tags = dict()
+			self._invalidateApplicableTagsCache()
 			for tag in tagList:
 				try:
 					t: BaseTagImpl = BaseTagImpl.Deserialize(tag)
@@ -212,6 +219,19 @@ class TagsManager(QObject):
 	def GetTags(self) -> dict[str, BaseTagImpl]:
 		return self.tags
 
+	def GetApplicableTagUIDs(self, pluginID: str, softwareID: str, viewUID: str) -> set[str]:
+		""" Returns the UIDs of all tags applicable in the given plugin/software/view context. The result is cached
+		per context until tagsChanged is emitted, so callers must not modify the returned set. """
+		contextKey: tuple[str, str, str] = (pluginID, softwareID, viewUID)
+		applicableUIDs: set[str] | None = self._applicableTagUIDsCache.get(contextKey, None)
+		if applicableUIDs is None:
+			applicableUIDs = {tagUID for tagUID, tag in self.tags.items() if tag.IsApplicableInContext(pluginID, softwareID, viewUID)}
+			self._applicableTagUIDsCache[contextKey] = applicableUIDs
+		return applicableUIDs
+
+	def _invalidateApplicableTagsCache(self) -> None:
+		self._applicableTagUIDsCache.clear()
+
 	def GetTagsOrdered(self) -> list[BaseTagImpl]:
 		""" Returns the tags sorted by their display order (ascending). """
 		return sorted(self.tags.values(), key=lambda tag: tag.GetOrder())
@@ -236,7 +256,7 @@ class TagsManager(QObject):
 		self.tagsChanged.emit()
 		if not dontUpdateDescriptors:
 			# Reordering tags affects how they render on every descriptor that has them assigned, so we need to update all of them
-			affectedDescUIDs: list[str] = [descUID for descUID, descData in self.descDataManager.data.items() if any(tagUID in descData.tags for tagUID in self.tags.keys())]
+			affectedDescUIDs: list[str] = [descUID for descUID, descData in self.descDataManager.IterDescriptorData() if any(tagUID in descData.tags for tagUID in self.tags.keys())]
 			QTimer.singleShot(0, lambda: self.descDataManager.NotifyDescriptorsDataUpdated(affectedDescUIDs))  # timer to avoid "label stuck to cursor issue"
 	
 	def ReorderDescriptorTags(self, desc: BaseDescriptor, orderedVisibleTagUIDs: list[str]) -> None:
@@ -254,10 +274,10 @@ class TagsManager(QObject):
 		visibleSet: set[str] = set(orderedVisibleTagUIDs)
 		orderedIter = iter(orderedVisibleTagUIDs)
 		# Walk the existing list, substituting the visible tags with the new ordering in their slots.
-		newTags: list[str] = [next(orderedIter) if uid in visibleSet else uid for uid in descData.tags]
+		newTags: tuple[str, ...] = tuple(next(orderedIter) if uid in visibleSet else uid for uid in descData.tags)
 		if newTags == descData.tags:
 			return
-		descData.tags = newTags
+		descData.SetTagUIDs(newTags)
 		self.descDataManager.SetDescriptorData(desc, descData)
 		self.descDataManager.SaveData()
 		self.descDataManager.NotifyDescriptorsDataUpdated([desc.GetUID()])
@@ -276,6 +296,7 @@ class TagsManager(QObject):
 		nextOrder: int = (max((t.GetOrder() for t in self.tags.values()), default=-1) + 1)
 		tag.SetOrder(nextOrder)
 		self.tags[tag.GetUID()] = tag
+		self._invalidateApplicableTagsCache()
 		self.SaveTags()
 		self.tagsChanged.emit()
 
@@ -286,10 +307,11 @@ class TagsManager(QObject):
 		if tag.GetUID() not in self.tags:
 			raise ValueError(f'BaseTag {tag.GetUID()} does not exist in tags manager')
 		self.tags[tag.GetUID()] = tag
+		self._invalidateApplicableTagsCache()
 		self.SaveTags()
 		self.tagsChanged.emit()
 		# Name/color/scope changes affect how the tag renders on every descriptor that has it assigned
-		affectedDescUIDs: list[str] = [descUID for descUID, descData in self.descDataManager.data.items() if tag.GetUID() in descData.tags]
+		affectedDescUIDs: list[str] = [descUID for descUID, descData in self.descDataManager.IterDescriptorData() if tag.GetUID() in descData.tags]
 		self.descDataManager.NotifyDescriptorsDataUpdated(affectedDescUIDs)
 
 	def DeleteTag(self, tag: BaseTagImpl, dontUpdateDescriptors: bool = False) -> None:
@@ -298,15 +320,16 @@ class TagsManager(QObject):
 		tagUID = tag.GetUID()
 		if tagUID not in self.tags:
 			return
-		# Purge the tag UID from every descriptor that has it assigned
+		# Purge the tag UID from every descriptor that has it assigned (including descriptors of software handlers that aren't loaded)
 		affectedDescUIDs: list[str] = []
-		for descUID, descData in self.descDataManager.data.items():
+		for descUID, descData in self.descDataManager.IterDescriptorData(loadAll=True):
 			if tagUID in descData.tags:
-				descData.tags.remove(tagUID)
+				descData.RemoveTagUID(tagUID)
 				affectedDescUIDs.append(descUID)
 		if affectedDescUIDs:
 			self.descDataManager.SaveData()
 		del self.tags[tagUID]
+		self._invalidateApplicableTagsCache()
 		self.SaveTags()
 		self.tagsChanged.emit()
 		if not dontUpdateDescriptors:
@@ -320,7 +343,7 @@ class TagsManager(QObject):
 		
 		descData: DescriptorDataImpl = self.descDataManager.GetDescriptorData(desc)
 		if tag.GetUID() in descData.tags:
-			descData.tags.remove(tag.GetUID())
+			descData.RemoveTagUID(tag.GetUID())
 			self.descDataManager.SetDescriptorData(desc, descData)
 			self.descDataManager.SaveData()
 			self.descDataManager.NotifyDescriptorsDataUpdated([desc.GetUID()])
@@ -336,7 +359,7 @@ class TagsManager(QObject):
 		
 		descData: DescriptorDataImpl = self.descDataManager.GetDescriptorData(desc)
 		if tag.GetUID() not in descData.tags:
-			descData.tags.append(tag.GetUID())
+			descData.AddTagUID(tag.GetUID())
 			self.descDataManager.SetDescriptorData(desc, descData)
 			self.descDataManager.SaveData()
 			self.descDataManager.NotifyDescriptorsDataUpdated([desc.GetUID()])
\ No newline at end of file
@@ -6,6 +6,8 @@ from qavm.manager_plugin import PluginManager, SoftwareHandler, QAVMWorkspace, Q
 from qavm.manager_settings import SettingsManager, QAVMGlobalSettings
 from qavm.manager_dialogs import DialogsManager
 from qavm.manager_descriptor_data import DescriptorDataManager
+from qavm.manager_descriptor_updates import DescriptorUpdateBus
+from qavm.manager_async_values import AsyncValuesLoader
 from qavm.manager_tags import TagsManager
 
 import qavm.qavmapi.utils as utils  # TODO: rename to qutils
@@ -15,9 +17,11 @@ from qavm.qavmapi import (
 	BaseSoftwareInterface,
 )
 from qavm.utils_plugin_package import VerifyPlugin
+from qavm.utils_descriptors import DescriptorsDiff, ProcessedDescriptorsCache
+from qavm.qavmapi.descriptor_signals import GetDescriptorSignalsHub
 
 from PyQt6.QtCore import (
-	Qt, QEvent, 
+	Qt, QEvent, QTimer,
 )
 from PyQt6.QtGui import (
     QIcon, 
@@ -47,6 +51,7 @@ class QAVMApp(QApplication):
 		self.pluginPaths: set[Path] = set()  # Paths to individual plugins
 		self.builtinPluginPaths: set[Path] = set()  # Paths to built-in plugins (i.e. unpacked plugins)
 		self.softwareDescriptors: dict[SoftwareHandler, dict[str, list[BaseDescriptor]]] = dict()
+		self.processedDescriptorsCache: ProcessedDescriptorsCache = ProcessedDescriptorsCache()
 		self.defaultGlobalSearchPaths: list[str] = list()
 
 		self.processArgs(args)
@@ -74,6 +79,14 @@ class QAVMApp(QApplication):
 		self.tagsManager: TagsManager = TagsManager(utils.GetQAVMTagsDataFilepath(), self.descDataManager)
 		self.tagsManager.LoadTags()
 
+		self.descUpdateBus: DescriptorUpdateBus = DescriptorUpdateBus(self)
+		self.asyncValuesLoader: AsyncValuesLoader = AsyncValuesLoader(self)
+		self.aboutToQuit.connect(self.asyncValuesLoader.Shutdown)
+
+		self.descDataUnloadTimer: QTimer = QTimer(self)
+		self.descDataUnloadTimer.timeout.connect(self._unloadIdleDescriptorData)
+		self.descDataUnloadTimer.start(int(DescriptorDataManager.SHARD_IDLE_TIMEOUT * 1000 / 2))
+
 		gui_utils.SetTheme(self.settingsManager.GetQAVMSettings().GetAppTheme())  # TODO: move this to the QAVMGlobalSettings class?
 		
 		self.workspace: QAVMWorkspace = self.qavmSettings.GetWorkspaceLast()
@@ -98,6 +111,12 @@ class QAVMApp(QApplication):
 	def GetTagsManager(self) -> TagsManager:
 		return self.tagsManager
 	
+	def GetDescriptorUpdateBus(self) -> DescriptorUpdateBus:
+		return self.descUpdateBus
+	
+	def GetAsyncValuesLoader(self) -> AsyncValuesLoader:
+		return self.asyncValuesLoader
+	
 	def GetWorkspace(self) -> QAVMWorkspace:
 		return self.workspace
 	
@@ -125,6 +144,9 @@ class QAVMApp(QApplication):
 		self.LoadSoftwareDescriptors(swHandler)
 		return self.softwareDescriptors[swHandler]
 	
+	def GetProcessedDescriptorsCache(self) -> ProcessedDescriptorsCache:
+		return self.processedDescriptorsCache
+
 	def GetAllSoftwareDescriptors(self) -> list[BaseDescriptor]:
 		""" Returns a flat list of all currently loaded descriptors across all software handlers. """
 		allDescriptors: list[BaseDescriptor] = list()
@@ -134,10 +156,33 @@ class QAVMApp(QApplication):
 		return allDescriptors
 	
 	def ResetSoftwareDescriptors(self) -> None:
+		GetDescriptorSignalsHub().DisconnectDescriptors(desc.GetUID() for desc in self.GetAllSoftwareDescriptors())
 		self.softwareDescriptors = dict()
+		self.processedDescriptorsCache.Clear()
 
 	def LoadSoftwareDescriptors(self, swHandler: SoftwareHandler) -> None:
-		self.softwareDescriptors[swHandler] = self.ScanSoftware(swHandler)
+		""" Scans the software. On a rescan, the descriptors found unchanged are kept (see DescriptorsDiff), so the
+		views only need to be patched with the differences. Lists without differences are kept as a whole, so their
+		processed descriptors stay cached (see ProcessedDescriptorsCache). The signal slots of the descriptors no
+		longer found are dropped. """
+		descsMap: dict[str, list[BaseDescriptor]] = self.ScanSoftware(swHandler)
+		if oldDescsMap := self.softwareDescriptors.get(swHandler):
+			for descType, descs in descsMap.items():
+				diff: DescriptorsDiff = DescriptorsDiff(oldDescsMap.get(descType, []), descs)
+				logger.info(f'Rescanned {swHandler.GetID()} {descType}: {diff}')
+				GetDescriptorSignalsHub().DisconnectDescriptors(desc.GetUID() for desc in diff.removed)
+				descsMap[descType] = oldDescsMap[descType] if diff.IsEmpty() else diff.descs
+		self.softwareDescriptors[swHandler] = descsMap
+		swDescriptors: list[BaseDescriptor] = [desc for descs in self.softwareDescriptors[swHandler].values() for desc in descs]
+		searchRoots: list[Path] = self.settingsManager.GetSoftwareSettings(swHandler).GetEvaluatedSearchPaths()
+		self.descDataManager.RegisterDescriptors(swHandler.pluginID, swHandler.GetID(), swDescriptors, searchRoots)
+		self._unloadIdleDescriptorData()
+	
+	def _unloadIdleDescriptorData(self) -> None:
+		""" Unloads descriptor data shards of software handlers that are not part of the current workspace and haven't been used for a while. """
+		swHandlers, _ = self.workspace.GetInvolvedSoftwareHandlers()
+		keepShardKeys: set[str] = {DescriptorDataManager.GetShardKey(swHandler.pluginID, swHandler.GetID()) for swHandler in swHandlers}
+		self.descDataManager.UnloadIdleShards(keepShardKeys)
 	
 	def ScanSoftware(self, swHandler: SoftwareHandler) -> dict[str, list[BaseDescriptor]]:
 		descs: dict[str, list[BaseDescriptor]] = dict()
@@ -1,11 +1,11 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from functools import partial
-import json, enum
+import json, enum, hashlib
 
 from PyQt6.QtCore import (
-	pyqtSignal, QObject, Qt, QCoreApplication
+	pyqtSignal, QObject, Qt, QCoreApplication, QSize
 )
 from PyQt6.QtWidgets import (
 	QWidget, QLabel, QTableWidgetItem, QMenu, QStyledItemDelegate, QVBoxLayout, QListWidget, QSizePolicy,
@@ -17,7 +17,10 @@ from PyQt6.QtGui import (
 )
 
 from qavm.qavmapi import utils
-from qavm.qavmapi.gui import DescNotesWidget, GetThemeData, FolderPathsListWidget, TagBubblesFlowWidget
+from qavm.qavmapi.descriptor_signals import DescriptorSignal
+from qavm.qavmapi.gui import (
+	DescNotesWidget, GetThemeData, FolderPathsListWidget, TagBubblesFlowWidget, TagBubblesCellData, DescNotesCellData,
+)
 
 # import qavm.logs as logs
 # logger = logs.logger
@@ -77,18 +80,18 @@ class BaseSettings(QObject):
 	CONTAINER_QAVM_DEFAULTS: dict[str, Any] = dict()  # contains common per-software settings (e.g. search paths, etc.)
 	CONTAINER_DEFAULTS: dict[str, Any] = dict()  # should be overridden by subclasses
 
-	# SETTINGS_ENTRIES: dict[str, BaseSettingsEntry] = dict()
+	SETTINGS_ENTRIES: dict[str, BaseSettingsEntry] = dict()  # optional descriptions of the container entries, tell which views depend on them
 	
 	settingChanged = pyqtSignal(str, object)  # (settingName, newValue)
-
-	# TODO: these need to be refactored
-	# tilesUpdateRequired = pyqtSignal()  # is emitted when settings are changing something that requires tiles to be updated
-	# tablesUpdateRequired = pyqtSignal()  # same as tilesUpdateRequired, but for tables
+	tilesUpdateRequired = pyqtSignal(str)  # (settingName) is emitted when a setting flagged isTileUpdateRequired changes
+	tablesUpdateRequired = pyqtSignal(str)  # (settingName) same as tilesUpdateRequired, but for isTableUpdateRequired
 
 	def __init__(self, prefFilename: str, subfolder: str = ''):
 		super().__init__()
 
 		self.container = self.InitializeContainer()
+		self.tileSettingsVersion: int = 0  # is bumped whenever a setting flagged isTileUpdateRequired changes
+		self.tableSettingsVersion: int = 0  # same as tileSettingsVersion, but for isTableUpdateRequired
 
 		prefFilenamePath: Path = Path(prefFilename)
 		if not prefFilenamePath.suffix or prefFilenamePath.suffix != '.json':
@@ -115,10 +118,16 @@ class BaseSettings(QObject):
 			print(f"Preferences file doesn't exist. Creating: {self.prefFilePath}")  # TODO: use logger instead
 			self.Save()
 		
+		if self.container is None:
+			self.container = self.InitializeContainer()
+		# Only the flagged entries whose value actually changed invalidate what the views computed from them
+		prevValues: dict[str, Any] = {key: self.container.Get(key) for key in self.SETTINGS_ENTRIES if self.container.Contains(key)}
 		with open(self.prefFilePath, 'r') as f:
-			if self.container is None:
-				self.container = self.InitializeContainer()
 			self.container.InitializeFromString(f.read())
+		changedEntries: list[BaseSettingsEntry] = [entry for key, entry in self.SETTINGS_ENTRIES.items()
+			if self.container.Contains(key) and self.container.Get(key) != prevValues.get(key)]
+		self.tileSettingsVersion += any(entry.isTileUpdateRequired for entry in changedEntries)
+		self.tableSettingsVersion += any(entry.isTableUpdateRequired for entry in changedEntries)
 
 	def Save(self):
 		# self._syncContainerFromSettingsEntries(onlyDirty=False)
@@ -143,12 +152,31 @@ class BaseSettings(QObject):
 		print(f'ERROR: Settings entry "{key}" not found in settingsEntries.')  # TODO: use logger instead
 
 	def SetSetting(self, key: str, value: Any):
+		""" Sets the value and notifies the dependent views, unless it equals the current one. """
 		if self.container.Contains(key):
+			if self.container.Get(key) == value:
+				return
+			settingsEntry: BaseSettingsEntry | None = self.SETTINGS_ENTRIES.get(key)
+			if settingsEntry:
+				self.tileSettingsVersion += settingsEntry.isTileUpdateRequired
+				self.tableSettingsVersion += settingsEntry.isTableUpdateRequired
 			self.container.Set(key, value)
 			self.settingChanged.emit(key, value)
+			if settingsEntry and settingsEntry.isTileUpdateRequired:
+				self.tilesUpdateRequired.emit(key)
+			if settingsEntry and settingsEntry.isTableUpdateRequired:
+				self.tablesUpdateRequired.emit(key)
 			return
 		print(f'ERROR: Unknown settings entry "{key}". Cannot set value.')  # TODO: use logger instead
 
+	def GetTileSettingsVersion(self) -> int:
+		""" Changes only when the settings the tiles depend on (see BaseSettingsEntry.isTileUpdateRequired) may have changed. """
+		return self.tileSettingsVersion
+
+	def GetTableSettingsVersion(self) -> int:
+		""" Changes only when the settings the tables depend on (see BaseSettingsEntry.isTableUpdateRequired) may have changed. """
+		return self.tableSettingsVersion
+
 class SoftwareBaseSettings(BaseSettings):
 	""" Base class for software settings. Contains basic implementation for settings that are common for all software. """
 	CONTAINER_QAVM_DEFAULTS: dict[str, Any] = {
@@ -478,10 +506,13 @@ class BaseQualifier(object):
 	def Identify(self, currentPath: Path, fileContents: dict[str, str | bytes]) -> bool:
 		return True
 
-class BaseDescriptor(QObject):
-	""" Base class for software descriptors. Descriptor is used to represent the software among other plugin parts, such as TileBuilder, TableBuilder, ContextMenu, etc. """
-	updated_old = pyqtSignal()  # this is deprecated, DONT REMOVE: keep until overhaul is done
-	descDataUpdated = pyqtSignal()  # data in the corresponding BaseDescriptorData has changed
+class BaseDescriptor(object):
+	""" Base class for software descriptors. Descriptor is used to represent the software among other plugin parts, such as TileBuilder, TableBuilder, ContextMenu, etc.
+	Descriptors are plain Python objects (subclasses may define __slots__ too): their signals are routed through the
+	DescriptorSignalsHub by UID, so they can be created off the GUI thread and pickled (without their settings). """
+	__slots__ = ('UID', 'dirPath', 'dirType', 'settings', 'fingerprint', '__weakref__')
+	updated_old = DescriptorSignal()  # this is deprecated, DONT REMOVE: keep until overhaul is done
+	descDataUpdated = DescriptorSignal()  # data in the corresponding BaseDescriptorData has changed
 
 	# TODO: rename dirPath to path, as now it also can be a file
 	def __init__(self, dirPath: Path, settings: SoftwareBaseSettings, fileContents: dict[str, str | bytes]):
@@ -490,6 +521,7 @@ class BaseDescriptor(QObject):
 		self.dirPath: Path = dirPath
 		self.dirType: str = self._retrieveDirType()  # '' - normal dir, 's' - symlink, 'j' - junction
 		self.settings: SoftwareBaseSettings = settings
+		self.fingerprint: str = self._computeFingerprint(fileContents)
 		
 		# # Descriptor data is loaded from the disk and can be used as a persistent storage for the descriptor.
 		# # The data is expected to be organized as a dictionary of the following structure:
@@ -512,6 +544,12 @@ class BaseDescriptor(QObject):
 	def GetUID(self) -> str:
 		""" Returns a unique identifier for the descriptor. """
 		return self.UID
+
+	def GetFingerprint(self) -> str:
+		""" Returns a key of the content the descriptor was created from (its type, path and the identification file
+		contents). A rescan keeps the already loaded descriptor if it finds one with the same UID and fingerprint, so
+		descriptors that derive their content from anything else should extend it. """
+		return self.fingerprint
 	
 	# def AttachDescriptorData(self, data: dict[str, Any]) -> None:
 	# 	""" Attaches desc data. More info about desc data is in the class docstring. """
@@ -522,12 +560,32 @@ class BaseDescriptor(QObject):
 	def __hash__(self) -> int:
 		return hash(self.GetUID())
 
+	def __getstate__(self) -> dict[str, Any]:
+		state: dict[str, Any] = dict(getattr(self, '__dict__', {}))
+		for cls in type(self).__mro__:
+			for name in cls.__dict__.get('__slots__', ()):
+				if name not in ('__dict__', '__weakref__') and hasattr(self, name):
+					state[name] = getattr(self, name)
+		state['settings'] = None  # the settings belong to the GUI, the receiver has to attach them again
+		return state
+
+	def __setstate__(self, state: dict[str, Any]):
+		for name, value in state.items():
+			object.__setattr__(self, name, value)
+
 	def __str__(self):
 		return 'BaseDescriptor'
 	
 	def __repr__(self):
 		return self.__str__()
 	
+	def _computeFingerprint(self, fileContents: dict[str, str | bytes] | None) -> str:
+		hasher = hashlib.sha256(f'{type(self).__qualname__}|{self.dirPath}|{self.dirType}'.encode())
+		for fileName, content in sorted((fileContents or {}).items()):
+			hasher.update(f'|{fileName}|'.encode())
+			hasher.update(content if isinstance(content, bytes) else str(content).encode())
+		return hasher.hexdigest()
+
 	def _retrieveDirType(self) -> str:  # TODO: make it enum (or is it even needed?)
 		dirType = ''
 		if utils.IsPathSymlinkD(self.dirPath):
@@ -551,6 +609,8 @@ class BaseTag(object):
 		return True
 	
 class BaseDescriptorData(object):
+	__slots__ = ()  # implementations are kept per descriptor, so let them stay __dict__-free
+
 	def GetTags(self) -> list[BaseTag]:
 		""" Returns all tags associated with the descriptor. """
 		return []
@@ -561,6 +621,9 @@ class BaseDescriptorData(object):
 		return ''
 	def GetNoteDetail(self) -> str:
 		return ''
+	def GetVersion(self) -> str:
+		""" Returns a key that changes whenever the data (or the tags it refers to) changes, e.g. to key render caches. """
+		return ''
 
 class DescriptonrDataAccessor(object):
 	def GetDescriptorData(self, desc: BaseDescriptor) -> BaseDescriptorData:
@@ -589,11 +652,64 @@ class BaseBuilder(QWidget):
 		""" Is called when the context menu is requested for a certain descriptor. """
 		return None
 
+class TileDetailLevel(enum.IntEnum):
+	""" Level of detail of the tiles in a tiles view, lowered for large inventories (see BaseTileBuilder.CreateDetailLevelTileWidget). """
+	DENSE = 0  # grid of icons with labels
+	COMPACT = 1  # one-line tiles
+	FULL = 2  # tiles made by CreateTileWidget
+
+class AsyncValue(object):
+	""" May be returned by a cellDataGetter (see TableColumnInfo), CreateTileWidget or CreateDetailLevelTileWidget
+	instead of the final value, when computing it would block painting (e.g. reading version info or an icon from
+	an executable). The view shows the placeholder, runs the getter on a worker thread and then calls the builder
+	again, which returns the same AsyncValue: this time the view takes the computed result, passed through build.
+
+	The getter runs off the GUI thread, so it must not create or touch widgets or QPixmaps (QImage is fine); build
+	runs on the GUI thread and may create them, e.g. the tile widget. Results are cached per descriptor (by UID and
+	fingerprint) and key, which must tell apart the async values of a descriptor and change whenever the result would
+	(e.g. include the values of the settings it depends on). If the getter raises, the placeholder is kept. A None
+	placeholder shows an empty cell, or a generic tile. """
+	def __init__(self, getter: Callable[[], Any], key: str = '', placeholder: Any = None, build: Callable[[Any], Any] | None = None):
+		self.getter: Callable[[], Any] = getter
+		self.key: str = key
+		self.placeholder: Any = placeholder
+		self.build: Callable[[Any], Any] | None = build
+
+	def GetValue(self, result: Any) -> Any:
+		""" Returns the final value for the getter's result. """
+		return self.build(result) if self.build is not None else result
+
 class BaseTileBuilder(BaseBuilder):
-	def CreateTileWidget(self, descriptor: BaseDescriptor, parent) -> QWidget:
-		""" Creates a tile widget for the descriptor. """
+	def CreateTileWidget(self, descriptor: BaseDescriptor, parent) -> QWidget | AsyncValue:
+		""" Creates a tile widget for the descriptor, or an AsyncValue building it once its data is loaded. """
 		return QLabel(str(descriptor.dirPath), parent)
 
+	def CreateDetailLevelTileWidget(self, descriptor: BaseDescriptor, detailLevel: TileDetailLevel, parent) -> QWidget | AsyncValue | None:
+		""" Creates a cheap variant of the descriptor's tile for a detail level below FULL. None (default) lets QAVM
+		paint a generic one: the folder name in a one-line tile (COMPACT) or under an icon (DENSE). """
+		return None
+
+	def GetTileSizeHint(self, descriptor: BaseDescriptor) -> QSize:
+		""" Returns the tile size if it is known without creating the tile (invalid QSize otherwise). Tiles that
+		were not created yet are laid out with this size, or with the size of the first created tile. """
+		return QSize()
+
+	def UpdateTileWidget(self, tileWidget: QWidget, descriptor: BaseDescriptor) -> bool:
+		""" Rebinds a tile widget made by CreateTileWidget to another descriptor, so scrolled out tiles can be
+		recycled. Returns False if not supported, in which case a new tile widget is created instead. """
+		return False
+
+	def GetTilePixmapCacheKey(self, descriptor: BaseDescriptor) -> str | None:
+		""" Opts the descriptor's tile into being rendered once to a cached pixmap that is painted instead of a live
+		widget (which is only created on hover). The returned key must change whenever the tile content changes for
+		reasons other than the descriptor data, theme, tile size or detail level (e.g. include the values of the settings
+		flagged isTileUpdateRequired). None (default) always uses live tile widgets. """
+		return None
+
+	def IsTilePixmapDiskCacheEnabled(self) -> bool:
+		""" Whether rendered tile pixmaps are also stored in the QAVM cache folder to be reused across sessions. """
+		return False
+
 class TableColumnInfo(object):
 	def __init__(self,
 			  title: str,
@@ -601,14 +717,22 @@ class TableColumnInfo(object):
 			  tooltip: str = '',
 			  minWidth: int = 0,
 			  defaultWidth: int = 0,
-			  isResizable: bool = True
+			  isResizable: bool = True,
+			  settingsKeys: tuple[str, ...] = (),
+			  isExpensive: bool = False
 			  ):
 		self.title = title
-		self.cellDataGetter = cellDataGetter
+		self.cellDataGetter = cellDataGetter  # desc -> str, QTableWidgetItem, TableCellData, QWidget or AsyncValue of them
 		self.tooltip = tooltip
 		self.minWidth = minWidth
 		self.defaultWidth = defaultWidth
 		self.isResizable = isResizable
+		# Settings (flagged isTableUpdateRequired) the cell values depend on: when one of them changes, only the columns
+		# listing it are re-evaluated. A change of a setting no column lists re-evaluates the whole table.
+		self.settingsKeys = settingsKeys
+		# Slow getters (version probing, sizes, hashes): the cells are shown empty at first and filled in right after
+		# the table has painted, a few at a time. Such columns aren't sized to their contents, so give them a defaultWidth.
+		self.isExpensive = isExpensive
 
 class BaseTableBuilder(BaseBuilder):
 	def GetItemDelegateClass(self) -> QStyledItemDelegate.__class__:
@@ -624,6 +748,17 @@ class BaseTableBuilder(BaseBuilder):
 	def CellDataGetterDefault_Notes(self, desc: BaseDescriptor) -> DescNotesWidget:
 		descData = self.descDataAccessor.GetDescriptorData(desc)
 		return DescNotesWidget(descData.GetNoteSmall(), descData.GetNoteDetail(), persistentTooltip=True)
+	
+	def CellDataGetterDefault_TagsCellData(self, desc: BaseDescriptor, pluginID: str, softwareID: str, viewUID: str) -> TagBubblesCellData:
+		""" Same as CellDataGetterDefault_Tags, but the bubbles are painted by a delegate instead of hosted in a widget,
+		which is much lighter on large tables. """
+		tags = self.descDataAccessor.GetDescriptorData(desc).GetTagsScoped(pluginID, softwareID, viewUID)
+		return TagBubblesCellData(tags, self.GetRowMaximumHeight(), descriptor=desc)
+	
+	def CellDataGetterDefault_NotesCellData(self, desc: BaseDescriptor) -> DescNotesCellData:
+		""" Same as CellDataGetterDefault_Notes, but the note is painted by a delegate instead of hosted in a widget. """
+		descData = self.descDataAccessor.GetDescriptorData(desc)
+		return DescNotesCellData(descData.GetNoteSmall(), descData.GetNoteDetail())
 
 	def GetRowMaximumHeight(self) -> int:
 		""" Returns the maximum height (in pixels) a table row may grow to when a cell hosts a
@@ -0,0 +1,115 @@
+import weakref
+from typing import Any, Callable, Iterable
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject
+
+class DescriptorSignalsHub(object):
+	""" Routes the notifications of descriptors (e.g. descDataUpdated) to their subscribers, keyed by descriptor UID.
+	Descriptors are plain Python objects: instead of every descriptor being a QObject carrying its own signals, the
+	subscriptions live here, so an old and a rescanned descriptor with the same UID share them.
+
+	Slots that are bound methods are referenced weakly, and the ones of deleted QObjects are dropped, much like Qt
+	disconnects a destroyed receiver. Other callables (lambdas, partials) are kept alive until disconnected, or until
+	their descriptor is gone (see DisconnectDescriptors).
+	Notifications are delivered synchronously to the slots subscribed to the descriptor, then to the ones subscribed
+	to all descriptors (which get the descriptor UID). """
+	def __init__(self):
+		self._slots: dict[tuple[str, str], list[Callable[[], Any]]] = dict()  # (signal name, descUID) -> slot refs
+		self._globalSlots: dict[str, list[Callable[[], Any]]] = dict()  # signal name -> refs of slots getting the descUID
+		self._signalNames: set[str] = set()  # names of the signals ever connected to per descriptor
+
+	def Connect(self, signalName: str, descUID: str, slot: Callable):
+		self._signalNames.add(signalName)
+		self._slots.setdefault((signalName, descUID), []).append(self._makeSlotRef(slot))
+
+	def Disconnect(self, signalName: str, descUID: str, slot: Callable | None = None):
+		""" Disconnects the slot from the descriptor's signal, or all of its slots if None. Raises TypeError if the
+		slot is not connected, as pyqtSignal.disconnect does. """
+		self._disconnect(self._slots, (signalName, descUID), slot)
+
+	def DisconnectDescriptors(self, descUIDs: Iterable[str]):
+		""" Drops all the slots connected to the signals of the given descriptors, e.g. once they are gone after a rescan. """
+		for descUID in descUIDs:
+			for signalName in self._signalNames:
+				self._slots.pop((signalName, descUID), None)
+
+	def ConnectAll(self, signalName: str, slot: Callable[[str], Any]):
+		""" Connects a slot to the signal of all descriptors, the slot gets the UID of the emitting descriptor. """
+		self._globalSlots.setdefault(signalName, []).append(self._makeSlotRef(slot))
+
+	def DisconnectAll(self, signalName: str, slot: Callable[[str], Any]):
+		self._disconnect(self._globalSlots, signalName, slot)
+
+	def Emit(self, signalName: str, descUID: str):
+		for slot in self._resolveSlots(self._slots, (signalName, descUID)):
+			slot()
+		for slot in self._resolveSlots(self._globalSlots, signalName):
+			slot(descUID)
+
+	@staticmethod
+	def _makeSlotRef(slot: Callable) -> Callable[[], Any]:
+		if hasattr(slot, '__self__') and hasattr(slot, '__func__'):
+			return weakref.WeakMethod(slot)
+		return lambda: slot
+
+	@staticmethod
+	def _resolveSlots(slotsMap: dict, key: Any) -> list[Callable]:
+		""" Returns the live slots connected under the key, dropping the ones whose receiver is gone. """
+		slotRefs: list[Callable[[], Any]] = slotsMap.get(key, [])
+		slots: list[Callable] = []
+		for slotRef in list(slotRefs):
+			slot = slotRef()
+			receiver = getattr(slot, '__self__', None)
+			if slot is None or (isinstance(receiver, QObject) and sip.isdeleted(receiver)):
+				slotRefs.remove(slotRef)
+			else:
+				slots.append(slot)
+		if not slotRefs:
+			slotsMap.pop(key, None)
+		return slots
+
+	def _disconnect(self, slotsMap: dict, key: Any, slot: Callable | None):
+		slotRefs: list[Callable[[], Any]] = slotsMap.get(key, [])
+		if slot is None:
+			slotsMap.pop(key, None)
+			return
+		for slotRef in slotRefs:
+			if slotRef() == slot:
+				slotRefs.remove(slotRef)
+				if not slotRefs:
+					del slotsMap[key]
+				return
+		raise TypeError(f'{slot} is not connected')
+
+_descriptorSignalsHub: DescriptorSignalsHub = DescriptorSignalsHub()
+
+def GetDescriptorSignalsHub() -> DescriptorSignalsHub:
+	return _descriptorSignalsHub
+
+class DescriptorSignal(object):
+	""" Descriptor class attribute standing in for a pyqtSignal without arguments: desc.<name>.connect/disconnect/emit
+	keep working for plugins, but are routed through the DescriptorSignalsHub by the descriptor's UID. """
+	def __set_name__(self, owner: type, name: str):
+		self.name: str = name
+
+	def __get__(self, desc: Any, owner: type | None = None):
+		if desc is None:
+			return self
+		return BoundDescriptorSignal(self.name, desc.GetUID())
+
+class BoundDescriptorSignal(object):
+	__slots__ = ('signalName', 'descUID')
+
+	def __init__(self, signalName: str, descUID: str):
+		self.signalName: str = signalName
+		self.descUID: str = descUID
+
+	def connect(self, slot: Callable):
+		_descriptorSignalsHub.Connect(self.signalName, self.descUID, slot)
+
+	def disconnect(self, slot: Callable | None = None):
+		_descriptorSignalsHub.Disconnect(self.signalName, self.descUID, slot)
+
+	def emit(self):
+		_descriptorSignalsHub.Emit(self.signalName, self.descUID)
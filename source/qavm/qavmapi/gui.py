@@ -7,15 +7,16 @@ import markdown
 
 from PyQt6.QtCore import (
 	Qt, pyqtSignal, QPropertyAnimation, pyqtProperty, QEasingCurve, QPointF,
-	QModelIndex, QSize, QRect, QTimer, QPoint, QMimeData,
+	QModelIndex, QSize, QRect, QRectF, QTimer, QPoint, QMimeData, QEvent, QObject,
 )
 from PyQt6.QtWidgets import (
 	QApplication, QFrame, QPlainTextEdit, QPushButton, QVBoxLayout, QLabel, QTableWidgetItem, QListWidget, QScrollBar,
 	QListWidgetItem, QLineEdit, QComboBox, QSizePolicy, QStyledItemDelegate, QStyleOptionViewItem,
-	QStyledItemDelegate, QHBoxLayout, QDialog, QWidget, QMenu
+	QStyledItemDelegate, QHBoxLayout, QDialog, QWidget, QMenu, QStyle
 )
 from PyQt6.QtGui import (
-	QColor, QKeyEvent, QMouseEvent, QCursor, QPainter, QPalette, QLinearGradient, QGradient, QAction, QFont, QDrag
+	QColor, QKeyEvent, QMouseEvent, QCursor, QPainter, QPalette, QLinearGradient, QGradient, QAction, QFont, QDrag,
+	QFontMetrics, QPen,
 )
 
 import pyperclip
@@ -24,11 +25,19 @@ from qt_material import apply_stylesheet, get_theme, list_themes
 import qavm.qavmapi.utils as qutils
 from qavm.utils_gui import BubbleWidget, FadeTooltip
 
+# Custom item data roles served by the descriptor table model (see widget_table.DescriptorTableModel)
+TABLE_ROLE_DESCRIPTOR_INDEX: int = Qt.ItemDataRole.UserRole.value + 1  # index of the row's descriptor in the view's descriptors list
+TABLE_ROLE_CELL_DATA: int = Qt.ItemDataRole.UserRole.value + 2  # TableCellData of a delegate-painted cell
+TABLE_ROLE_SORT_KEY: int = Qt.ItemDataRole.UserRole.value + 3  # precomputed number/string key the rows are sorted by
+
 class NumberTableWidgetItem(QTableWidgetItem):
 	def __init__(self, value: int | float, format: str = '{}'):
 		self.value: int | float = value
 		self.format: str = format
 		super().__init__(self.format.format(self.value))
+
+	def GetSortKey(self) -> int | float:
+		return self.value
 	
 	def __lt__(self, other):
 		if isinstance(other, NumberTableWidgetItem):
@@ -41,6 +50,9 @@ class DateTimeTableWidgetItem(QTableWidgetItem):
 		self.format: str = format
 		super().__init__(self.date.strftime(self.format))
 
+	def GetSortKey(self) -> float:
+		return self.date.timestamp()
+
 	def __lt__(self, other):
 		if isinstance(other, DateTimeTableWidgetItem):
 			return self.date < other.date
@@ -70,6 +82,9 @@ class PathTableWidgetItem(QTableWidgetItem):
 					dirPostfix = f' ( → {target})'
 		super().__init__(f"{dirPrefix}{str(self.path)}{dirPostfix}")
 
+	def GetSortKey(self) -> str:
+		return str(self.path)
+
 	def __lt__(self, other):
 		if isinstance(other, PathTableWidgetItem):
 			return str(self.path) < str(other.path)
@@ -280,10 +295,8 @@ class AnimatedRowGradientDelegate(QStyledItemDelegate):
 		self.anim.start()
 	
 	def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
-		tableWidget = option.widget
-		row = index.row()
-		descIdx: int = int(tableWidget.item(row, tableWidget.columnCount() - 1).text())
-		if self.IsSpecialPaint(descIdx):
+		descIdx: int | None = index.data(TABLE_ROLE_DESCRIPTOR_INDEX)
+		if descIdx is not None and self.IsSpecialPaint(descIdx):
 			return self._doPpaint(painter, option, index)
 
 		QStyledItemDelegate.paint(self, painter, option, index)
@@ -296,7 +309,7 @@ class AnimatedRowGradientDelegate(QStyledItemDelegate):
 		if table is None:
 			return super().paint(painter, option, index)
 
-		tableContentColumnsWidth = sum(table.columnWidth(c) for c in range(table.columnCount()))
+		tableContentColumnsWidth = sum(table.columnWidth(c) for c in range(table.model().columnCount()))
 		# scrollBarVerticalWidth = table.verticalScrollBar().width() if table.verticalScrollBar().isVisible() else 0
 		# verticalHeaderWidth = table.verticalHeader().width()
 		
@@ -367,7 +380,7 @@ class AnimatedRowGradientDelegate(QStyledItemDelegate):
 		# first = tableWidget.model().index(self.target_row, 0)
 		# last  = tableWidget.model().index(self.target_row, tableWidget.columnCount() - 1)
 		first = tableWidget.model().index(0, 0)
-		last  = tableWidget.model().index(tableWidget.rowCount(), tableWidget.columnCount() - 1)
+		last  = tableWidget.model().index(tableWidget.model().rowCount(), tableWidget.model().columnCount() - 1)
 		row_rect = (tableWidget.visualRect(first).united(tableWidget.visualRect(last)))
 		tableWidget.viewport().update(row_rect)
 
@@ -515,6 +528,9 @@ class HoverFadeTooltipWidget(HoverFadeTooltipMixin, QWidget):
 # It identifies the source descriptor so a drop can tell reordering (same descriptor) from copying (another).
 TAG_SOURCE_DESC_MIME_TYPE: str = 'application/x-qavm-tag-source-desc-uid'
 
+# Number of widths a tag bubbles layout/height is memoized for (the current one plus a few recent ones while resizing)
+LAYOUT_CACHE_SIZE: int = 4
+
 
 class TagBubblesFlowWidget(HoverFadeTooltipWidget):
 	""" Flow-laid-out collection of colorful tag bubbles for use inside table cells and tiles.
@@ -524,7 +540,7 @@ class TagBubblesFlowWidget(HoverFadeTooltipWidget):
 	mouse events to provide per-tag hover tooltips and Ctrl+LMB editing, while forwarding all other
 	mouse interactions (plain click, context menu, tag drag-n-drop) to the underlying table/tile so
 	row selection and existing behaviour keep working. Intended to be returned from
-	BaseTableBuilder.GetTableCellValue and consumed via QTableWidget.setCellWidget.
+	BaseTableBuilder.GetTableCellValue and placed as an index widget by the descriptor table.
 
 	When a descriptor is supplied the bubbles also become draggable: dragging a bubble within the same
 	cell reorders that descriptor's tags, while dropping it onto another descriptor's cell copies the
@@ -544,6 +560,7 @@ class TagBubblesFlowWidget(HoverFadeTooltipWidget):
 		super().__init__(parent, persistentTooltip=True)
 		self._maxHeight: int = max(maxHeight, 1)
 		self._lastContentHeight: int = -1
+		self._heightForWidthCache: dict[int, int] = dict()  # width -> height; the tags never change after construction
 		self._descriptor = descriptor  # BaseDescriptor this cell represents; enables drag reorder/copy
 		self.setAutoFillBackground(False)
 
@@ -567,10 +584,8 @@ class TagBubblesFlowWidget(HoverFadeTooltipWidget):
 			self.setAcceptDrops(True)
 
 	def GetSortKey(self) -> str:
-		""" Returns a stable key used to sort the Tags column (comma-joined, lower-cased tag names). """
-		SORT_WIDTH = 20  # enough for 64-bit unsigned integers
-		orders: list[int] = self._tagOrders if self._tagOrders else [pow(10, SORT_WIDTH) - 1]  # sort empty tags last
-		return ', '.join(f"{x:0{SORT_WIDTH}d}" for x in orders).lower()
+		""" Returns a stable key used to sort the Tags column (comma-joined, zero-padded tag orders). """
+		return GetTagsSortKey(self._tagOrders)
 
 	def _createBubble(self, text: str, bgColor: QColor | None) -> BubbleWidget:
 		bubble: BubbleWidget = BubbleWidget(text, bgColor=bgColor, rounding=self.BUBBLE_ROUNDING, margin=self.BUBBLE_MARGIN)
@@ -681,7 +696,17 @@ class TagBubblesFlowWidget(HoverFadeTooltipWidget):
 		return True
 
 	def heightForWidth(self, width: int) -> int:
-		return self._doLayout(width, apply=False)
+		if width not in self._heightForWidthCache:
+			if len(self._heightForWidthCache) >= LAYOUT_CACHE_SIZE:
+				del self._heightForWidthCache[next(iter(self._heightForWidthCache))]
+			self._heightForWidthCache[width] = self._doLayout(width, apply=False)
+		return self._heightForWidthCache[width]
+
+	def changeEvent(self, event):
+		# Bubble sizes depend on the font and style, so measured heights are stale after these change.
+		if event.type() in (QEvent.Type.FontChange, QEvent.Type.StyleChange):
+			self._heightForWidthCache.clear()
+		super().changeEvent(event)
 
 	def sizeHint(self) -> QSize:
 		w: int = self.width() if self.width() > 0 else 200
@@ -774,17 +799,7 @@ class TagBubblesFlowWidget(HoverFadeTooltipWidget):
 
 	def _promptUnassignTag(self, tag) -> None:
 		""" Asks the user to confirm, then removes the tag from this descriptor. """
-		from PyQt6.QtWidgets import QMessageBox
-		reply = QMessageBox.question(
-			self, "Unassign Tag",
-			f"Remove tag '{tag.GetName()}' from this item?",
-			QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-			QMessageBox.StandardButton.No,
-		)
-		if reply != QMessageBox.StandardButton.Yes:
-			return
-		from qavm.utils_widgets import UnassignTagUIDFromDescriptor  # lazy import to avoid an import cycle
-		UnassignTagUIDFromDescriptor(self._descriptor, tag.GetUID())
+		PromptUnassignTag(self, self._descriptor, tag)
 
 
 	def mouseReleaseEvent(self, event: QMouseEvent):
@@ -866,47 +881,23 @@ class TagBubblesFlowWidget(HoverFadeTooltipWidget):
 
 	def _computeDropIndex(self, pos: QPoint) -> int:
 		""" Returns the insertion index (into the visible tag order) for a drop at the given local position. """
-		index: int = 0
-		for i, bubble in enumerate(self._bubbles):
-			if not bubble.isVisible():
-				continue
-			geo: QRect = bubble.geometry()
-			if pos.y() > geo.bottom():
-				# Drop is on a row below this bubble → it comes before the drop.
-				index = i + 1
-			elif pos.y() >= geo.top():
-				# Same row as this bubble → 'after' it when the drop is right of its center.
-				if pos.x() >= geo.center().x():
-					index = i + 1
-			# else: bubble is on a row below the drop; never before it.
-		return index
+		return ComputeTagDropIndex([bubble.geometry() if bubble.isVisible() else None for bubble in self._bubbles], pos)
 
 	def _buildReorderedVisibleUIDs(self, draggedUID: str, insertIdx: int) -> list[str] | None:
 		""" Builds the new visible-tag UID order after moving draggedUID to insertIdx, or None if unchanged. """
-		uids: list[str] = [tag.GetUID() for tag in self._tags]
-		if draggedUID not in uids:
-			return None
-		oldIdx: int = uids.index(draggedUID)
-		insertIdx = max(0, min(insertIdx, len(uids)))
-		newUids: list[str] = uids[:oldIdx] + uids[oldIdx + 1:]
-		if oldIdx < insertIdx:
-			insertIdx -= 1
-		newUids.insert(insertIdx, draggedUID)
-		return newUids if newUids != uids else None
+		return BuildReorderedTagUIDs([tag.GetUID() for tag in self._tags], draggedUID, insertIdx)
 
 	def _selectOwnerRow(self) -> None:
-		""" Selects the table row that hosts this cell widget (best effort; no-op outside a QTableWidget). """
-		from PyQt6.QtWidgets import QTableWidget
+		""" Selects the table row that hosts this cell widget (best effort; no-op outside an item view). """
+		from PyQt6.QtWidgets import QAbstractItemView
 		view: QWidget | None = self.parentWidget()
-		while view is not None and not isinstance(view, QTableWidget):
+		while view is not None and not isinstance(view, QAbstractItemView):
 			view = view.parentWidget()
-		if not isinstance(view, QTableWidget):
+		if not isinstance(view, QAbstractItemView):
 			return
-		for row in range(view.rowCount()):
-			for col in range(view.columnCount()):
-				if view.cellWidget(row, col) is self:
-					view.setCurrentCell(row, col)
-					return
+		index: QModelIndex = view.indexAt(view.viewport().mapFromGlobal(self.mapToGlobal(QPoint(0, 0))))
+		if index.isValid():
+			view.setCurrentIndex(index)
 	# endregion
 
 	def leaveEvent(self, event):
@@ -921,43 +912,92 @@ class TagBubblesFlowWidget(HoverFadeTooltipWidget):
 	def _GetTooltipHtml(self) -> str | None:
 		if self._hoveredIndex < 0 or self._hoveredIndex >= len(self._tags):
 			return None
-		return self._buildTooltipHtml(self._tags[self._hoveredIndex])
-
-	def _buildTooltipHtml(self, tag) -> str:
-		""" Tooltip: hovered tag's description, a separator, then the full list of the descriptor's tags. """
-		def swatch(colorStr: str) -> str:
-			return f'<span style="display:inline-block;width:1.1em;height:0.9em;background-color:{colorStr};margin-right:0.3em;border-radius:2px;vertical-align:middle;">{"&nbsp;"*5}</span>' if colorStr else ''
-
-		header: str = f'{swatch(tag.GetColor())} <b>{html.escape(tag.GetName())}</b>'
-		if description := tag.GetDescription() if hasattr(tag, 'GetDescription') else '':
-			header += f'<div style="margin-top:4px;margin-bottom:6px;">{PlainTextToTooltipHtml(description)}</div>'
-
-		# Build a simple table for the tag list: marker | color | name
-		rows: list[str] = []
-		for t in self._tags:
-			marker: str = '&rarr;' if t is tag else '&bull;'
-			color_cell = swatch(t.GetColor() or "")
-			name_cell = html.escape(t.GetName())
-			rows.append(f'<tr><td style="padding:2px 6px;width:1%">{marker}</td><td style="padding:2px 6px;width:1%">{color_cell}</td><td style="padding:2px 6px;">{name_cell}</td></tr>')
-
-		table_html = (
-			f'<div>{header}</div>'
-			f'<hr style="margin:6px 0;">'
-			f'<table style="border-collapse:collapse;font-size:90%;">'
-			+ ''.join(rows)
-			+ '</table>'
-		)
-		return table_html
+		return BuildTagsTooltipHtml(self._tags[self._hoveredIndex], self._tags)
 	# endregion
 
 
+def BuildTagsTooltipHtml(tag, tags: list) -> str:
+	""" Tooltip: hovered tag's description, a separator, then the full list of the descriptor's tags. """
+	def swatch(colorStr: str) -> str:
+		return f'<span style="display:inline-block;width:1.1em;height:0.9em;background-color:{colorStr};margin-right:0.3em;border-radius:2px;vertical-align:middle;">{"&nbsp;"*5}</span>' if colorStr else ''
+
+	header: str = f'{swatch(tag.GetColor())} <b>{html.escape(tag.GetName())}</b>'
+	if description := tag.GetDescription() if hasattr(tag, 'GetDescription') else '':
+		header += f'<div style="margin-top:4px;margin-bottom:6px;">{PlainTextToTooltipHtml(description)}</div>'
+
+	# Build a simple table for the tag list: marker | color | name
+	rows: list[str] = []
+	for t in tags:
+		marker: str = '&rarr;' if t is tag else '&bull;'
+		color_cell = swatch(t.GetColor() or "")
+		name_cell = html.escape(t.GetName())
+		rows.append(f'<tr><td style="padding:2px 6px;width:1%">{marker}</td><td style="padding:2px 6px;width:1%">{color_cell}</td><td style="padding:2px 6px;">{name_cell}</td></tr>')
+
+	table_html = (
+		f'<div>{header}</div>'
+		f'<hr style="margin:6px 0;">'
+		f'<table style="border-collapse:collapse;font-size:90%;">'
+		+ ''.join(rows)
+		+ '</table>'
+	)
+	return table_html
+
+def GetTagsSortKey(tagOrders: list[int]) -> str:
+	""" Returns a stable key used to sort a Tags column (comma-joined, zero-padded tag orders). """
+	SORT_WIDTH = 20  # enough for 64-bit unsigned integers
+	orders: list[int] = tagOrders if tagOrders else [pow(10, SORT_WIDTH) - 1]  # sort empty tags last
+	return ', '.join(f"{x:0{SORT_WIDTH}d}" for x in orders).lower()
+
+def ComputeTagDropIndex(tagRects: list[QRect | None], pos: QPoint) -> int:
+	""" Returns the insertion index (into the tag order) for a drop at pos, given each tag bubble's rect (None if hidden). """
+	index: int = 0
+	for i, geo in enumerate(tagRects):
+		if geo is None:
+			continue
+		if pos.y() > geo.bottom():
+			# Drop is on a row below this bubble → it comes before the drop.
+			index = i + 1
+		elif pos.y() >= geo.top():
+			# Same row as this bubble → 'after' it when the drop is right of its center.
+			if pos.x() >= geo.center().x():
+				index = i + 1
+		# else: bubble is on a row below the drop; never before it.
+	return index
+
+def BuildReorderedTagUIDs(uids: list[str], draggedUID: str, insertIdx: int) -> list[str] | None:
+	""" Builds the new tag UID order after moving draggedUID to insertIdx, or None if unchanged. """
+	if draggedUID not in uids:
+		return None
+	oldIdx: int = uids.index(draggedUID)
+	insertIdx = max(0, min(insertIdx, len(uids)))
+	newUids: list[str] = uids[:oldIdx] + uids[oldIdx + 1:]
+	if oldIdx < insertIdx:
+		insertIdx -= 1
+	newUids.insert(insertIdx, draggedUID)
+	return newUids if newUids != uids else None
+
+def PromptUnassignTag(parent: QWidget, desc, tag) -> None:
+	""" Asks the user to confirm, then removes the tag from the descriptor. """
+	from PyQt6.QtWidgets import QMessageBox
+	reply = QMessageBox.question(
+		parent, "Unassign Tag",
+		f"Remove tag '{tag.GetName()}' from this item?",
+		QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+		QMessageBox.StandardButton.No,
+	)
+	if reply != QMessageBox.StandardButton.Yes:
+		return
+	from qavm.utils_widgets import UnassignTagUIDFromDescriptor  # lazy import to avoid an import cycle
+	UnassignTagUIDFromDescriptor(desc, tag.GetUID())
+
+
 class DescNotesWidget(HoverFadeTooltipWidget):
 	""" Displays a descriptor's small note as a single label and, on hover, shows a FadeTooltip with the
 	small note followed by the detailed note (rendered as escaped plain text).
 
 	In the common case it renders just like a plain note label. Mouse interactions other than hover are
 	forwarded to the underlying table/tile so row selection, context menus and drag-n-drop keep working.
-	Intended to be used both as a tile widget and as a table cell widget (via QTableWidget.setCellWidget);
+	Intended to be used both as a tile widget and as a table cell (index) widget;
 	GetSortKey enables sorting the Note column. """
 	MARGIN: int = 0
 
@@ -992,7 +1032,7 @@ class DescNotesWidget(HoverFadeTooltipWidget):
 
 	def GetSortKey(self) -> str:
 		""" Returns a stable key used to sort the Note column (lower-cased small note). """
-		return self._noteSmall.lower() if self._noteSmall else chr(127)  # sort empty notes last
+		return GetNotesSortKey(self._noteSmall)
 
 	def mouseMoveEvent(self, event: QMouseEvent):
 		if self._noteSmall or self._noteDetail:
@@ -1005,17 +1045,278 @@ class DescNotesWidget(HoverFadeTooltipWidget):
 		event.ignore()
 
 	def _GetTooltipHtml(self) -> str | None:
-		if not self._noteSmall and not self._noteDetail:
+		return BuildNotesTooltipHtml(self._noteSmall, self._noteDetail)
+
+def GetNotesSortKey(noteSmall: str) -> str:
+	""" Returns a stable key used to sort a Note column (lower-cased small note). """
+	return noteSmall.lower() if noteSmall else chr(127)  # sort empty notes last
+
+def BuildNotesTooltipHtml(noteSmall: str, noteDetail: str) -> str | None:
+	""" Tooltip: the small note followed by the detailed note, or None when both are empty. """
+	if not noteSmall and not noteDetail:
+		return None
+	parts: list[str] = []
+	if noteSmall:
+		parts.append(f'<div><b>{html.escape(noteSmall)}</b></div>')
+	if noteDetail:
+		if noteSmall:
+			parts.append('<hr style="margin:6px 0;">')
+		# The detailed note is plain text entered by the user; escape it and keep its line breaks.
+		parts.append(f'<div>{PlainTextToTooltipHtml(noteDetail)}</div>')
+	return ''.join(parts)
+
+
+# region Delegate-painted table cells
+class TableCellData(object):
+	""" Lightweight value a cellDataGetter may return for a table cell that is painted by a delegate
+	(see GetDelegateClass) rather than hosted as a widget. Instances are immutable snapshots of the
+	descriptor's data: the table asks for a fresh one whenever the descriptor's data is updated. """
+	def GetSortKey(self) -> str:
+		return ''
+
+	def HeightForWidth(self, width: int, font: QFont) -> int:
+		""" Returns the height the content needs at the given cell width, or 0 if it doesn't affect the row height. """
+		return 0
+
+	def GetItemAt(self, width: int, font: QFont, pos: QPoint) -> int:
+		""" Returns the index of the painted item (e.g. tag bubble) at the cell-local position, or -1 if none. """
+		return -1
+
+	def GetTooltipHtml(self, itemIndex: int) -> str | None:
+		return None
+
+	def CreateWidget(self, parent: QWidget | None = None) -> QWidget:
+		""" Builds the equivalent standalone widget, e.g. for tiles or custom views. """
+		raise NotImplementedError("CreateWidget method should be implemented in a subclass")
+
+	@staticmethod
+	def GetDelegateClass() -> type['TableCellDataDelegate']:
+		""" The table instantiates it as delegateClass(table, baseDelegate=<the row delegate>). """
+		return TableCellDataDelegate
+
+class TagBubblesCellData(TableCellData):
+	""" Descriptor tags painted as flow-laid-out bubbles (TagBubblesItemDelegate), the table counterpart of
+	TagBubblesFlowWidget. Layouts are cached per (width, font) as the content never changes. """
+	ITEM_OVERFLOW: int = -2  # the trailing '+N' bubble
+	ITEM_PLACEHOLDER: int = -3  # the '-' shown when there are no tags
+
+	def __init__(self, tags: list, maxHeight: int, descriptor=None):
+		self._tags: list = list(tags)
+		self._maxHeight: int = max(maxHeight, 1)
+		self._descriptor = descriptor
+		self._sortKey: str = GetTagsSortKey([tag.GetOrder() for tag in self._tags])
+		self._layouts: dict[tuple[int, str], tuple[list[tuple[int, QRect, str]], int]] = dict()
+
+	def GetTags(self) -> list:
+		return self._tags
+
+	def GetDescriptor(self):
+		return self._descriptor
+
+	def GetSortKey(self) -> str:
+		return self._sortKey
+
+	def GetLayout(self, width: int, font: QFont) -> tuple[list[tuple[int, QRect, str]], int]:
+		""" Returns the (item index, cell-local rect, text) placements and the content height, mirroring
+		TagBubblesFlowWidget._doLayout. Item index is the tag index, ITEM_OVERFLOW or ITEM_PLACEHOLDER. """
+		key: tuple[int, str] = (width, font.key())
+		if key not in self._layouts:
+			if len(self._layouts) >= LAYOUT_CACHE_SIZE:
+				del self._layouts[next(iter(self._layouts))]
+			self._layouts[key] = self._doLayout(width, QFontMetrics(font))
+		return self._layouts[key]
+
+	def _doLayout(self, width: int, fm: QFontMetrics) -> tuple[list[tuple[int, QRect, str]], int]:
+		m, hsp, vsp = TagBubblesFlowWidget.MARGIN, TagBubblesFlowWidget.HSPACING, TagBubblesFlowWidget.VSPACING
+		bm: int = TagBubblesFlowWidget.BUBBLE_MARGIN
+		maxH: int = self._maxHeight
+		n: int = len(self._tags)
+		effRight: int = max(width - m, m + 1)
+
+		def bubbleSize(text: str) -> tuple[int, int]:
+			return fm.horizontalAdvance(text) + 2 * bm, fm.height() + 2 * bm
+
+		if n == 0:
+			pw, ph = bubbleSize('-')
+			return [(self.ITEM_PLACEHOLDER, QRect(m, m, pw, ph), '-')], min(m + ph + m + m * 2 + vsp * 2, maxH)
+
+		placements: list[tuple[int, QRect, str]] = []
+		x: int = m
+		y: int = m
+		lineHeight: int = 0
+		hiddenStart: int = n
+
+		i: int = 0
+		while i < n:
+			text: str = self._tags[i].GetName()
+			bw, bh = bubbleSize(text)
+			if placements and x + bw > effRight and lineHeight > 0:
+				nextY: int = y + lineHeight + vsp
+				if nextY + bh + m > maxH:
+					hiddenStart = i
+					break
+				x, y, lineHeight = m, nextY, 0
+			placements.append((i, QRect(x, y, bw, bh), text))
+			x += bw + hsp
+			lineHeight = max(lineHeight, bh)
+			i += 1
+
+		if hiddenStart < n:
+			hiddenCount: int = n - hiddenStart
+			ow, oh = bubbleSize(f'+{hiddenCount}')
+			# Make room for the overflow bubble at the end of the current (last) row.
+			while placements and x + ow > effRight:
+				poppedRect: QRect = placements[-1][1]
+				if poppedRect.y() != y:
+					break
+				placements.pop()
+				hiddenCount += 1
+				ow, oh = bubbleSize(f'+{hiddenCount}')
+				x = poppedRect.x()
+			placements.append((self.ITEM_OVERFLOW, QRect(x, y, ow, oh), f'+{hiddenCount}'))
+			lineHeight = max(lineHeight, oh)
+
+		# add a tiny padding to avoid clipping by table cell borders/rounding
+		return placements, min(y + lineHeight + m + m * 2 + vsp * 2, maxH)
+
+	def HeightForWidth(self, width: int, font: QFont) -> int:
+		return self.GetLayout(width, font)[1]
+
+	def GetItemAt(self, width: int, font: QFont, pos: QPoint) -> int:
+		for itemIdx, rect, _ in self.GetLayout(width, font)[0]:
+			if itemIdx >= 0 and rect.contains(pos):
+				return itemIdx
+		return -1
+
+	def GetTagRects(self, width: int, font: QFont) -> list[QRect | None]:
+		""" Returns the cell-local rect of every tag bubble (None for tags collapsed into the overflow bubble). """
+		tagRects: list[QRect | None] = [None] * len(self._tags)
+		for itemIdx, rect, _ in self.GetLayout(width, font)[0]:
+			if itemIdx >= 0:
+				tagRects[itemIdx] = rect
+		return tagRects
+
+	def GetTooltipHtml(self, itemIndex: int) -> str | None:
+		if not (0 <= itemIndex < len(self._tags)):
 			return None
-		parts: list[str] = []
-		if self._noteSmall:
-			parts.append(f'<div><b>{html.escape(self._noteSmall)}</b></div>')
-		if self._noteDetail:
-			if self._noteSmall:
-				parts.append('<hr style="margin:6px 0;">')
-			# The detailed note is plain text entered by the user; escape it and keep its line breaks.
-			parts.append(f'<div>{PlainTextToTooltipHtml(self._noteDetail)}</div>')
-		return ''.join(parts)
+		return BuildTagsTooltipHtml(self._tags[itemIndex], self._tags)
+
+	def CreateWidget(self, parent: QWidget | None = None) -> QWidget:
+		return TagBubblesFlowWidget(self._tags, self._maxHeight, parent, descriptor=self._descriptor)
+
+	@staticmethod
+	def GetDelegateClass() -> type['TableCellDataDelegate']:
+		return TagBubblesItemDelegate
+
+class DescNotesCellData(TableCellData):
+	""" Descriptor's small note painted as a centered label (DescNotesItemDelegate), the table counterpart
+	of DescNotesWidget. The detailed note is shown in the hover tooltip. """
+	def __init__(self, noteSmall: str, noteDetail: str = ''):
+		self._noteSmall: str = noteSmall or ''
+		self._noteDetail: str = noteDetail or ''
+
+	def GetText(self) -> str:
+		return self._noteSmall if self._noteSmall else '-'
+
+	def GetSortKey(self) -> str:
+		return GetNotesSortKey(self._noteSmall)
+
+	def GetItemAt(self, width: int, font: QFont, pos: QPoint) -> int:
+		return 0 if self._noteSmall or self._noteDetail else -1
+
+	def GetTooltipHtml(self, itemIndex: int) -> str | None:
+		return BuildNotesTooltipHtml(self._noteSmall, self._noteDetail) if itemIndex == 0 else None
+
+	def CreateWidget(self, parent: QWidget | None = None) -> QWidget:
+		return DescNotesWidget(self._noteSmall, self._noteDetail, parent, persistentTooltip=True)
+
+	@staticmethod
+	def GetDelegateClass() -> type['TableCellDataDelegate']:
+		return DescNotesItemDelegate
+
+class TableCellDataDelegate(QStyledItemDelegate):
+	""" Paints the background/selection of a TableCellData cell and lets subclasses paint the content on top
+	in cell-local coordinates (see PaintCellData). The background is left to baseDelegate if given, e.g. the row
+	delegate of the table builder, so its row painting (gradients, animations) covers the painted columns too. """
+	def __init__(self, parent: QObject | None = None, baseDelegate: QStyledItemDelegate | None = None):
+		super().__init__(parent)
+		self.baseDelegate: QStyledItemDelegate | None = baseDelegate
+
+	def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+		# painted cells serve no DisplayRole, so this draws no text
+		if self.baseDelegate is not None:
+			self.baseDelegate.paint(painter, option, index)
+		else:
+			super().paint(painter, option, index)
+		cellData = index.data(TABLE_ROLE_CELL_DATA)
+		if not isinstance(cellData, TableCellData):
+			return
+		painter.save()
+		painter.setClipRect(option.rect)
+		painter.translate(option.rect.topLeft())
+		self.PaintCellData(painter, option, cellData)
+		painter.restore()
+
+	def PaintCellData(self, painter: QPainter, option: QStyleOptionViewItem, cellData: TableCellData):
+		pass
+
+	def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+		size: QSize = self.baseDelegate.sizeHint(option, index) if self.baseDelegate is not None else super().sizeHint(option, index)
+		cellData = index.data(TABLE_ROLE_CELL_DATA)
+		if isinstance(cellData, TableCellData):
+			size.setHeight(max(size.height(), cellData.HeightForWidth(option.rect.width(), option.font)))
+		return size
+
+	@staticmethod
+	def GetTextColor(option: QStyleOptionViewItem) -> QColor:
+		isSelected: bool = bool(option.state & QStyle.StateFlag.State_Selected)
+		return option.palette.color(QPalette.ColorRole.HighlightedText if isSelected else QPalette.ColorRole.Text)
+
+class TagBubblesItemDelegate(TableCellDataDelegate):
+	""" Paints TagBubblesCellData as rounded, colored bubbles like TagBubblesFlowWidget does with BubbleWidgets. """
+	def PaintCellData(self, painter: QPainter, option: QStyleOptionViewItem, cellData: TableCellData):
+		if not isinstance(cellData, TagBubblesCellData):
+			return
+		painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+		painter.setFont(option.font)
+		tags: list = cellData.GetTags()
+		for itemIdx, rect, text in cellData.GetLayout(option.rect.width(), option.font)[0]:
+			if itemIdx >= 0:
+				colorStr: str = tags[itemIdx].GetColor()
+				TagBubblesItemDelegate.PaintBubble(painter, rect, text, QColor(colorStr) if colorStr else None)
+			elif itemIdx == TagBubblesCellData.ITEM_OVERFLOW:
+				accentColor: QColor = QColor('#9e9e9e')
+				if themeData := GetThemeData():
+					accentColor = QColor(themeData.get('primaryColor', '#ffffff'))
+				rounding: float = TagBubblesFlowWidget.BUBBLE_ROUNDING
+				painter.setPen(QPen(accentColor, 1))
+				painter.setBrush(Qt.BrushStyle.NoBrush)
+				painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), rounding, rounding)
+				painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+			else:
+				painter.setPen(self.GetTextColor(option))
+				painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+
+	@staticmethod
+	def PaintBubble(painter: QPainter, rect: QRect, text: str, bgColor: QColor | None):
+		""" Paints a single tag bubble (same look as BubbleWidget). """
+		penWidth: int = 1
+		rounding: float = TagBubblesFlowWidget.BUBBLE_ROUNDING
+		painter.setPen(QPen(QColor('black'), penWidth))
+		painter.setBrush(bgColor if bgColor is not None else Qt.BrushStyle.NoBrush)
+		painter.drawRoundedRect(rect.adjusted(penWidth, penWidth, -penWidth, -penWidth), rounding, rounding)
+		painter.setPen(PickContrastingTextColor(bgColor))
+		painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+
+class DescNotesItemDelegate(TableCellDataDelegate):
+	""" Paints DescNotesCellData as a centered, word-wrapped label like DescNotesWidget. """
+	def PaintCellData(self, painter: QPainter, option: QStyleOptionViewItem, cellData: TableCellData):
+		if not isinstance(cellData, DescNotesCellData):
+			return
+		painter.setFont(option.font)
+		painter.setPen(self.GetTextColor(option))
+		painter.drawText(QRect(0, 0, option.rect.width(), option.rect.height()), Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, cellData.GetText())
+# endregion
 
 
 _ANCHOR_RE = re.compile(r'<a\b[^>]*>.*?</a>', re.IGNORECASE | re.DOTALL)
@@ -0,0 +1,91 @@
+from typing import Any, Optional
+
+from qavm.qavmapi import BaseDescriptor, BaseBuilder, BaseTileBuilder, BaseTableBuilder
+from qavm.manager_plugin import SoftwareHandler, UID
+
+class DescriptorsDiff(object):
+	""" Difference between two scans of the same descriptors: descriptors are matched by UID and compared by
+	fingerprint (BaseDescriptor.GetFingerprint). The resulting descriptors list keeps the order of the new scan, but
+	reuses the old instances of unchanged descriptors, so that views can patch themselves by identity: unchanged
+	descriptors are the very same objects, changed ones are new objects with an already known UID. """
+	def __init__(self, oldDescs: list[BaseDescriptor], newDescs: list[BaseDescriptor]):
+		self.descs: list[BaseDescriptor] = []
+		self.added: list[BaseDescriptor] = []
+		self.changed: list[tuple[BaseDescriptor, BaseDescriptor]] = []  # (old, new)
+		self.removed: list[BaseDescriptor] = []
+
+		oldDescsByUID: dict[str, BaseDescriptor] = {desc.GetUID(): desc for desc in oldDescs}
+		for desc in newDescs:
+			oldDesc: BaseDescriptor | None = oldDescsByUID.pop(desc.GetUID(), None)
+			if oldDesc is None:
+				self.added.append(desc)
+			elif oldDesc.GetFingerprint() == desc.GetFingerprint():
+				desc = oldDesc
+			else:
+				self.changed.append((oldDesc, desc))
+			self.descs.append(desc)
+		self.removed = list(oldDescsByUID.values())
+
+	def IsEmpty(self) -> bool:
+		return not self.added and not self.changed and not self.removed
+
+	def __str__(self) -> str:
+		return f'{len(self.added)} added, {len(self.changed)} changed, {len(self.removed)} removed'
+
+class ProcessedDescriptorsCache(object):
+	""" Caches the descriptors the views are built from, i.e. the results of BaseBuilder.ProcessDescriptors, per view
+	and descriptor type. A result is reused as long as the scanned descriptors list is the same object (a rescan that
+	finds no differences keeps it, see QAVMApp.LoadSoftwareDescriptors) and the builder settings the view depends on
+	haven't changed (see BaseSettings.GetTileSettingsVersion/GetTableSettingsVersion). """
+	def __init__(self):
+		self.descTypes: dict[str, Optional[str]] = dict()  # descriptor data path -> descriptor type
+		# (swHandler, viewUID, builder class) -> (settings state, supported descriptor types, {descType: (scanned descs, processed descs)})
+		self.entries: dict[tuple, tuple[tuple, list[str], dict[str, tuple[list[BaseDescriptor], list[BaseDescriptor]]]]] = dict()
+
+	def GetSupportedDescriptorTypes(self, swHandler: SoftwareHandler, viewUID: str, builder: BaseBuilder) -> list[str]:
+		return self._getEntry(swHandler, viewUID, builder)[1]
+
+	def GetDescriptors(self, swHandler: SoftwareHandler, viewUID: str, builder: BaseBuilder, descsMap: dict[str, list[BaseDescriptor]]) -> list[BaseDescriptor]:
+		""" Returns the descriptors of the scan result descsMap processed by the builder of the view. """
+		_, supportedDescTypes, processedDescsMap = self._getEntry(swHandler, viewUID, builder)
+		descs: list[BaseDescriptor] = []
+		for descDPath, descsCur in descsMap.items():
+			descType: Optional[str] = self._getDescriptorType(descDPath)
+			if descType not in supportedDescTypes:
+				continue
+			scannedDescs, processedDescs = processedDescsMap.get(descType, (None, None))
+			if scannedDescs is not descsCur:
+				processedDescs = builder.ProcessDescriptors(descType, descsCur)
+				processedDescsMap[descType] = (descsCur, processedDescs)
+			descs.extend(processedDescs)
+		return descs
+
+	def Clear(self) -> None:
+		self.entries = dict()
+
+	def _getEntry(self, swHandler: SoftwareHandler, viewUID: str, builder: BaseBuilder) -> tuple:
+		entryKey: tuple = (swHandler, viewUID, builder.__class__)
+		settingsState: tuple = self._getSettingsState(builder)
+		entry = self.entries.get(entryKey)
+		if entry is None or entry[0] != settingsState:
+			# TODO: consider having some more understandable scheme for fetching descriptor types from dataPaths
+			descTypes: list[str] = [t for t in map(self._getDescriptorType, swHandler.GetDescriptorClasses().keys()) if t]
+			entry = (settingsState, builder.GetSupportedDescriptorTypes(descTypes), dict())
+			self.entries[entryKey] = entry
+		return entry
+
+	def _getDescriptorType(self, descDPath: str) -> Optional[str]:
+		if descDPath not in self.descTypes:
+			self.descTypes[descDPath] = UID.DataPathGetLastPart(descDPath)
+		return self.descTypes[descDPath]
+
+	@staticmethod
+	def _getSettingsState(builder: BaseBuilder) -> tuple[Any, int, int]:
+		""" The settings object is a part of the state, since reloaded software settings start counting versions anew. """
+		if builder.settings is None:
+			return (None, 0, 0)
+		isTileBuilder: bool = not isinstance(builder, BaseTableBuilder)
+		isTableBuilder: bool = not isinstance(builder, BaseTileBuilder)
+		return (builder.settings,
+				builder.settings.GetTileSettingsVersion() if isTileBuilder else 0,
+				builder.settings.GetTableSettingsVersion() if isTableBuilder else 0)
@@ -1,5 +1,6 @@
 import math
 import random
+from bisect import bisect_left, bisect_right
 
 from PyQt6.QtCore import Qt, QSize, QRect, QPoint, QPropertyAnimation, pyqtSignal
 from PyQt6.QtGui import QColor, QPainter, QPaintEvent, QPen, QFont
@@ -8,11 +9,23 @@ from PyQt6.QtWidgets import QLabel, QLayout, QWidget, QWidgetItem
 # Copied from experiments on 26th of June 2024
 # FlowLayout implementation is taken from https://stackoverflow.com/a/41643802/5765191 and modified
 class FlowLayout(QLayout):
+	""" Item size hints are cached and positions are computed by a FlowGrid: only the items from the first changed one
+	on are laid out again, only the items that moved get a new geometry, and heightForWidth is memoized per width. """
+	HEIGHT_FOR_WIDTH_CACHE_SIZE: int = 8
+
 	def __init__(self, parent=None, margin=0, hspacing=0, vspacing=0):
 		super(FlowLayout, self).__init__(parent)
 		self._hspacing = hspacing
 		self._vspacing = vspacing
 		self._items = []
+		self._sizeHints: list[QSize] = []  # cached item.sizeHint() per item
+		self._sizeHintsDirty: bool = False  # set by invalidate(): some item's size hint may have changed
+		self._dirtyFrom: int = 0  # first item whose position may have changed since the last layout
+		self._grid: FlowGrid = FlowGrid(0, hspacing, vspacing)  # positions relative to the contents rect
+		self._appliedRects: list[QRect | None] = []  # geometry last set on each item
+		self._appliedOrigin: QPoint | None = None
+		self._heightForWidthCache: dict[int, int] = dict()
+		self._minimumSize: QSize | None = None
 
 		self.setContentsMargins(margin, margin, margin, margin)
 
@@ -21,12 +34,18 @@ class FlowLayout(QLayout):
 	
 	def insertWidget(self, index: int, widget: QWidget):
 		self.addWidget(widget)
-		last = self._items.pop()
-		self._items.insert(index, last)
+		index = max(0, min(index, len(self._items) - 1))
+		self._items.insert(index, self._items.pop())
+		self._sizeHints.insert(index, self._sizeHints.pop())
+		self._appliedRects.insert(index, self._appliedRects.pop())
+		self._markDirty(index)
 		self.update()
 
 	def addItem(self, item):
 		self._items.append(item)
+		self._sizeHints.append(item.sizeHint())
+		self._appliedRects.append(None)
+		self._markDirty(len(self._items) - 1)
 
 	def horizontalSpacing(self):
 		return self._hspacing
@@ -43,8 +62,17 @@ class FlowLayout(QLayout):
 
 	def takeAt(self, index):
 		if 0 <= index < len(self._items):
+			del self._sizeHints[index]
+			del self._appliedRects[index]
+			self._markDirty(index)
 			return self._items.pop(index)
 
+	def invalidate(self):
+		self._sizeHintsDirty = True
+		self._heightForWidthCache.clear()
+		self._minimumSize = None
+		super(FlowLayout, self).invalidate()
+
 	def expandingDirections(self):
 		return Qt.Orientations(0)
 
@@ -52,7 +80,12 @@ class FlowLayout(QLayout):
 		return True
 
 	def heightForWidth(self, width):
-		return self.doLayout(QRect(0, 0, width, 0), testonly=True)
+		self._refreshSizeHints()
+		if (height := self._heightForWidthCache.get(width)) is None:
+			if len(self._heightForWidthCache) >= self.HEIGHT_FOR_WIDTH_CACHE_SIZE:
+				self._heightForWidthCache.clear()
+			height = self._heightForWidthCache[width] = self.doLayout(QRect(0, 0, width, 0), testonly=True)
+		return height
 
 	def setGeometry(self, rect):
 		super(FlowLayout, self).setGeometry(rect)
@@ -62,33 +95,150 @@ class FlowLayout(QLayout):
 		return self.minimumSize()
 
 	def minimumSize(self):
-		size = QSize()
-		for item in self._items:
-			size = size.expandedTo(item.minimumSize())
-		left, top, right, bottom = self.getContentsMargins()
-		size += QSize(left + right, top + bottom)
-		return size
+		if self._minimumSize is None:
+			size = QSize()
+			for item in self._items:
+				size = size.expandedTo(item.minimumSize())
+			left, top, right, bottom = self.getContentsMargins()
+			self._minimumSize = size + QSize(left + right, top + bottom)
+		return self._minimumSize
 
 	def doLayout(self, rect, testonly):
+		self._refreshSizeHints()
 		left, top, right, bottom = self.getContentsMargins()
 		effective = rect.adjusted(+left, +top, -right, -bottom)
-		x = effective.x()
-		y = effective.y()
-		lineheight = 0
-		for item in self._items:
-			hspace = self.horizontalSpacing()
-			vspace = self.verticalSpacing()
-			nextX = x + item.sizeHint().width() + hspace
-			if nextX - hspace > effective.right() and lineheight > 0:
-				x = effective.x()
-				y = y + lineheight + vspace
-				nextX = x + item.sizeHint().width() + hspace
-				lineheight = 0
-			if not testonly:
-				item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
-			x = nextX
-			lineheight = max(lineheight, item.sizeHint().height())
-		return y + lineheight - rect.y() + bottom
+		isGridValid: bool = effective.width() == self._grid.GetLayoutWidth()
+		if testonly:
+			if isGridValid and self._dirtyFrom >= len(self._items):
+				return self._grid.GetHeight() + top + bottom
+			return FlowGrid(0, self._hspacing, self._vspacing).Layout(self._sizeHints, effective.width()) + top + bottom
+
+		fromIndex: int = self._dirtyFrom if isGridValid else 0
+		self._grid.Layout(self._sizeHints, effective.width(), fromIndex)
+		self._dirtyFrom = len(self._items)
+		if effective.topLeft() != self._appliedOrigin:
+			self._appliedOrigin = effective.topLeft()
+			fromIndex = 0
+		for index in range(fromIndex, len(self._items)):
+			itemRect: QRect = self._grid.GetItemRect(index).translated(self._appliedOrigin)
+			if itemRect != self._appliedRects[index]:
+				self._items[index].setGeometry(itemRect)
+				self._appliedRects[index] = itemRect
+		return self._grid.GetHeight() + top + bottom
+
+	def _markDirty(self, index: int):
+		self._dirtyFrom = min(self._dirtyFrom, index)
+		self._heightForWidthCache.clear()
+		self._minimumSize = None
+
+	def _refreshSizeHints(self):
+		""" Re-reads the item size hints after an invalidate() and marks the items from the first changed one dirty. """
+		if not self._sizeHintsDirty:
+			return
+		self._sizeHintsDirty = False
+		for index, item in enumerate(self._items):
+			sizeHint: QSize = item.sizeHint()
+			if sizeHint != self._sizeHints[index]:
+				self._sizeHints[index] = sizeHint
+				self._markDirty(index)
+
+class FlowGrid(object):
+	""" Flow (wrapping) positions of items computed arithmetically from their sizes, wrapping exactly like FlowLayout.
+	Lets views place and query items (e.g. the ones intersecting the viewport) without instantiating them. """
+	def __init__(self, margin: int = 0, hspacing: int = 0, vspacing: int = 0):
+		self.margin: int = margin
+		self.hspacing: int = hspacing
+		self.vspacing: int = vspacing
+
+		self._sizes: list[QSize] = []
+		self._positions: list[QPoint] = []
+		self._rowTops: list[int] = []
+		self._rowBottoms: list[int] = []
+		self._rowRights: list[int] = []
+		self._rowFirstItems: list[int] = []  # index of the first item of each row
+		self._layoutWidth: int = -1
+		self._width: int = 0
+		self._height: int = 0
+
+	def Layout(self, sizes: list[QSize], width: int, fromIndex: int = 0) -> int:
+		""" Lays the items out for the given total width and returns the total height. If the width is the same as
+		in the last layout and only the items from fromIndex on changed, the rows before that item are kept. """
+		firstRow: int = 0
+		if width == self._layoutWidth and fromIndex > 0 and self._rowFirstItems:
+			fromIndex = min(fromIndex, len(self._positions))
+			firstRow = bisect_right(self._rowFirstItems, fromIndex) - 1
+			if firstRow > 0 and self._rowFirstItems[firstRow] == fromIndex:
+				firstRow -= 1  # the item wrapped because it didn't fit the previous row, which it might now
+		firstItem: int = self._rowFirstItems[firstRow] if firstRow > 0 else 0
+		y: int = self._rowBottoms[firstRow - 1] + self.vspacing if firstRow > 0 else self.margin
+		for rowList in (self._rowTops, self._rowBottoms, self._rowRights, self._rowFirstItems):
+			del rowList[firstRow:]
+		del self._positions[firstItem:]
+		self._sizes = list(sizes)
+		self._layoutWidth = width
+
+		right: int = width - self.margin - 1
+		x: int = self.margin
+		lineHeight: int = 0
+		rowRight: int = 0
+		for index in range(firstItem, len(self._sizes)):
+			size: QSize = self._sizes[index]
+			if index == firstItem:
+				self._rowTops.append(y)
+				self._rowFirstItems.append(index)
+			elif x + size.width() > right and lineHeight > 0:
+				self._rowBottoms.append(y + lineHeight)
+				self._rowRights.append(rowRight)
+				x = self.margin
+				y += lineHeight + self.vspacing
+				lineHeight = 0
+				rowRight = 0
+				self._rowTops.append(y)
+				self._rowFirstItems.append(index)
+			self._positions.append(QPoint(x, y))
+			rowRight = max(rowRight, x + size.width())
+			x += size.width() + self.hspacing
+			lineHeight = max(lineHeight, size.height())
+		if firstItem < len(self._sizes):
+			self._rowBottoms.append(y + lineHeight)
+			self._rowRights.append(rowRight)
+		self._width = max(self._rowRights, default=0) + self.margin
+		self._height = (self._rowBottoms[-1] if self._rowBottoms else self.margin) + self.margin
+		return self._height
+
+	def GetLayoutWidth(self) -> int:
+		""" Returns the width of the last layout (-1 before the first one). """
+		return self._layoutWidth
+
+	def GetWidth(self) -> int:
+		""" Returns the width actually needed by the items (wider than the layout width if an item doesn't fit). """
+		return self._width
+
+	def GetHeight(self) -> int:
+		return self._height
+
+	def GetItemRect(self, index: int) -> QRect:
+		return QRect(self._positions[index], self._sizes[index])
+
+	def GetItemAt(self, pos: QPoint) -> int:
+		""" Returns the index of the item at the position, or -1. """
+		row: int = bisect_right(self._rowTops, pos.y()) - 1
+		if row < 0 or pos.y() >= self._rowBottoms[row]:
+			return -1
+		lastItem: int = self._rowFirstItems[row + 1] if row + 1 < len(self._rowFirstItems) else len(self._sizes)
+		for index in range(self._rowFirstItems[row], lastItem):
+			if self.GetItemRect(index).contains(pos):
+				return index
+		return -1
+
+	def GetItemsInRange(self, top: int, bottom: int) -> range:
+		""" Returns the indices of the items on the rows intersecting the vertical range [top, bottom]. """
+		firstRow: int = bisect_left(self._rowBottoms, top)
+		lastRow: int = bisect_right(self._rowTops, bottom) - 1
+		if firstRow > lastRow:
+			return range(0)
+		lastItem: int = self._rowFirstItems[lastRow + 1] if lastRow + 1 < len(self._rowFirstItems) else len(self._sizes)
+		return range(self._rowFirstItems[firstRow], lastItem)
 
 # Copied from experiments on 26th of June 2024
 # Bubble implementation is taken from https://stackoverflow.com/a/18069897 and modified
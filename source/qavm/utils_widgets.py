@@ -135,7 +135,7 @@ def PopulateContextMenuTagsAndNotes(menu: QMenu, desc: BaseDescriptor, mainWindo
 			mainWindow.tagsManager.DeleteTag(tag)
 
 	descData: DescriptorDataImpl = mainWindow.descDataManager.GetDescriptorData(desc)
-	descTagsUIDs: list[str] = descData.tags
+	descTagsUIDs: tuple[str, ...] = descData.tags
 
 	tagsMenu: ClickableSubmenuMenu = ClickableSubmenuMenu("Tags", parent)
 
@@ -151,10 +151,11 @@ def PopulateContextMenuTagsAndNotes(menu: QMenu, desc: BaseDescriptor, mainWindo
 
 	# 'Assign' submenu: all tags assignable in the current context that aren't already assigned.
 	assignSubMenu: QMenu = QMenu("Assign", tagsMenu)
+	applicableTagUIDs: set[str] = mainWindow.tagsManager.GetApplicableTagUIDs(pluginID, softwareID, viewUID)
 	for tag in mainWindow.tagsManager.GetTags().values():
 		if tag.GetUID() in descTagsUIDs:
 			continue
-		if not tag.IsApplicableInContext(pluginID, softwareID, viewUID):
+		if tag.GetUID() not in applicableTagUIDs:
 			continue
 		assignSubMenu.addAction(QAction(tag.GetName(), parent, triggered=partial(assignTag, tag)))
 	assignSubMenu.setEnabled(not assignSubMenu.isEmpty())
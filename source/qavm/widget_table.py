@@ -1,10 +1,16 @@
 import os  # TODO: Get rid of os.path in favor of pathlib
+import time
 from pathlib import Path
-from functools import partial
+from functools import partial, cmp_to_key
 from typing import Type, Optional
 
-from PyQt6.QtCore import Qt, QMargins, QPoint, QRect, pyqtSignal, QTimer
-from PyQt6.QtGui import QAction, QIcon, QKeySequence, QCursor, QColor, QBrush, QPainter, QPen, QPolygon, QMouseEvent, QPaintEvent
+from PyQt6.QtCore import (
+	Qt, QMargins, QPoint, QRect, pyqtSignal, QTimer, QAbstractTableModel, QAbstractItemModel, QModelIndex, QPersistentModelIndex,
+	QSortFilterProxyModel, QEvent, QMimeData,
+)
+from PyQt6.QtGui import (
+	QAction, QIcon, QKeySequence, QCursor, QColor, QBrush, QPainter, QPen, QPolygon, QMouseEvent, QPaintEvent, QDrag, QPixmap,
+)
 from PyQt6.QtWidgets import (
 	QMainWindow, QWidget, QLabel, QTabWidget, QScrollArea, QStatusBar, QTableWidgetItem, QTableWidget,
 	QHeaderView, QMenu, QMenuBar, QStyledItemDelegate, QApplication, QAbstractItemView, QMessageBox,
@@ -16,16 +22,22 @@ from qavm.manager_plugin import PluginManager, SoftwareHandler, UID, QAVMWorkspa
 from qavm.manager_settings import SettingsManager, QAVMGlobalSettings
 from qavm.manager_descriptor_data import DescriptorDataManager, DescriptorDataImpl
 from qavm.manager_tags import TagsManager, BaseTagImpl
+from qavm.manager_async_values import AsyncValuesLoader
 
 from qavm.window_note_editor import NoteEditorDialog
+from qavm.window_tag_editor import OpenTagEditorDialog
 from qavm.window_about import AboutDialog
 
 from qavm.qavmapi import (
 	BaseDescriptor, BaseSettings, BaseTileBuilder, BaseTableBuilder,
-	BaseCustomView, SoftwareBaseSettings, BaseMenuItem, BaseBuilder, TableColumnInfo
+	BaseCustomView, SoftwareBaseSettings, BaseMenuItem, BaseBuilder, TableColumnInfo, AsyncValue,
 )
 from qavm.qavmapi.utils import PlatformMacOS, PlatformWindows, PlatformLinux
-from qavm.qavmapi.gui import TagBubblesFlowWidget, GetThemeData, IsThemeDark
+from qavm.qavmapi.gui import (
+	TagBubblesFlowWidget, GetThemeData, IsThemeDark, HoverFadeTooltipMixin, TableCellData, TableCellDataDelegate, TagBubblesCellData,
+	TagBubblesItemDelegate, ComputeTagDropIndex, BuildReorderedTagUIDs, PromptUnassignTag, TABLE_ROLE_DESCRIPTOR_INDEX, TABLE_ROLE_CELL_DATA,
+	TABLE_ROLE_SORT_KEY, TAG_SOURCE_DESC_MIME_TYPE,
+)
 from qavm.utils_gui import FlowLayout
 from qavm.utils_widgets import PopulateContextMenuTagsAndNotes, AssignTagUIDToDescriptor, TAG_MIME_TYPE
 from qavm.qavm_version import GetBuildVersion, GetPackageVersion, GetQAVMVersion, GetQAVMVersionVariant
@@ -106,12 +118,11 @@ class MyTableViewHeader(QHeaderView):
 		menu = QMenu(self)
 
 		tableWidget = self.parent()
-		if not isinstance(tableWidget, QTableWidget):
+		if not isinstance(tableWidget, QTableView) or tableWidget.model() is None:
 			return
 
-		columnCount = tableWidget.columnCount() - 1  # Exclude the last column (descIdx)
-		for col in range(columnCount):
-			header_label = tableWidget.horizontalHeaderItem(col).text()
+		for col in range(tableWidget.model().columnCount()):
+			header_label = str(tableWidget.model().headerData(col, Qt.Orientation.Horizontal))
 			action = QAction(header_label, menu)
 			action.setCheckable(True)
 			action.setChecked(not tableWidget.isColumnHidden(col))
@@ -148,22 +159,520 @@ class MyTableViewHeader(QHeaderView):
 				# self.sectionClicked.emit(releasedSection)  # Emit the signal for the section clicked
 		super().mouseReleaseEvent(event)
 			
-class _CellWidgetSortItem(QTableWidgetItem):
-	""" Invisible placeholder item placed under a cell widget. Provides a stable sort key for the
-	column while displaying no text, so nothing renders behind a transparent cell widget. """
-	def __init__(self, sortKey: str):
-		super().__init__('')
-		self._sortKey: str = sortKey
-
-	def __lt__(self, other):
-		if isinstance(other, _CellWidgetSortItem):
-			return not other._sortKey or self._sortKey < other._sortKey
-		elif isinstance(other, QTableWidgetItem):
-			return not other.text() or self._sortKey < other.text()
-		return super().__lt__(other)
+class DescriptorTableModel(QAbstractTableModel):
+	""" Table model over a list of descriptors, one row per descriptor (row == descriptor index, rows never move)
+	and one column per TableColumnInfo. Sorting is done by DescriptorTableProxyModel on TABLE_ROLE_SORT_KEY.
+
+	Cell values are produced by the column's cellDataGetter only when a cell is first requested (i.e. when
+	it becomes visible or is sorted by) and cached until the descriptor's data is updated. Plain values are
+	served as DisplayRole, QTableWidgetItem results (e.g. NumberTableWidgetItem) forward every role to the
+	item. TableCellData results (tag bubbles, notes) are served as TABLE_ROLE_CELL_DATA for the column's
+	delegate to paint ("painted columns"). Columns whose getter returns a QWidget are "widget columns": the
+	model serves no data for them and the view places the widgets as index widgets for visible rows only
+	(see CreateCellWidget).
+
+	Sort keys are computed once per descriptor and column: native numbers or strings when the whole column
+	provides them (see _nativeSortKey), otherwise ranks from ordering the column once by the items' __lt__.
+
+	On a rescan the rows are patched (UpdateDescriptors) rather than the model rebuilt: only removed, replaced and
+	appended descriptors lose or get their rows and cached values. Likewise, a settings change only drops the cached
+	values of the columns depending on it (InvalidateColumns).
+
+	Hidden and expensive columns (TableColumnInfo.isExpensive) are not probed, their kind is detected once they are
+	first evaluated. The cells of expensive columns are served as a placeholder when first requested and computed
+	on the following event loop ticks, within a time budget per tick (see pendingCellsFilled); sorting by such a
+	column still evaluates it right away.
+
+	Getters may also return an AsyncValue: its placeholder is cached like a value, and the cell is re-evaluated
+	once the AsyncValuesLoader has computed the result (without one, it is computed right away). """
+	EMPTY_SORT_KEY: str = '\uffff'  # widget/painted cells with an empty sort key go last in ascending order
+	PENDING_CELL_TEXT: str = '…'  # shown in the cells of expensive columns until they are computed
+	PENDING_CELLS_BUDGET_MS: int = 20  # time spent computing pending cells per event loop tick
+	columnKindsChanged = pyqtSignal()
+	pendingCellsFilled = pyqtSignal(object)  # (set[int]) descIdxs whose pending or async cells got computed
+
+	def __init__(self, descs: list[BaseDescriptor], tableInfos: list[TableColumnInfo], parent=None, hiddenColumns: set[int] = frozenset(),
+			  asyncValuesLoader: AsyncValuesLoader | None = None):
+		super().__init__(parent)
+		self._descs: list[BaseDescriptor] = list(descs)
+		self._tableInfos: list[TableColumnInfo] = tableInfos
+		self._descToIdx: dict[BaseDescriptor, int] = {desc: descIdx for descIdx, desc in enumerate(self._descs)}
+		self._descUIDs: list[str] | None = None  # descIdx -> descriptor UID, built on first use
+		self._descUIDToIdx: dict[str, int] | None = None  # descriptor UID -> descIdx, built along with _descUIDs
+		self._cellValues: dict[tuple[int, int], str | QTableWidgetItem | TableCellData] = dict()  # (descIdx, col) -> value
+		self._widgetSortKeys: dict[tuple[int, int], str] = dict()  # (descIdx, col) -> sort key of a widget cell
+		self._sortKeys: dict[tuple[int, int], int | float | str] = dict()  # (descIdx, col) -> sort key
+		self._columnSortKeyTypes: dict[int, type | None] = dict()  # col -> int/float (numbers), str, or None (ranks)
+		self._widgetColumns: set[int] = set()
+		self._paintedColumns: dict[int, type[TableCellData]] = dict()  # col -> TableCellData subclass
+		self._hiddenColumns: set[int] = set(hiddenColumns)
+		self._expensiveColumns: set[int] = {col for col, tableInfo in enumerate(tableInfos) if tableInfo.isExpensive}
+		self._pendingCells: dict[tuple[int, int], None] = dict()  # (descIdx, col) of expensive cells to compute, in request order
+		self._pendingCellsTimer: QTimer = QTimer(self)
+		self._pendingCellsTimer.setSingleShot(True)
+		self._pendingCellsTimer.timeout.connect(self._fillPendingCells)
+		self._asyncValuesLoader: AsyncValuesLoader | None = asyncValuesLoader
+		self._asyncCells: dict[str, tuple[BaseDescriptor, set[int]]] = dict()  # descUID -> (descriptor, cols showing a placeholder)
+		if asyncValuesLoader is not None:
+			asyncValuesLoader.asyncValuesReady.connect(self._onAsyncValuesReady)
+		self._probeColumnKinds()
+
+	def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self._descs)
+
+	def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self._tableInfos)
+
+	def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+		if not index.isValid():
+			return Qt.ItemFlag.NoItemFlags
+		return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+	def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+		if orientation == Qt.Orientation.Vertical:
+			return section + 1 if role == Qt.ItemDataRole.DisplayRole else None
+		if not (0 <= section < len(self._tableInfos)):
+			return None
+		if role == Qt.ItemDataRole.DisplayRole:
+			return self._tableInfos[section].title
+		if role == Qt.ItemDataRole.ToolTipRole:
+			return self._tableInfos[section].tooltip or None
+		return None
+
+	def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+		if not index.isValid():
+			return None
+		descIdx: int = index.row()
+		if role == TABLE_ROLE_DESCRIPTOR_INDEX:
+			return descIdx
+		col: int = index.column()
+		if role == TABLE_ROLE_SORT_KEY:
+			return self._getSortKey(descIdx, col)
+		if col in self._widgetColumns:
+			return None
+		if col in self._expensiveColumns and (descIdx, col) not in self._cellValues:
+			self._pendingCells[(descIdx, col)] = None
+			if not self._pendingCellsTimer.isActive():
+				self._pendingCellsTimer.start(0)  # after the current paint
+			return self.PENDING_CELL_TEXT if role == Qt.ItemDataRole.DisplayRole else None
+		value: str | QTableWidgetItem | TableCellData | None = self._getCellValue(descIdx, col)
+		if isinstance(value, TableCellData):
+			return value if role == TABLE_ROLE_CELL_DATA else None
+		if isinstance(value, QTableWidgetItem):
+			return value.data(role)
+		if role == Qt.ItemDataRole.DisplayRole:
+			return value
+		return None
+
+	def GetDescriptor(self, descIdx: int) -> BaseDescriptor | None:
+		return self._descs[descIdx] if 0 <= descIdx < len(self._descs) else None
+
+	def GetDescriptorIndexOf(self, desc: BaseDescriptor) -> int:
+		return self._descToIdx.get(desc, -1)
+
+	def GetDescriptorUIDs(self) -> list[str]:
+		""" Returns the descriptor UIDs by descIdx. The list is kept up to date in place as rows are appended. """
+		if self._descUIDs is None:
+			self._descUIDs = [desc.GetUID() for desc in self._descs]
+			self._descUIDToIdx = {descUID: descIdx for descIdx, descUID in enumerate(self._descUIDs)}
+		return self._descUIDs
+
+	def GetDescriptorIndexOfUID(self, descUID: str) -> int:
+		if self._descUIDToIdx is None:
+			self.GetDescriptorUIDs()
+		return self._descUIDToIdx.get(descUID, -1)
+
+	def AppendDescriptors(self, descs: list[BaseDescriptor]):
+		""" Appends rows for new descriptors; already present descriptors are skipped. """
+		descs = [desc for desc in dict.fromkeys(descs) if desc not in self._descToIdx]
+		if not descs:
+			return
+		firstRow: int = len(self._descs)
+		self.beginInsertRows(QModelIndex(), firstRow, firstRow + len(descs) - 1)
+		for desc in descs:
+			self._descToIdx[desc] = len(self._descs)
+			self._descs.append(desc)
+			if self._descUIDs is not None:
+				self._descUIDToIdx[desc.GetUID()] = len(self._descUIDs)
+				self._descUIDs.append(desc.GetUID())
+		for col, sortKeyType in list(self._columnSortKeyTypes.items()):
+			if sortKeyType is None:
+				self._invalidateColumnSortKeys(col)  # ranks are relative to the whole column
+		self.endInsertRows()
+
+	def UpdateDescriptors(self, descs: list[BaseDescriptor]) -> list[int]:
+		""" Patches the rows to show the given descriptors: the rows of descriptors no longer present are removed, a new
+		object with the UID of a present descriptor replaces it in its row (see DescriptorsDiff) and new descriptors
+		are appended. Returns the descIdxs of the replaced descriptors. """
+		descsByUID: dict[str, BaseDescriptor] = {desc.GetUID(): desc for desc in descs}
+		descUIDs: list[str] = self.GetDescriptorUIDs()
+		self._removeRows([descIdx for descIdx, descUID in enumerate(descUIDs) if descUID not in descsByUID])
+		replacedDescIdxs: list[int] = []
+		for descIdx, descUID in enumerate(descUIDs):
+			if (desc := descsByUID[descUID]) is not self._descs[descIdx]:
+				del self._descToIdx[self._descs[descIdx]]
+				self._descs[descIdx] = desc
+				self._descToIdx[desc] = descIdx
+				self.InvalidateDescriptor(descIdx)
+				replacedDescIdxs.append(descIdx)
+		self.AppendDescriptors([desc for desc in descs if desc not in self._descToIdx])
+		return replacedDescIdxs
+
+	def _removeRows(self, descIdxs: list[int]):
+		""" Removes the rows of the given descriptors; the cached values of the rows after them move up accordingly. """
+		if not descIdxs:
+			return
+		removedDescIdxs: set[int] = set(descIdxs)
+		ranges: list[tuple[int, int]] = []  # (first, last) rows of consecutive removed descriptors
+		for descIdx in sorted(removedDescIdxs):
+			if ranges and ranges[-1][1] == descIdx - 1:
+				ranges[-1] = (ranges[-1][0], descIdx)
+			else:
+				ranges.append((descIdx, descIdx))
+		newDescIdxs: list[int] = []  # old descIdx -> new descIdx (-1 if removed)
+		removedCount: int = 0
+		for descIdx in range(len(self._descs)):
+			if descIdx in removedDescIdxs:
+				newDescIdxs.append(-1)
+				removedCount += 1
+			else:
+				newDescIdxs.append(descIdx - removedCount)
+
+		for first, last in reversed(ranges):  # from the end, so that the earlier rows stay where they are
+			self.beginRemoveRows(QModelIndex(), first, last)
+			del self._descs[first:last + 1]
+			if self._descUIDs is not None:
+				del self._descUIDs[first:last + 1]
+			self.endRemoveRows()
+		self._descToIdx = {desc: descIdx for descIdx, desc in enumerate(self._descs)}
+		if self._descUIDs is not None:
+			self._descUIDToIdx = {descUID: descIdx for descIdx, descUID in enumerate(self._descUIDs)}
+		self._pendingCells = {(newDescIdxs[descIdx], col): None for descIdx, col in self._pendingCells if newDescIdxs[descIdx] >= 0}
+		self._cellValues = {(newDescIdxs[descIdx], col): value for (descIdx, col), value in self._cellValues.items() if newDescIdxs[descIdx] >= 0}
+		self._widgetSortKeys = {(newDescIdxs[descIdx], col): value for (descIdx, col), value in self._widgetSortKeys.items() if newDescIdxs[descIdx] >= 0}
+		self._sortKeys = {(newDescIdxs[descIdx], col): value for (descIdx, col), value in self._sortKeys.items() if newDescIdxs[descIdx] >= 0}  # ranks keep their order
+
+	def GetWidgetColumns(self) -> list[int]:
+		return sorted(self._widgetColumns)
+
+	def GetPaintedColumns(self) -> dict[int, type[TableCellData]]:
+		return dict(self._paintedColumns)
+
+	def IsExpensiveColumn(self, col: int) -> bool:
+		return col in self._expensiveColumns
+
+	def SetColumnHidden(self, col: int, hidden: bool):
+		""" Hidden columns aren't probed (see InvalidateColumns), the view requests no data for them anyway. """
+		if hidden:
+			self._hiddenColumns.add(col)
+		else:
+			self._hiddenColumns.discard(col)
+
+	def CreateCellWidget(self, descIdx: int, col: int) -> QWidget | None:
+		""" Calls the column's cellDataGetter to build a fresh widget for a widget cell; the caller takes ownership. """
+		value = self._callCellDataGetter(descIdx, col)
+		if not isinstance(value, QWidget):
+			return None
+		self._widgetSortKeys[(descIdx, col)] = self._widgetSortKey(value)
+		return value
+
+	def InvalidateDescriptor(self, descIdx: int):
+		""" Drops the cached cell values of a descriptor (e.g. after its data was updated) and refreshes its row. """
+		self.InvalidateDescriptors([descIdx])
+
+	def InvalidateDescriptors(self, descIdxs: list[int]):
+		""" Same as InvalidateDescriptor for a batch of descriptors: rank columns are invalidated once for the whole
+		batch and the rows are refreshed by ranges of consecutive rows. """
+		descIdxs = sorted({descIdx for descIdx in descIdxs if 0 <= descIdx < len(self._descs)})
+		if not descIdxs:
+			return
+		for col in range(len(self._tableInfos)):
+			isRanksColumn: bool = self._columnSortKeyTypes.get(col, int) is None
+			for descIdx in descIdxs:
+				self._cellValues.pop((descIdx, col), None)
+				self._widgetSortKeys.pop((descIdx, col), None)
+				if not isRanksColumn:
+					self._sortKeys.pop((descIdx, col), None)
+			if isRanksColumn:
+				self._invalidateColumnSortKeys(col)  # ranks are relative to the whole column
+		first: int = descIdxs[0]
+		for pos, descIdx in enumerate(descIdxs):
+			if pos + 1 == len(descIdxs) or descIdxs[pos + 1] != descIdx + 1:
+				self.dataChanged.emit(self.index(first, 0), self.index(descIdx, len(self._tableInfos) - 1))
+				if pos + 1 < len(descIdxs):
+					first = descIdxs[pos + 1]
+
+	def InvalidateColumns(self, cols: list[int]):
+		""" Drops the cached cell values of whole columns (e.g. after a setting their getters depend on changed) and
+		refreshes them; the other columns keep their cached values. """
+		cols = [col for col in cols if 0 <= col < len(self._tableInfos)]
+		if not cols or not self._descs:
+			return
+		colsSet: set[int] = set(cols)
+		self._cellValues = {key: value for key, value in self._cellValues.items() if key[1] not in colsSet}
+		self._widgetSortKeys = {key: value for key, value in self._widgetSortKeys.items() if key[1] not in colsSet}
+		columnKinds: tuple = (set(self._widgetColumns), dict(self._paintedColumns))
+		self._pendingCells = {key: None for key in self._pendingCells if key[1] not in colsSet}
+		for col in cols:
+			self._invalidateColumnSortKeys(col)
+			self._widgetColumns.discard(col)
+			self._paintedColumns.pop(col, None)
+			if not self._isLazyColumn(col):
+				self._getCellValue(0, col, notify=False)  # the getter may now return another kind of value
+		if columnKinds != (self._widgetColumns, self._paintedColumns):
+			self.columnKindsChanged.emit()
+		for col in cols:
+			self.dataChanged.emit(self.index(0, col), self.index(len(self._descs) - 1, col))
+
+	def _probeColumnKinds(self):
+		""" Detects the widget and painted columns by evaluating the first descriptor once (values are kept in the cache). """
+		if not self._descs:
+			return
+		for col in range(len(self._tableInfos)):
+			if not self._isLazyColumn(col):
+				self._getCellValue(0, col, notify=False)
+
+	def _isLazyColumn(self, col: int) -> bool:
+		return col in self._hiddenColumns or col in self._expensiveColumns
+
+	def _fillPendingCells(self):
+		""" Computes pending expensive cells until the time budget of this tick is spent, the rest on the next ticks. """
+		deadline: float = time.perf_counter() + self.PENDING_CELLS_BUDGET_MS / 1000
+		filledCells: list[tuple[int, int]] = []
+		while self._pendingCells and time.perf_counter() < deadline:
+			key: tuple[int, int] = next(iter(self._pendingCells))
+			del self._pendingCells[key]
+			if key[0] < len(self._descs):
+				self._getCellValue(*key)
+				filledCells.append(key)
+		for descIdx, col in filledCells:
+			index: QModelIndex = self.index(descIdx, col)
+			self.dataChanged.emit(index, index)
+		if filledCells:
+			self.pendingCellsFilled.emit({descIdx for descIdx, _ in filledCells})
+		if self._pendingCells:
+			self._pendingCellsTimer.start(0)
+
+	def _callCellDataGetter(self, descIdx: int, col: int):
+		cellDataGetter = self._tableInfos[col].cellDataGetter
+		value = cellDataGetter(self._descs[descIdx]) if callable(cellDataGetter) else ''
+		return self._resolveAsyncValue(descIdx, col, value) if isinstance(value, AsyncValue) else value
+
+	def _resolveAsyncValue(self, descIdx: int, col: int, asyncValue: AsyncValue):
+		desc: BaseDescriptor = self._descs[descIdx]
+		if self._asyncValuesLoader is None:
+			try:
+				return asyncValue.GetValue(asyncValue.getter())
+			except Exception as e:
+				logger.warning(f'Failed to compute async value {asyncValue.key!r} of {desc.GetUID()}: {e}')
+				return asyncValue.placeholder
+		isReady, value = self._asyncValuesLoader.Resolve(desc, asyncValue)
+		if not isReady:
+			self._asyncCells.setdefault(desc.GetUID(), (desc, set()))[1].add(col)
+			if isinstance(value, QWidget):
+				value.setProperty('async_placeholder', True)  # replaced by the view once the value is computed
+		return value
+
+	def _onAsyncValuesReady(self, descUIDs: set[str]):
+		""" Re-evaluates the cells showing the placeholder of an async value that got computed. """
+		cells: list[tuple[int, int]] = []
+		for descUID in descUIDs & self._asyncCells.keys():
+			desc, cols = self._asyncCells.pop(descUID)
+			if (descIdx := self._descToIdx.get(desc, -1)) >= 0:  # a replaced descriptor requests its own values
+				cells.extend((descIdx, col) for col in cols)
+		if not cells:
+			return
+		for key in cells:
+			self._cellValues.pop(key, None)
+			self._widgetSortKeys.pop(key, None)
+			self._sortKeys.pop(key, None)
+		for col in {col for _, col in cells}:
+			if col in self._columnSortKeyTypes and self._columnSortKeyTypes[col] is None:
+				self._invalidateColumnSortKeys(col)  # ranks are relative to the whole column
+		for descIdx, col in cells:
+			index: QModelIndex = self.index(descIdx, col)
+			self.dataChanged.emit(index, index)
+		self.pendingCellsFilled.emit({descIdx for descIdx, _ in cells})
+
+	def _getCellValue(self, descIdx: int, col: int, notify: bool = True) -> str | QTableWidgetItem | TableCellData | None:
+		key: tuple[int, int] = (descIdx, col)
+		if key in self._cellValues:
+			return self._cellValues[key]
+		value = self._callCellDataGetter(descIdx, col)
+		if isinstance(value, QWidget):
+			self._widgetSortKeys[key] = self._widgetSortKey(value)
+			value.deleteLater()
+			self._widgetColumns.add(col)
+			if notify:
+				self.columnKindsChanged.emit()
+			return None
+		if isinstance(value, TableCellData):
+			if col not in self._paintedColumns:
+				self._paintedColumns[col] = type(value)
+				if notify:
+					self.columnKindsChanged.emit()
+		elif value is not None and not isinstance(value, QTableWidgetItem):
+			value = str(value)
+		self._cellValues[key] = value
+		return value
+
+	def _getWidgetSortKey(self, descIdx: int, col: int) -> str:
+		key: tuple[int, int] = (descIdx, col)
+		if key not in self._widgetSortKeys:
+			widget = self._callCellDataGetter(descIdx, col)
+			self._widgetSortKeys[key] = self._widgetSortKey(widget) if isinstance(widget, QWidget) else ''
+			if isinstance(widget, QWidget):
+				widget.deleteLater()
+		return self._widgetSortKeys[key]
+
+	@staticmethod
+	def _widgetSortKey(widget: QWidget) -> str:
+		getSortKey = getattr(widget, 'GetSortKey', None)
+		return str(getSortKey()) if callable(getSortKey) else ''
+
+	def _getSortValue(self, descIdx: int, col: int) -> str | QTableWidgetItem | TableCellData | None:
+		return self._getWidgetSortKey(descIdx, col) if col in self._widgetColumns else self._getCellValue(descIdx, col)
+
+	def _getSortKey(self, descIdx: int, col: int) -> int | float | str:
+		key: tuple[int, int] = (descIdx, col)
+		if key in self._sortKeys:
+			return self._sortKeys[key]
+		if col in self._columnSortKeyTypes:
+			# Only this cell was invalidated: keep the column's native keys if the new one is of the same kind
+			sortKey = self._nativeSortKey(self._getSortValue(descIdx, col), self._isEmptyLastColumn(col))
+			if sortKey is not None and self._sortKeyType(sortKey) is self._columnSortKeyTypes[col]:
+				self._sortKeys[key] = sortKey
+				return sortKey
+			self._invalidateColumnSortKeys(col)
+		self._computeColumnSortKeys(col)
+		return self._sortKeys[key]
+
+	def _computeColumnSortKeys(self, col: int):
+		""" Computes the sort keys of the whole column at once, as sorting requests all of them anyway. """
+		emptyLast: bool = self._isEmptyLastColumn(col)
+		values: list = [self._getSortValue(descIdx, col) for descIdx in range(len(self._descs))]
+		sortKeys: list = [self._nativeSortKey(value, emptyLast) for value in values]
+		sortKeyTypes: set[type | None] = {self._sortKeyType(sortKey) if sortKey is not None else None for sortKey in sortKeys}
+		if None in sortKeyTypes or len(sortKeyTypes) > 1:
+			# No common native key: order the column once by the values' own ordering (__lt__) and use the ranks
+			def compare(descIdxA: int, descIdxB: int) -> int:
+				if DescriptorTableModel._lessThan(values[descIdxA], values[descIdxB], emptyLast):
+					return -1
+				return 1 if DescriptorTableModel._lessThan(values[descIdxB], values[descIdxA], emptyLast) else 0
+
+			order: list[int] = sorted(range(len(values)), key=cmp_to_key(compare))
+			rank: int = 0
+			for pos, descIdx in enumerate(order):
+				if pos > 0 and compare(order[pos - 1], descIdx) != 0:
+					rank = pos
+				sortKeys[descIdx] = rank
+			self._columnSortKeyTypes[col] = None
+		else:
+			self._columnSortKeyTypes[col] = sortKeyTypes.pop() if sortKeyTypes else str
+		for descIdx, sortKey in enumerate(sortKeys):
+			self._sortKeys[(descIdx, col)] = sortKey
+
+	def _invalidateColumnSortKeys(self, col: int):
+		self._columnSortKeyTypes.pop(col, None)
+		for descIdx in range(len(self._descs)):
+			self._sortKeys.pop((descIdx, col), None)
+
+	def _isEmptyLastColumn(self, col: int) -> bool:
+		return col in self._widgetColumns or col in self._paintedColumns
+
+	@staticmethod
+	def _sortKeyType(sortKey: int | float | str) -> type | None:
+		if isinstance(sortKey, bool):
+			return None
+		if isinstance(sortKey, (int, float)):
+			return int  # ints and floats compare natively with each other
+		return str if isinstance(sortKey, str) else None
+
+	@staticmethod
+	def _nativeSortKey(value: str | QTableWidgetItem | TableCellData | None, emptyLast: bool) -> int | float | str | None:
+		""" Returns the value's sort key as a number or string Qt can compare natively, or None if it only has __lt__. """
+		if isinstance(value, TableCellData):
+			value = value.GetSortKey()
+		elif isinstance(value, QTableWidgetItem):
+			getSortKey = getattr(value, 'GetSortKey', None)
+			if callable(getSortKey):
+				return getSortKey()
+			if type(value).__lt__ is not QTableWidgetItem.__lt__:
+				return None
+			value = value.text()
+		if value is None:
+			return ''
+		return DescriptorTableModel.EMPTY_SORT_KEY if emptyLast and not value else value
+
+	@staticmethod
+	def _lessThan(a: str | QTableWidgetItem | TableCellData | None, b: str | QTableWidgetItem | TableCellData | None, emptyLast: bool = False) -> bool:
+		""" Mirrors QTableWidget's item ordering; widget and painted cells sort by their GetSortKey with empty keys last. """
+		if isinstance(a, QTableWidgetItem) and isinstance(b, QTableWidgetItem):
+			return a < b
+		textA: str = DescriptorTableModel._sortText(a)
+		textB: str = DescriptorTableModel._sortText(b)
+		if emptyLast:
+			return bool(textA) and (not textB or textA < textB)
+		return textA < textB
+
+	@staticmethod
+	def _sortText(value: str | QTableWidgetItem | TableCellData | None) -> str:
+		if isinstance(value, QTableWidgetItem):
+			return value.text()
+		if isinstance(value, TableCellData):
+			return value.GetSortKey()
+		return value or ''
+
+class DescriptorTableProxyModel(QSortFilterProxyModel):
+	""" Sorts the descriptor rows in C++ on the precomputed TABLE_ROLE_SORT_KEY values. The source rows never
+	move, so cached cell values, painted layouts and cell widgets stay bound to their descriptors on sort.
+	Rows can be filtered by descriptor UID (see SetDescriptorFilter). """
+	def __init__(self, sourceModel: DescriptorTableModel, parent=None):
+		super().__init__(parent)
+		self._descUIDs: list[str] = []  # the source model's list, fetched once filtering
+		self._acceptedDescUIDs: set[str] | None = None  # None: no filter
+		self.setSourceModel(sourceModel)
+		self.setSortRole(TABLE_ROLE_SORT_KEY)
+		self.setSortCaseSensitivity(Qt.CaseSensitivity.CaseSensitive)
+		self.setSortLocaleAware(False)
+		self.setDynamicSortFilter(True)  # an updated descriptor moves to its sorted position
+
+	def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+		if orientation == Qt.Orientation.Vertical:  # row numbers follow the visual order, not the source rows
+			return section + 1 if role == Qt.ItemDataRole.DisplayRole else None
+		return super().headerData(section, orientation, role)
+
+	def filterAcceptsRow(self, sourceRow: int, sourceParent: QModelIndex) -> bool:
+		return self._acceptedDescUIDs is None or self._descUIDs[sourceRow] in self._acceptedDescUIDs
+
+	def SetDescriptorFilter(self, descUIDs: set[str] | None):
+		""" Only keeps the rows of the descriptors whose UID is in descUIDs, None shows all rows. """
+		if descUIDs is None and self._acceptedDescUIDs is None:
+			return
+		self._descUIDs = self.sourceModel().GetDescriptorUIDs()
+		self._acceptedDescUIDs = descUIDs
+		self.invalidateFilter()
+
+	def GetDescriptorIndex(self, row: int) -> int:
+		sourceIndex: QModelIndex = self.mapToSource(self.index(row, 0))
+		return sourceIndex.row() if sourceIndex.isValid() else -1
+
+	def GetDescriptor(self, row: int) -> BaseDescriptor | None:
+		return self.sourceModel().GetDescriptor(self.GetDescriptorIndex(row))
+
+	def GetDescriptorRow(self, descIdx: int) -> int:
+		return self.mapFromSource(self.sourceModel().index(descIdx, 0)).row()
 
 # TODO: wtf, rename it please!
-class MyTableWidget(QTableWidget):
+class MyTableWidget(HoverFadeTooltipMixin, QTableView):
+	""" Descriptors table backed by DescriptorTableModel.
+
+	TableCellData cells (tag bubbles, notes) are painted by their delegates; hover tooltips, tag editing and
+	tag drag-n-drop work by hit-testing the painted layout. Cell widgets returned by custom getters are only
+	created for the rows around the viewport and released again once too many of them are alive.
+
+	Columns are sized to their contents on first show, once the restored view state (viewState) tells which ones
+	are hidden: hidden and expensive columns are not sampled, a hidden column is sized when it gets shown. """
 	clickedLeft = pyqtSignal(int, int, Qt.KeyboardModifier)  # row, col, modifiers
 	clickedRight = pyqtSignal(int, int, Qt.KeyboardModifier)  # row, col, modifiers
 	clickedMiddle = pyqtSignal(int, int, Qt.KeyboardModifier)  # row, col, modifiers
@@ -171,16 +680,42 @@ class MyTableWidget(QTableWidget):
 	doubleClickedRight = pyqtSignal(int, int, Qt.KeyboardModifier)  # row, col, modifiers
 	doubleClickedMiddle = pyqtSignal(int, int, Qt.KeyboardModifier)  # row, col, modifiers
 
-	def __init__(self, descs: list[BaseDescriptor], tableBuilder: BaseTableBuilder, swHandler: SoftwareHandler, viewUID: str, parent: QMainWindow):
+	VISIBLE_ROWS_MARGIN: int = 10  # rows above/below the viewport that also get their cell widgets and heights
+	MAX_LIVE_CELL_WIDGETS: int = 500  # beyond this, cell widgets outside the visible rows are released
+	RESIZE_CONTENTS_PRECISION: int = 200  # rows sampled when sizing a column to its contents
+	ROW_HEIGHTS_DEBOUNCE_MS: int = 50  # coalesces row height updates while a column border is being dragged
+
+	def __init__(self, descs: list[BaseDescriptor], tableBuilder: BaseTableBuilder, swHandler: SoftwareHandler, viewUID: str, parent: QMainWindow, viewState: dict | None = None):
 		super().__init__(parent)
 		
 		self.mainWindow: QMainWindow = parent
 		self.swHandler: SoftwareHandler = swHandler
 		self.viewUID: str = viewUID
 
-		self.setAcceptDrops(True)  # accept tag bubbles dragged from the Tags palette
+		self._cellWidgetIndexes: dict[QWidget, QPersistentModelIndex] = dict()  # live cell widget -> its cell (follows sorting)
+		self._descCellWidgets: dict[int, list[QWidget]] = dict()  # descIdx -> its live cell widgets
+		self._cellDataDelegates: dict[int, TableCellDataDelegate] = dict()  # painted column -> its delegate
+		self._heightMeasuredDescIdxs: set[int] = set()  # rows (by descIdx) sized for the current column widths
+		self._measuredColumnWidths: list[int] = []  # column widths the measured rows were sized for
+		self._visibleRowsUpdatePending: bool = False
+		self._rowHeightsTimer: QTimer = QTimer(self)
+		self._rowHeightsTimer.setSingleShot(True)
+		self._rowHeightsTimer.timeout.connect(self._scheduleVisibleRowsUpdate)
+		self._initialSizesApplied: bool = False
+		self._unfittedColumns: set[int] = set()  # columns to size to their contents once shown
+
+		self._hoveredCellKey: tuple[int, int, int] | None = None  # (row, col, item index) under the cursor
+		self._hoveredCellData: TableCellData | None = None
+		self._tagDragStart: tuple[QPoint, QModelIndex, int] | None = None  # (press pos, cell index, tag index)
 
-		self._setupTable(descs, tableBuilder, parent)
+		self._InitHoverTooltip(persistentTooltip=True)
+		self.viewport().setMouseTracking(True)
+		self.setAcceptDrops(True)  # accept tag bubbles dragged from the Tags palette or other rows
+
+		self._setupTable(descs, tableBuilder, parent, viewState)
+
+	def rowCount(self) -> int:
+		return self._proxyModel.rowCount()
 
 	def dragEnterEvent(self, event):
 		if event.mimeData().hasFormat(TAG_MIME_TYPE):
@@ -199,42 +734,150 @@ class MyTableWidget(QTableWidget):
 			event.ignore()
 			return
 		tagUID: str = bytes(event.mimeData().data(TAG_MIME_TYPE).data()).decode('utf-8')
-		row: int = self.indexAt(event.position().toPoint()).row()
-		if row < 0:
+		pos: QPoint = event.position().toPoint()
+		index: QModelIndex = self.indexAt(pos)
+		desc: BaseDescriptor | None = self._proxyModel.GetDescriptor(index.row())
+		if desc is None:
 			event.ignore()
 			return
-		descIdxItem = self.item(row, len(self._tableInfos))
-		if descIdxItem is None:
-			event.ignore()
-			return
-		descIdx: int = int(descIdxItem.text())
-		if descIdx < 0 or descIdx >= len(self._descs):
-			event.ignore()
-			return
-		desc: BaseDescriptor = self._descs[descIdx]
-		AssignTagUIDToDescriptor(desc, tagUID)
+		sourceDescUID: str = ''
+		if event.mimeData().hasFormat(TAG_SOURCE_DESC_MIME_TYPE):
+			sourceDescUID = bytes(event.mimeData().data(TAG_SOURCE_DESC_MIME_TYPE).data()).decode('utf-8')
+		if sourceDescUID != desc.GetUID():
+			# Dropped from the Tags palette or another descriptor's row: copy the assignment over.
+			AssignTagUIDToDescriptor(desc, tagUID)
+		elif isinstance(cellData := index.data(TABLE_ROLE_CELL_DATA), TagBubblesCellData):
+			# Dropped back onto its own tags cell: reorder.
+			cellRect: QRect = self.visualRect(index)
+			insertIdx: int = ComputeTagDropIndex(cellData.GetTagRects(cellRect.width(), self.font()), pos - cellRect.topLeft())
+			newOrder: list[str] | None = BuildReorderedTagUIDs([tag.GetUID() for tag in cellData.GetTags()], tagUID, insertIdx)
+			if newOrder is not None:
+				QApplication.instance().GetTagsManager().ReorderDescriptorTags(desc, newOrder)
 		event.acceptProposedAction()
 
+	def _cellItemAt(self, viewportPos: QPoint) -> tuple[QModelIndex, TableCellData | None, int]:
+		""" Hit-tests a painted cell: returns its index, its TableCellData (or None) and the item index under viewportPos. """
+		index: QModelIndex = self.indexAt(viewportPos)
+		cellData = index.data(TABLE_ROLE_CELL_DATA) if index.isValid() else None
+		if not isinstance(cellData, TableCellData):
+			return index, None, -1
+		cellRect: QRect = self.visualRect(index)
+		return index, cellData, cellData.GetItemAt(cellRect.width(), self.font(), viewportPos - cellRect.topLeft())
+
 	def _tagUnderCursor(self, viewportPos: QPoint) -> BaseTagImpl | None:
 		""" Returns the tag whose bubble is under `viewportPos` (the context-menu position), or None. """
-		index = self.indexAt(viewportPos)
-		if not index.isValid():
-			return None
-		cellWidget = self.cellWidget(index.row(), index.column())
+		index, cellData, itemIdx = self._cellItemAt(viewportPos)
+		if isinstance(cellData, TagBubblesCellData):
+			return cellData.GetTags()[itemIdx] if itemIdx >= 0 else None
+		cellWidget = self.indexWidget(index) if index.isValid() else None
 		if isinstance(cellWidget, TagBubblesFlowWidget):
 			return cellWidget.GetTagAt(cellWidget.mapFromGlobal(QCursor.pos()))
 		return None
 
+	def _GetTooltipHtml(self) -> str | None:
+		if self._hoveredCellKey is None or self._hoveredCellData is None:
+			return None
+		return self._hoveredCellData.GetTooltipHtml(self._hoveredCellKey[2])
+
+	def _setHoveredCellItem(self, index: QModelIndex, cellData: TableCellData | None, itemIdx: int):
+		hoveredCellKey: tuple[int, int, int] | None = (index.row(), index.column(), itemIdx) if cellData is not None and itemIdx >= 0 else None
+		if hoveredCellKey == self._hoveredCellKey:
+			return
+		self._hoveredCellKey = hoveredCellKey
+		self._hoveredCellData = cellData if hoveredCellKey is not None else None
+		self._CancelTooltip()
+		if hoveredCellKey is not None:
+			self._ScheduleTooltip()
+
+	def viewportEvent(self, event):
+		if event.type() == QEvent.Type.Leave:
+			self._setHoveredCellItem(QModelIndex(), None, -1)
+		return super().viewportEvent(event)
+
+	def mouseMoveEvent(self, event: QMouseEvent):
+		pos: QPoint = event.position().toPoint()
+		if self._tagDragStart is not None and bool(event.buttons() & Qt.MouseButton.LeftButton):
+			# A press on a tag bubble turns into a drag (reorder/copy) once it moves far enough.
+			if (pos - self._tagDragStart[0]).manhattanLength() >= QApplication.startDragDistance():
+				self._startTagDrag(*self._tagDragStart)
+			event.accept()
+			return
+		self._setHoveredCellItem(*self._cellItemAt(pos))
+		super().mouseMoveEvent(event)
+
+	def mouseReleaseEvent(self, event: QMouseEvent):
+		self._tagDragStart = None
+		super().mouseReleaseEvent(event)
+
+	def _handleTagBubblePress(self, event: QMouseEvent) -> bool:
+		""" Ctrl+LMB on a tag bubble edits the tag, Shift+LMB unassigns it and a plain LMB arms a drag. Returns True if consumed. """
+		self._tagDragStart = None
+		if event.button() != Qt.MouseButton.LeftButton:
+			return False
+		index, cellData, itemIdx = self._cellItemAt(event.position().toPoint())
+		if not isinstance(cellData, TagBubblesCellData) or itemIdx < 0:
+			return False
+		tag = cellData.GetTags()[itemIdx]
+		desc: BaseDescriptor | None = cellData.GetDescriptor()
+		if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+			self._CancelTooltip()
+			OpenTagEditorDialog(tag, self)
+			return True
+		if event.modifiers() & Qt.KeyboardModifier.ShiftModifier and desc is not None:
+			self._CancelTooltip()
+			PromptUnassignTag(self, desc, tag)
+			return True
+		if desc is not None:
+			self._tagDragStart = (event.position().toPoint(), index, itemIdx)
+		return False
+
+	def _startTagDrag(self, startPos: QPoint, index: QModelIndex, tagIdx: int):
+		""" Starts a QDrag carrying the tag UID (and its descriptor's UID) so a drop can reorder or copy it. """
+		self._tagDragStart = None
+		self._CancelTooltip()
+		cellData = index.data(TABLE_ROLE_CELL_DATA)
+		if not isinstance(cellData, TagBubblesCellData) or cellData.GetDescriptor() is None:
+			return
+		cellRect: QRect = self.visualRect(index)
+		bubbleRect: QRect | None = cellData.GetTagRects(cellRect.width(), self.font())[tagIdx]
+		if bubbleRect is None:
+			return
+		tag = cellData.GetTags()[tagIdx]
+
+		mimeData: QMimeData = QMimeData()
+		mimeData.setData(TAG_MIME_TYPE, tag.GetUID().encode('utf-8'))
+		mimeData.setData(TAG_SOURCE_DESC_MIME_TYPE, cellData.GetDescriptor().GetUID().encode('utf-8'))
+
+		dpr: float = self.devicePixelRatioF()
+		pixmap: QPixmap = QPixmap(int(bubbleRect.width() * dpr), int(bubbleRect.height() * dpr))
+		pixmap.setDevicePixelRatio(dpr)
+		pixmap.fill(Qt.GlobalColor.transparent)
+		painter: QPainter = QPainter(pixmap)
+		painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+		painter.setFont(self.font())
+		TagBubblesItemDelegate.PaintBubble(painter, QRect(QPoint(0, 0), bubbleRect.size()), tag.GetName(), QColor(tag.GetColor()) if tag.GetColor() else None)
+		painter.end()
+
+		drag: QDrag = QDrag(self)
+		drag.setMimeData(mimeData)
+		drag.setPixmap(pixmap)
+		drag.setHotSpot(startPos - cellRect.topLeft() - bubbleRect.topLeft())
+		drag.exec(Qt.DropAction.MoveAction | Qt.DropAction.CopyAction, Qt.DropAction.MoveAction)
+
 	def mousePressEvent(self, event: QMouseEvent):
+		if self._handleTagBubblePress(event):
+			event.accept()
+			return
+		currentIndex: QModelIndex = self.currentIndex()
 		if event.button() == Qt.MouseButton.LeftButton:
 			# print("Left button clicked")
-			self.clickedLeft.emit(self.currentRow(), self.currentColumn(), QApplication.keyboardModifiers())
+			self.clickedLeft.emit(currentIndex.row(), currentIndex.column(), QApplication.keyboardModifiers())
 		elif event.button() == Qt.MouseButton.RightButton:
 			# print("Right button clicked")
-			self.clickedRight.emit(self.currentRow(), self.currentColumn(), QApplication.keyboardModifiers())
+			self.clickedRight.emit(currentIndex.row(), currentIndex.column(), QApplication.keyboardModifiers())
 		elif event.button() == Qt.MouseButton.MiddleButton:
 			# print("Middle button clicked")
-			self.clickedMiddle.emit(self.currentRow(), self.currentColumn(), QApplication.keyboardModifiers())
+			self.clickedMiddle.emit(currentIndex.row(), currentIndex.column(), QApplication.keyboardModifiers())
 
 		super().mousePressEvent(event)
 
@@ -272,42 +915,35 @@ class MyTableWidget(QTableWidget):
 		selectedRows: set = {idx.row() for idx in self.selectedIndexes()}
 		if not selectedRows:
 			return None
-		row: int = selectedRows.pop()
-		descIdxItem = self.item(row, len(self._tableInfos))
-		if descIdxItem is None:
-			return None
-		descIdx: int = int(descIdxItem.text())
-		if descIdx < 0 or descIdx >= len(self._descs):
-			return None
-		return self._descs[descIdx]
+		return self._proxyModel.GetDescriptor(selectedRows.pop())
 
-	def _setupTable(self, descs: list[BaseDescriptor], tableBuilder: BaseTableBuilder, parent: QMainWindow):
+	def _setupTable(self, descs: list[BaseDescriptor], tableBuilder: BaseTableBuilder, parent: QMainWindow, viewState: dict | None):
 		self._descs = descs
 		self._tableBuilder = tableBuilder
 		self._tableInfos: list[TableColumnInfo] = tableBuilder.GetTableColumnInfo()
 
-		headers: list[str] = list(map(lambda info: info.title, self._tableInfos))
+		hiddenColumns: set[int] = {col for col, hidden in self._getStateHiddenColumns(viewState).items() if hidden}
+		self._model: DescriptorTableModel = DescriptorTableModel(descs, self._tableInfos, self, hiddenColumns, QApplication.instance().GetAsyncValuesLoader())
+		self._proxyModel: DescriptorTableProxyModel = DescriptorTableProxyModel(self._model, self)
 
 		header = MyTableViewHeader(Qt.Orientation.Horizontal, self)
 		# TODO: move this to MyTableViewHeader
 		header.setStretchLastSection(True)
 		header.setMinimumSectionSize(0)
-		header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+		header.setResizeContentsPrecision(self.RESIZE_CONTENTS_PRECISION)
+		header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
 
 		self.setHorizontalHeader(header)
-		self.setRowCount(len(descs))
-		self.setColumnCount(len(headers) + 1)
-		self.setHorizontalHeaderLabels(headers + ['descIdx'])
-		self.hideColumn(len(headers))  # hide descIdx column
+		self.setModel(self._proxyModel)
 		self.setItemDelegate(tableBuilder.GetItemDelegateClass()(self))
 
 		self.setSortingEnabled(True)
 		self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
 		self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
 
-		self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-		self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-		self.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+		self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+		self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+		self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
 		self.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
 		self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
 
@@ -320,42 +956,80 @@ class MyTableWidget(QTableWidget):
 			selectedRowsUnique: set = {idx.row() for idx in self.selectedIndexes()}
 			if not selectedRowsUnique:
 				return
-			currentRow = selectedRowsUnique.pop()
-			item = self.item(currentRow, len(headers))
-			if item:
-				descIdx: int = int(item.text())
-				desc: BaseDescriptor = descs[descIdx]
-				if menu := tableBuilder.GetContextMenu(desc):
-					tagUnderCursor: BaseTagImpl | None = self._tagUnderCursor(pos)
-					PopulateContextMenuTagsAndNotes(menu, desc, self.mainWindow, self, self.swHandler.pluginID, self.swHandler.GetID(), self.viewUID, tagUnderCursor)
-					menu.exec(QCursor.pos())
-
-		for r, desc in enumerate(descs):
-			self._populateRow(r, desc, r)
-			# Connect to the bound method (a QObject slot) rather than a partial so Qt auto-disconnects
-			# this connection when the widget is destroyed (e.g. on workspace switch). Otherwise the
-			# descriptor outlives the widget and keeps firing into a deleted widget/mainWindow.
-			desc.descDataUpdated.connect(self._onUpdateTableRowRequired)
-
-		# Apply per-column widths info after items are populated
+			desc: BaseDescriptor | None = self._proxyModel.GetDescriptor(selectedRowsUnique.pop())
+			if desc is None:
+				return
+			if menu := tableBuilder.GetContextMenu(desc):
+				tagUnderCursor: BaseTagImpl | None = self._tagUnderCursor(pos)
+				PopulateContextMenuTagsAndNotes(menu, desc, self.mainWindow, self, self.swHandler.pluginID, self.swHandler.GetID(), self.viewUID, tagUnderCursor)
+				menu.exec(QCursor.pos())
+
+		# Connect to the bound method (a QObject slot) rather than a partial so Qt auto-disconnects this connection
+		# when the widget is destroyed (e.g. on workspace switch). Otherwise the bus outlives the widget and keeps
+		# firing into a deleted widget/mainWindow.
+		QApplication.instance().GetDescriptorUpdateBus().descriptorsUpdated.connect(self._onDescriptorsUpdated)
+
+		self._installCellDataDelegates()
+
+		# Apply per-column widths info, the other columns are sized to their contents on first show
 		header.SetSectionMinimumWidths(list(map(lambda info: info.minWidth, self._tableInfos)))
-		colDefaultWidths: list[int] = list(map(lambda info: info.defaultWidth, self._tableInfos))
-		if len(colDefaultWidths) == len(headers):
-			for col, defW in enumerate(colDefaultWidths):
-				if defW > 0:
-					header.setSectionResizeMode(col, QHeaderView.ResizeMode.Interactive)
-					header.resizeSection(col, defW)
-					
-		header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+		for col, tableInfo in enumerate(self._tableInfos):
+			if tableInfo.defaultWidth > 0:
+				header.resizeSection(col, tableInfo.defaultWidth)
+			else:
+				self._unfittedColumns.add(col)
 
-		# Cell widgets (e.g. tag bubbles) wrap based on column width and need realignment on sort.
+		# Painted cells and cell widgets (e.g. tag bubbles) wrap based on column width; rows are only sized
+		# (and cell widgets only exist) around the viewport.
 		header.sectionResized.connect(self._onSectionResized)
-		header.sortIndicatorChanged.connect(self._onSortIndicatorChanged)
-		self._recomputeAllRowHeights()
+		self.verticalScrollBar().valueChanged.connect(self._scheduleVisibleRowsUpdate)
+		self._proxyModel.layoutChanged.connect(self._scheduleVisibleRowsUpdate)  # sorted: other rows got near the viewport
+		self._proxyModel.rowsInserted.connect(self._scheduleVisibleRowsUpdate)
+		self._model.columnKindsChanged.connect(self._onColumnKindsChanged)
+		self._model.pendingCellsFilled.connect(self._onPendingCellsFilled)
+		self._scheduleVisibleRowsUpdate()
 
 		self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
 		self.customContextMenuRequested.connect(showContextMenu)
 
+		if viewState:
+			self.ApplyViewState(viewState)
+
+	def _applyInitialSizes(self):
+		""" Sizes the shown columns to their contents and the rows after the first row's plain contents. """
+		self._initialSizesApplied = True
+		self._fitColumnsToContents(list(range(self._model.columnCount())))
+
+		# Rows share a uniform height sized after the first row's plain contents; variable-height (painted or
+		# widget) cells grow their rows once those become visible (see _updateVisibleRows).
+		if self._model.rowCount() > 0:
+			variableColumns: set[int] = set(self._model.GetPaintedColumns()) | set(self._model.GetWidgetColumns())
+			rowHeights: list[int] = [self.sizeHintForIndex(self._proxyModel.index(0, c)).height() for c in range(self._model.columnCount())
+							if c not in variableColumns and not self.isColumnHidden(c) and not self._model.IsExpensiveColumn(c)]
+			self.verticalHeader().setDefaultSectionSize(max(rowHeights + [self.verticalHeader().minimumSectionSize(), 1]))
+
+	def _fitColumnsToContents(self, cols: list[int]):
+		""" Sizes the given columns to their contents (sampling RESIZE_CONTENTS_PRECISION rows) unless they were already
+		sized, are hidden or expensive, or stretch to the table's width. """
+		header: QHeaderView = self.horizontalHeader()
+		for col in cols:
+			if col not in self._unfittedColumns or self.isColumnHidden(col):
+				continue
+			self._unfittedColumns.discard(col)
+			isStretched: bool = header.stretchLastSection() and header.visualIndex(col) == header.count() - 1
+			if not isStretched and not self._model.IsExpensiveColumn(col):
+				self.resizeColumnToContents(col)
+
+	def _onPendingCellsFilled(self, descIdxs: set[int]):
+		""" Expensive or async cells got their values: their rows may need to grow (painted cells), and placeholder
+		cell widgets are replaced. """
+		for descIdx in descIdxs:
+			for widget in list(self._descCellWidgets.get(descIdx, [])):
+				if widget.property('async_placeholder'):
+					self._releaseCellWidget(widget)
+		self._heightMeasuredDescIdxs.difference_update(descIdxs)
+		self._scheduleVisibleRowsUpdate()
+
 	def _applyRowSelectionStyle(self):
 		""" Forces a single, uniform selection color for the whole row.
 
@@ -394,31 +1068,103 @@ class MyTableWidget(QTableWidget):
 			f' }}'
 		)
 
-	def _populateRow(self, row: int, desc: BaseDescriptor, descIdx: int):
-		for c, tableInfo in enumerate(self._tableInfos):
-			cellValue = tableInfo.cellDataGetter(desc) if callable(tableInfo.cellDataGetter) else ''
-			if isinstance(cellValue, QWidget):
-				getSortKey = getattr(cellValue, 'GetSortKey', None)
-				sortKey: str = str(getSortKey()) if callable(getSortKey) else ''
-				self.setItem(row, c, _CellWidgetSortItem(sortKey))
-				self.setCellWidget(row, c, cellValue)
-				self._connectCellWidgetAutoHeight(cellValue)
-			else:
-				if self.cellWidget(row, c) is not None:
-					self.removeCellWidget(row, c)
-				if not isinstance(cellValue, QTableWidgetItem):
-					cellValue = QTableWidgetItem(cellValue)
-				self.setItem(row, c, cellValue)
-		self.setItem(row, len(self._tableInfos), QTableWidgetItem(str(descIdx)))
-		self._adjustRowHeight(row)
+	def _installCellDataDelegates(self):
+		""" Sets the delegate painting each painted column (TableCellData.GetDelegateClass) on that column, chained to
+		the builder's row delegate, which keeps painting the cell background. """
+		for col, cellDataClass in self._model.GetPaintedColumns().items():
+			if col not in self._cellDataDelegates:
+				self._cellDataDelegates[col] = cellDataClass.GetDelegateClass()(self, baseDelegate=self.itemDelegate())
+				self.setItemDelegateForColumn(col, self._cellDataDelegates[col])
+
+	def _onColumnKindsChanged(self):
+		self._installCellDataDelegates()
+		self._heightMeasuredDescIdxs.clear()
+		self._scheduleVisibleRowsUpdate()
+
+	def _getVisibleRowRange(self) -> tuple[int, int]:
+		""" Returns the first and last row (inclusive) around the viewport, extended by VISIBLE_ROWS_MARGIN. """
+		rowCount: int = self._proxyModel.rowCount()
+		firstRow: int = self.rowAt(0)
+		lastRow: int = self.rowAt(self.viewport().height() - 1)
+		firstRow = 0 if firstRow < 0 else firstRow
+		lastRow = rowCount - 1 if lastRow < 0 else lastRow
+		return max(0, firstRow - self.VISIBLE_ROWS_MARGIN), min(rowCount - 1, lastRow + self.VISIBLE_ROWS_MARGIN)
+
+	def _scheduleVisibleRowsUpdate(self, *args):
+		""" Coalesces visible rows updates (scrolling, sorting, resizing) into one pass on the next event loop tick. """
+		if self._visibleRowsUpdatePending:
+			return
+		self._visibleRowsUpdatePending = True
+		QTimer.singleShot(0, self._updateVisibleRows)
+
+	def _updateVisibleRows(self):
+		""" Sizes the rows around the viewport, creates their cell widgets and releases the widgets far from it.
+
+		Rows are measured once per set of column widths: scrolling back to an already measured row costs nothing,
+		and a column resize only re-measures the rows around the viewport (the rest when they get near it). """
+		self._visibleRowsUpdatePending = False
+		widgetColumns: list[int] = [col for col in self._model.GetWidgetColumns() if not self.isColumnHidden(col)]
+		if self._proxyModel.rowCount() == 0 or not (widgetColumns or self._model.GetPaintedColumns()):
+			return
+		columnWidths: list[int] = [0 if self.isColumnHidden(col) else self.columnWidth(col) for col in range(self._model.columnCount())]
+		if columnWidths != self._measuredColumnWidths:
+			self._measuredColumnWidths = columnWidths
+			self._heightMeasuredDescIdxs.clear()
+		firstRow, lastRow = self._getVisibleRowRange()
+		for row in range(firstRow, lastRow + 1):
+			created: bool = False
+			descIdx: int = self._proxyModel.GetDescriptorIndex(row)
+			for col in widgetColumns:
+				index: QModelIndex = self._proxyModel.index(row, col)
+				if self.indexWidget(index) is not None:
+					continue
+				widget: QWidget | None = self._model.CreateCellWidget(descIdx, col)
+				if widget is None:
+					continue
+				self.setIndexWidget(index, widget)  # the persistent index follows the row when the proxy sorts
+				self._cellWidgetIndexes[widget] = QPersistentModelIndex(index)
+				self._descCellWidgets.setdefault(descIdx, []).append(widget)
+				self._connectCellWidgetAutoHeight(widget)
+				created = True
+			if created or descIdx not in self._heightMeasuredDescIdxs:
+				self._adjustRowHeight(row)
+
+		if len(self._cellWidgetIndexes) > self.MAX_LIVE_CELL_WIDGETS:
+			for widget, persistentIndex in list(self._cellWidgetIndexes.items()):
+				if not persistentIndex.isValid() or not (firstRow <= persistentIndex.row() <= lastRow):
+					self._releaseCellWidget(widget)
+
+	def _releaseCellWidget(self, widget: QWidget):
+		persistentIndex: QPersistentModelIndex | None = self._cellWidgetIndexes.pop(widget, None)
+		if persistentIndex is None or not persistentIndex.isValid():
+			return
+		descIdx: int = self._proxyModel.GetDescriptorIndex(persistentIndex.row())
+		if widget in (descWidgets := self._descCellWidgets.get(descIdx, [])):
+			descWidgets.remove(widget)
+			if not descWidgets:
+				del self._descCellWidgets[descIdx]
+		self.setIndexWidget(QModelIndex(persistentIndex), None)  # deletes the widget
+
+	def _releaseDescriptorCellWidgets(self, descIdx: int):
+		for widget in list(self._descCellWidgets.get(descIdx, [])):
+			self._releaseCellWidget(widget)
 
 	def _adjustRowHeight(self, row: int):
-		""" Sizes the row to fit any variable-height cell widgets, capped by the builder's max row height. """
+		""" Sizes the row to fit any variable-height painted cells or cell widgets, capped by the builder's max row height. """
 		maxHeight: int = self._tableBuilder.GetRowMaximumHeight()
 		desiredHeight: int = 0
 		hasWidget: bool = False
-		for c in range(len(self._tableInfos)):
-			widget: QWidget | None = self.cellWidget(row, c)
+		self._heightMeasuredDescIdxs.add(self._proxyModel.GetDescriptorIndex(row))
+		for c in self._model.GetPaintedColumns():
+			if self.isColumnHidden(c):
+				continue
+			cellData = self._proxyModel.index(row, c).data(TABLE_ROLE_CELL_DATA)
+			cellHeight: int = cellData.HeightForWidth(self.columnWidth(c), self.font()) if isinstance(cellData, TableCellData) else 0
+			if cellHeight > 0:
+				hasWidget = True
+				desiredHeight = max(desiredHeight, cellHeight)
+		for c in self._model.GetWidgetColumns():
+			widget: QWidget | None = self.indexWidget(self._proxyModel.index(row, c))
 			if widget is not None and widget.hasHeightForWidth():
 				hasWidget = True
 				# Measure at the widget's actual width once it has been laid out: the cell content width
@@ -428,12 +1174,11 @@ class MyTableWidget(QTableWidget):
 				desiredHeight = max(desiredHeight, widget.heightForWidth(width))
 		if hasWidget:
 			self.setRowHeight(row, max(min(desiredHeight, maxHeight), 1))
-		else:
-			self.resizeRowToContents(row)
 
 	def _recomputeAllRowHeights(self):
-		for row in range(self.rowCount()):
-			self._adjustRowHeight(row)
+		""" Invalidates all row heights; rows are re-measured once they get near the viewport. """
+		self._heightMeasuredDescIdxs.clear()
+		self._scheduleVisibleRowsUpdate()
 
 	def _connectCellWidgetAutoHeight(self, widget: QWidget):
 		""" Re-adjusts the row height when a variable-height cell widget reports that its content
@@ -445,51 +1190,29 @@ class MyTableWidget(QTableWidget):
 			signal.connect(self._onCellWidgetHeightChanged)
 
 	def _onCellWidgetHeightChanged(self):
-		widget = self.sender()
-		if not isinstance(widget, QWidget):
-			return
-		for row in range(self.rowCount()):
-			for c in range(len(self._tableInfos)):
-				if self.cellWidget(row, c) is widget:
-					self._adjustRowHeight(row)
-					return
+		persistentIndex: QPersistentModelIndex | None = self._cellWidgetIndexes.get(self.sender())
+		if persistentIndex is not None and persistentIndex.isValid():
+			self._heightMeasuredDescIdxs.discard(self._proxyModel.GetDescriptorIndex(persistentIndex.row()))
+			self._rowHeightsTimer.start(self.ROW_HEIGHTS_DEBOUNCE_MS)
 
 	def _onSectionResized(self, logicalIndex: int, oldSize: int, newSize: int):
-		# Column width affects how the flow-laid-out cell widgets wrap, so row heights must be recomputed.
-		self._recomputeAllRowHeights()
-
-	def _rebuildCellWidgets(self):
-		""" Re-creates cell widgets for every row from the (possibly reordered) hidden descIdx column.
-
-		QTableWidget does not move cell widgets when sorting, so after a sort the widgets must be rebuilt
-		to stay aligned with their rows. """
-		descIdxColumn: int = len(self._tableInfos)
-		for row in range(self.rowCount()):
-			item = self.item(row, descIdxColumn)
-			if item is None:
-				continue
-			try:
-				descIdx: int = int(item.text())
-			except ValueError:
-				continue
-			desc: BaseDescriptor = self._descs[descIdx]
-			for c, tableInfo in enumerate(self._tableInfos):
-				cellValue = tableInfo.cellDataGetter(desc) if callable(tableInfo.cellDataGetter) else ''
-				if isinstance(cellValue, QWidget):
-					self.setCellWidget(row, c, cellValue)
-					self._connectCellWidgetAutoHeight(cellValue)
-				elif self.cellWidget(row, c) is not None:
-					self.removeCellWidget(row, c)
-			self._adjustRowHeight(row)
-
-	def _onSortIndicatorChanged(self, logicalIndex: int, order: Qt.SortOrder):
-		# Defer until after QTableWidget finishes reordering items, then realign cell widgets.
-		QTimer.singleShot(0, self._rebuildCellWidgets)
+		# Column width affects how the flow-laid-out cells wrap, so row heights must be recomputed (detected by
+		# _updateVisibleRows). A column being unhidden also needs its cell widgets created. Debounced, so dragging a
+		# column border re-measures the visible rows once the drag pauses instead of on every pixel.
+		if (oldSize == 0) != (newSize == 0):  # hidden or shown
+			self._model.SetColumnHidden(logicalIndex, newSize == 0)
+			if newSize > 0 and self._initialSizesApplied:
+				self._fitColumnsToContents([logicalIndex])
+		self._rowHeightsTimer.start(self.ROW_HEIGHTS_DEBOUNCE_MS)
+
+	def resizeEvent(self, event):
+		super().resizeEvent(event)
+		self._scheduleVisibleRowsUpdate()
 
 	def GetViewState(self) -> dict:
 		""" Returns the persistable UI state of the table (sorting, column order/visibility/widths). """
 		header = self.horizontalHeader()
-		dataColumnCount: int = len(self._tableInfos)  # exclude the hidden descIdx column
+		dataColumnCount: int = len(self._tableInfos)
 		columnWidths: dict[str, int] = {}
 		columnHidden: dict[str, bool] = {}
 		for col in range(dataColumnCount):
@@ -534,16 +1257,10 @@ class MyTableWidget(QTableWidget):
 				if 0 <= col < dataColumnCount and isinstance(width, int) and width > 0:
 					header.setSectionResizeMode(col, QHeaderView.ResizeMode.Interactive)
 					self.setColumnWidth(col, width)
+					self._unfittedColumns.discard(col)
 
-		columnHidden = state.get('column_hidden', {})
-		if isinstance(columnHidden, dict):
-			for colStr, hidden in columnHidden.items():
-				try:
-					col = int(colStr)
-				except (ValueError, TypeError):
-					continue
-				if 0 <= col < dataColumnCount and isinstance(hidden, bool):
-					self.setColumnHidden(col, hidden)
+		for col, hidden in self._getStateHiddenColumns(state).items():
+			self.setColumnHidden(col, hidden)
 
 		sortColumn = state.get('sort_column', -1)
 		sortOrder = state.get('sort_order', None)
@@ -551,37 +1268,89 @@ class MyTableWidget(QTableWidget):
 			order = Qt.SortOrder.AscendingOrder if sortOrder == Qt.SortOrder.AscendingOrder.value else Qt.SortOrder.DescendingOrder
 			self.sortByColumn(sortColumn, order)
 
-
-	def _onUpdateTableRowRequired(self):
-		desc = self.sender()
-		if not isinstance(desc, BaseDescriptor):
-			return
-		try:
-			descIdx: int = self._descs.index(desc)
-		except ValueError:
-			return
-		descIdxColumn: int = len(self._tableInfos)
-		targetRow: int = -1
-		for row in range(self.rowCount()):
-			item = self.item(row, descIdxColumn)
-			if item and item.text() == str(descIdx):
-				targetRow = row
-				break
-		if targetRow < 0:
+	def _getStateHiddenColumns(self, state: dict | None) -> dict[int, bool]:
+		""" Returns the persisted visibility of the data columns (see GetViewState): col -> hidden. """
+		columnHidden = state.get('column_hidden', {}) if isinstance(state, dict) else {}
+		if not isinstance(columnHidden, dict):
+			return {}
+		hiddenColumns: dict[int, bool] = {}
+		for colStr, hidden in columnHidden.items():
+			try:
+				col = int(colStr)
+			except (ValueError, TypeError):
+				continue
+			if 0 <= col < len(self._tableInfos) and isinstance(hidden, bool):
+				hiddenColumns[col] = hidden
+		return hiddenColumns
+
+	def SetDescriptorFilter(self, descUIDs: set[str] | None):
+		""" Only shows the rows of the descriptors whose UID is in descUIDs, None shows all rows. """
+		self._proxyModel.SetDescriptorFilter(descUIDs)
+		# The view deletes the cell widgets of the rows filtered out, and rows filtered back in get the default height
+		for widget in [widget for widget, persistentIndex in self._cellWidgetIndexes.items() if not persistentIndex.isValid()]:
+			del self._cellWidgetIndexes[widget]
+		for descIdx, descWidgets in list(self._descCellWidgets.items()):
+			descWidgets[:] = [widget for widget in descWidgets if widget in self._cellWidgetIndexes]
+			if not descWidgets:
+				del self._descCellWidgets[descIdx]
+		self._heightMeasuredDescIdxs.clear()
+		self._scheduleVisibleRowsUpdate()
+
+	def UpdateDescriptors(self, descs: list[BaseDescriptor]):
+		""" Patches the table to show the given descriptors (see DescriptorTableModel.UpdateDescriptors), keeping the
+		sorting, selection, scroll position and the cell widgets of the rows that stay. """
+		keptDescs: set[BaseDescriptor] = set(descs)
+		for descIdx in range(self._model.rowCount()):
+			if self._model.GetDescriptor(descIdx) not in keptDescs:
+				self._releaseDescriptorCellWidgets(descIdx)
+		self._descs = descs
+		self._model.UpdateDescriptors(descs)
+
+		# Rows moved up in the model: re-key the live cell widgets by their descriptors' new indexes
+		self._descCellWidgets.clear()
+		for widget, persistentIndex in self._cellWidgetIndexes.items():
+			self._descCellWidgets.setdefault(self._proxyModel.GetDescriptorIndex(persistentIndex.row()), []).append(widget)
+		self._heightMeasuredDescIdxs.clear()
+		self._scheduleVisibleRowsUpdate()
+
+	def GetSettingColumns(self, settingName: str) -> list[int]:
+		""" Returns the columns whose cell values depend on the setting (see TableColumnInfo.settingsKeys), all
+		columns if none of them declares it. """
+		cols: list[int] = [col for col, tableInfo in enumerate(self._tableInfos) if settingName in tableInfo.settingsKeys]
+		return cols or list(range(len(self._tableInfos)))
+
+	def InvalidateColumns(self, cols: list[int]):
+		""" Re-evaluates the cells of the given columns, keeping the cached values and cell widgets of the other ones
+		as well as the sorting, selection and scroll position. """
+		colsSet: set[int] = set(cols)
+		for widget, persistentIndex in list(self._cellWidgetIndexes.items()):
+			if persistentIndex.column() in colsSet:
+				self._releaseCellWidget(widget)
+		self._model.InvalidateColumns(cols)
+		self._heightMeasuredDescIdxs.clear()
+		self._scheduleVisibleRowsUpdate()
+
+	def _onDescriptorsUpdated(self, descUIDs: set[str]):
+		""" Refreshes the rows of a batch of updated descriptors (see DescriptorUpdateBus) in one pass. """
+		descIdxs: list[int] = [descIdx for descUID in descUIDs if (descIdx := self._model.GetDescriptorIndexOfUID(descUID)) >= 0]
+		if not descIdxs:
 			return
-		sortingEnabled: bool = self.isSortingEnabled()
-		self.setSortingEnabled(False)
-		self._populateRow(targetRow, desc, descIdx)
-		self.setSortingEnabled(sortingEnabled)
-
-	def _onTableItemDoubleClickedLeft(self, tableWidget: QTableWidget, tableBuilder: BaseTableBuilder, row: int, col: int, modifiers: Qt.KeyboardModifier):
+		self.setUpdatesEnabled(False)
+		self._model.InvalidateDescriptors(descIdxs)
+		for descIdx in descIdxs:
+			self._heightMeasuredDescIdxs.discard(descIdx)
+			self._releaseDescriptorCellWidgets(descIdx)
+		self.setUpdatesEnabled(True)
+		self._scheduleVisibleRowsUpdate()
+
+	def _onTableItemDoubleClickedLeft(self, tableWidget: QTableView, tableBuilder: BaseTableBuilder, row: int, col: int, modifiers: Qt.KeyboardModifier):
 		if row < 0 or col < 0:
 			return
 		# app = QApplication.instance()
 		# descIdx: int = int(tableWidget.item(row, len(tableBuilder.GetTableCaptions())).text())
 		# tableBuilder.HandleClick(app.GetSoftwareDescriptors()[descIdx], row, col, True, 0, QApplication.keyboardModifiers())
 
-	def _onTableItemClickedMiddle(self, tableWidget: QTableWidget, tableBuilder: BaseTableBuilder, row: int, col: int, modifiers: Qt.KeyboardModifier):
+	def _onTableItemClickedMiddle(self, tableWidget: QTableView, tableBuilder: BaseTableBuilder, row: int, col: int, modifiers: Qt.KeyboardModifier):
 		if row < 0 or col < 0:
 			return
 		# app = QApplication.instance()
@@ -590,16 +1359,18 @@ class MyTableWidget(QTableWidget):
 
 	def showEvent(self, event):
 		# When the table becomes visible/activated (for example when switching tabs),
-		# the layout may change — recompute row heights after the show event so
-		# variable-height cell widgets wrap correctly.
+		# the layout may change — update the visible rows after the show event so
+		# variable-height cells wrap correctly (only re-measured if column widths changed).
+		if not self._initialSizesApplied:
+			self._applyInitialSizes()
 		super().showEvent(event)
-		QTimer.singleShot(0, self._recomputeAllRowHeights)
+		self._scheduleVisibleRowsUpdate()
 
 	def focusInEvent(self, event):
-		# Also recompute when the widget receives focus, which can happen when
+		# Also update when the widget receives focus, which can happen when
 		# the user activates the table inside a container.
 		super().focusInEvent(event)
-		QTimer.singleShot(0, self._recomputeAllRowHeights)
+		self._scheduleVisibleRowsUpdate()
 	
 
 
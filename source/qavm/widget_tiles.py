@@ -1,24 +1,32 @@
+import os, time, hashlib
+from collections import OrderedDict
 from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from PyQt6.QtWidgets import (
-	QMainWindow, QMenu, QWidget, QScrollArea, QVBoxLayout, 
+	QApplication, QMainWindow, QMenu, QWidget, QScrollArea, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QCheckBox,
+	QStyle, QToolTip,
 )
 from PyQt6.QtGui import (
 	QAction,
+	QColor,
 	QCursor,
+	QIcon,
+	QPainter,
+	QPixmap,
 )
 from PyQt6.QtCore import (
-	Qt,
+	Qt, QSize, QRect, QEvent, QObject, QTimer, QPoint, pyqtSignal,
 )
 
 from qavm.qavmapi import (
-	BaseDescriptor, BaseTileBuilder,
+	BaseDescriptor, BaseTileBuilder, TileDetailLevel, AsyncValue,
 )
-from qavm.qavmapi.gui import TagBubblesFlowWidget
+from qavm.qavmapi.gui import TagBubblesFlowWidget, GetThemeName, GetThemeData
+from qavm.qavmapi.utils import GetQAVMCachePath
 from qavm.manager_plugin import SoftwareHandler
-from qavm.utils_gui import FlowLayout
+from qavm.utils_gui import FlowGrid
 from qavm.utils_widgets import PopulateContextMenuTagsAndNotes, AssignTagUIDToDescriptor, TAG_MIME_TYPE
 
 if TYPE_CHECKING:
@@ -28,7 +36,203 @@ if TYPE_CHECKING:
 import qavm.logs as logs
 logger = logs.logger
 
+class TilePixmapCache(object):
+	""" LRU cache of rendered tile pixmaps bounded by their total size, optionally backed by PNG files in the QAVM
+	cache folder (see BaseTileBuilder.GetTilePixmapCacheKey). Shared by all tiles views, see GetTilePixmapCache. """
+	MEMORY_LIMIT_BYTES: int = 64 * 2**20
+	DISK_MAX_AGE_DAYS: float = 30.0  # files unused for that long are removed on the first disk write of a session
+
+	def __init__(self, diskFolderPath: Path):
+		self.diskFolderPath: Path = diskFolderPath
+		self._pixmaps: OrderedDict[str, QPixmap] = OrderedDict()
+		self._pixmapsBytes: int = 0
+		self._diskPruned: bool = False
+
+	@staticmethod
+	def MakeKey(*parts: str) -> str:
+		return hashlib.blake2b('\x1f'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+	def Get(self, key: str, useDisk: bool = False, devicePixelRatio: float = 1.0) -> QPixmap | None:
+		if (pixmap := self._pixmaps.get(key)) is not None:
+			self._pixmaps.move_to_end(key)
+			return pixmap
+		if not useDisk:
+			return None
+		filepath: Path = self._getDiskFilepath(key)
+		if not filepath.is_file():
+			return None
+		pixmap = QPixmap(str(filepath))
+		if pixmap.isNull():
+			return None
+		pixmap.setDevicePixelRatio(devicePixelRatio)  # PNG files don't keep it; the ratio is part of the key
+		try:
+			os.utime(filepath)  # keeps used files from being pruned
+		except OSError:
+			pass
+		self._insert(key, pixmap)
+		return pixmap
+
+	def Put(self, key: str, pixmap: QPixmap, useDisk: bool = False):
+		self._insert(key, pixmap)
+		if not useDisk:
+			return
+		try:
+			self.diskFolderPath.mkdir(parents=True, exist_ok=True)
+			if not self._diskPruned:
+				self._diskPruned = True
+				self._pruneDisk()
+			if not pixmap.save(str(self._getDiskFilepath(key)), 'PNG'):
+				logger.warning(f'Failed to save tile pixmap to {self.diskFolderPath}')
+		except OSError as e:
+			logger.warning(f'Failed to save tile pixmap to {self.diskFolderPath}: {e}')
+
+	def _insert(self, key: str, pixmap: QPixmap):
+		if (oldPixmap := self._pixmaps.pop(key, None)) is not None:
+			self._pixmapsBytes -= self._getPixmapBytes(oldPixmap)
+		self._pixmaps[key] = pixmap
+		self._pixmapsBytes += self._getPixmapBytes(pixmap)
+		while self._pixmapsBytes > self.MEMORY_LIMIT_BYTES and len(self._pixmaps) > 1:
+			_, evictedPixmap = self._pixmaps.popitem(last=False)
+			self._pixmapsBytes -= self._getPixmapBytes(evictedPixmap)
+
+	@staticmethod
+	def _getPixmapBytes(pixmap: QPixmap) -> int:
+		return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+	def _getDiskFilepath(self, key: str) -> Path:
+		return self.diskFolderPath / f'{key}.png'
+
+	def _pruneDisk(self):
+		expireTime: float = time.time() - self.DISK_MAX_AGE_DAYS * 24 * 3600
+		for filepath in self.diskFolderPath.glob('*.png'):
+			try:
+				if filepath.stat().st_mtime < expireTime:
+					filepath.unlink()
+			except OSError:
+				pass
+
+_tilePixmapCache: TilePixmapCache | None = None
+
+def GetTilePixmapCache() -> TilePixmapCache:
+	global _tilePixmapCache
+	if _tilePixmapCache is None:
+		_tilePixmapCache = TilePixmapCache(GetQAVMCachePath() / 'tiles')
+	return _tilePixmapCache
+
+def GetAutoTileDetailLevel(tilesCount: int) -> TileDetailLevel:
+	""" Returns the detail level the tiles of a view are shown with when it is chosen automatically. """
+	if tilesCount >= TilesWidget.AUTO_DENSE_TILES_COUNT:
+		return TileDetailLevel.DENSE
+	if tilesCount >= TilesWidget.AUTO_COMPACT_TILES_COUNT:
+		return TileDetailLevel.COMPACT
+	return TileDetailLevel.FULL
+
+class TilesCanvas(QWidget):
+	""" Scrolled content of TilesWidget: hosts the live tile widgets and paints the tiles kept as pixmaps, as well as
+	the generic tiles of the detail levels below FULL. """
+	tileHovered = pyqtSignal(int)  # descIdx of the tile under the mouse (-1 if none), only over painted areas
+
+	def __init__(self, flowGrid: FlowGrid, parent: QWidget):
+		super().__init__(parent)
+		self.flowGrid: FlowGrid = flowGrid
+		self.tilePixmaps: dict[int, QPixmap] = dict()  # descIdx -> pixmap painted in place of the tile widget
+		self.genericTiles: dict[int, Path] = dict()  # descIdx -> descriptor dirPath, for the generically painted tiles
+		self.detailLevel: TileDetailLevel = TileDetailLevel.FULL
+		self.genericTileIcon: QIcon = self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon)
+		themeData: dict[str, str | None] = GetThemeData() or dict()  # same colors as the tiles of the example plugins
+		self.genericTileColor: QColor = QColor(themeData.get('secondaryDarkColor') or self.palette().alternateBase().color())
+		self.genericTileTextColor: QColor = QColor(themeData.get('secondaryTextColor') or self.palette().text().color())
+		self.shownDescIdxs: list[int] = []  # flow grid item -> descIdx, for the tiles not filtered out
+		self.tileItems: list[int] = []  # descIdx -> flow grid item, -1 if filtered out
+		self.setMouseTracking(True)
+
+	def SetShownDescriptorIndexes(self, shownDescIdxs: list[int], descsCount: int):
+		self.shownDescIdxs = shownDescIdxs
+		self.tileItems = [-1] * descsCount
+		for item, descIdx in enumerate(shownDescIdxs):
+			self.tileItems[descIdx] = item
+
+	def GetTileRect(self, descIdx: int) -> QRect:
+		return self.flowGrid.GetItemRect(self.tileItems[descIdx])
+
+	def GetTileAt(self, pos: QPoint) -> int:
+		item: int = self.flowGrid.GetItemAt(pos)
+		return self.shownDescIdxs[item] if item >= 0 else -1
+
+	def paintEvent(self, event):
+		painter = QPainter(self)
+		for descIdx, pixmap in self.tilePixmaps.items():
+			rect = self.GetTileRect(descIdx)
+			if rect.intersects(event.rect()):
+				painter.drawPixmap(rect.topLeft(), pixmap)
+		if self.genericTiles:
+			painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+			for descIdx, dirPath in self.genericTiles.items():
+				rect = self.GetTileRect(descIdx)
+				if rect.intersects(event.rect()):
+					self._paintGenericTile(painter, rect, dirPath)
+
+	def _paintGenericTile(self, painter: QPainter, rect: QRect, dirPath: Path):
+		painter.setPen(Qt.PenStyle.NoPen)
+		painter.setBrush(self.genericTileColor)
+		painter.drawRoundedRect(rect, 4, 4)
+		if self.detailLevel == TileDetailLevel.COMPACT:
+			iconRect = QRect(rect.left() + 5, rect.top() + (rect.height() - 16) // 2, 16, 16)
+			textRect = rect.adjusted(26, 0, -5, 0)
+			textFlags = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+		else:
+			iconRect = QRect(rect.center().x() - 16, rect.top() + 6, 32, 32)
+			textRect = QRect(rect.left() + 3, iconRect.bottom() + 4, rect.width() - 6, rect.bottom() - iconRect.bottom() - 4)
+			textFlags = Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop
+		self.genericTileIcon.paint(painter, iconRect)
+		painter.setPen(self.genericTileTextColor)
+		painter.drawText(textRect, textFlags, painter.fontMetrics().elidedText(dirPath.name, Qt.TextElideMode.ElideMiddle, textRect.width()))
+
+	def event(self, event: QEvent) -> bool:
+		if event.type() == QEvent.Type.ToolTip:
+			descIdx: int = self.GetTileAt(event.pos())
+			if descIdx in self.genericTiles:
+				QToolTip.showText(event.globalPos(), str(self.genericTiles[descIdx]), self)
+			else:
+				QToolTip.hideText()
+			return True
+		return super().event(event)
+
+	def mouseMoveEvent(self, event):
+		self.tileHovered.emit(self.GetTileAt(event.position().toPoint()))
+		super().mouseMoveEvent(event)
+
 class TilesWidget(QWidget):
+	""" Scrollable flow of descriptor tiles. Tile positions are computed arithmetically (FlowGrid) from the tile
+	sizes, and tile widgets only exist for the tiles intersecting the viewport plus an overscan band: they are
+	created (or recycled, see BaseTileBuilder.UpdateTileWidget) while scrolling and released once far from it.
+	Tiles not created yet are laid out with an estimated size until they get near the viewport.
+
+	Tiles the tile builder opts in (BaseTileBuilder.GetTilePixmapCacheKey) are rendered once to a cached pixmap
+	that is painted by the canvas; they are promoted to a live widget only while hovered.
+
+	Large inventories are shown with a lower level of detail (TileDetailLevel): compact tiles or a dense icon grid,
+	made by BaseTileBuilder.CreateDetailLevelTileWidget or painted generically by the canvas. The level follows the
+	number of shown tiles (see GetAutoTileDetailLevel) unless it is picked with the detail slider.
+
+	The tiles can be filtered by descriptor UID (SetDescriptorFilter): only the remaining ones are laid out. A rescan
+	patches the tiles in place (UpdateDescriptors): only the tiles of new or changed descriptors are created.
+
+	A tile builder may return an AsyncValue instead of the tile widget: its placeholder (or a label with the folder
+	name) is shown, and the tile is rebuilt once the AsyncValuesLoader has computed the result. """
+	TILES_MARGIN: int = 5
+	TILES_SPACING: int = 5
+	OVERSCAN: int = 300  # pixels above and below the viewport whose tiles are instantiated too
+	MAX_SPARE_TILES: int = 50  # released tile widgets kept for recycling
+	DEFAULT_TILE_SIZE: QSize = QSize(100, 50)  # estimate used until a tile has been measured
+	MAX_PROMOTED_TILES: int = 4  # pixmap tiles turned into live widgets on hover
+	AUTO_COMPACT_TILES_COUNT: int = 500  # shown tiles from which the automatic detail level is COMPACT
+	AUTO_DENSE_TILES_COUNT: int = 3000  # shown tiles from which the automatic detail level is DENSE
+	GENERIC_TILE_SIZES: dict[TileDetailLevel, QSize] = {
+		TileDetailLevel.COMPACT: QSize(180, 26),
+		TileDetailLevel.DENSE: QSize(80, 64),
+	}
+
 	def __init__(self, descs: list[BaseDescriptor], tileBuilder: BaseTileBuilder, swHandler: SoftwareHandler, viewUID: str, parent: QWidget):
 		super().__init__(parent)
 
@@ -38,17 +242,59 @@ class TilesWidget(QWidget):
 		self.viewUID: str = viewUID
 		self.mainWindow: 'MainWindow' = parent
 
-		self.flowLayout: FlowLayout | None = None
+		self.flowGrid: FlowGrid = FlowGrid(self.TILES_MARGIN, self.TILES_SPACING, self.TILES_SPACING)
+		self._isDetailLevelAuto: bool = True
+		self._detailLevel: TileDetailLevel = GetAutoTileDetailLevel(len(descs))
+		self._descUIDs: list[str] = [desc.GetUID() for desc in descs]  # descIdx -> descriptor UID
+		self._descsByUID: dict[str, BaseDescriptor] = dict(zip(self._descUIDs, descs))
+		self._descToIdx: dict[BaseDescriptor, int] = {desc: descIdx for descIdx, desc in enumerate(descs)}
+		self._tileSizes: list[QSize | None] = [self._getTileSizeHint(desc) for desc in descs]  # measured (or builder hinted) size per descriptor
+		self._estimatedTileSize: QSize | None = None  # size of the first measured tile
+		self._liveTiles: dict[int, QWidget] = dict()  # descIdx -> tile widget
+		self._promotedTiles: list[int] = []  # pixmap tiles currently shown as live widgets, oldest first
+		self._spareTiles: list[QWidget] = []
+		self._recyclingSupported: bool = True
+		self._visibleTilesUpdatePending: bool = False
+		self._measuringFirstTile: bool = False
+		self._descFilter: set[str] | None = None  # UIDs of the descriptors to show, None: no filter
+		self._asyncTileDescUIDs: set[str] = set()  # descriptors whose tiles wait for an AsyncValue
 
 		self.setAcceptDrops(True)  # accept tag bubbles dragged from the Tags palette
 
-		tiles = self._createTiles(descs)
-		flWidget = self._createFlowLayoutWithFromWidgets(tiles)
-		scrollWidget = self._wrapWidgetInScrollArea(flWidget)
+		# Connect to the bound method (a QObject slot) rather than a partial so Qt auto-disconnects this connection
+		# when the widget is destroyed (e.g. on workspace switch). Otherwise the bus outlives the widget and keeps
+		# firing into a deleted widget/mainWindow.
+		QApplication.instance().GetDescriptorUpdateBus().descriptorsUpdated.connect(self._onDescriptorsUpdated)
+		QApplication.instance().GetAsyncValuesLoader().asyncValuesReady.connect(self._onAsyncValuesReady)
+
+		self.tilesCanvas: TilesCanvas = TilesCanvas(self.flowGrid, self)
+		self.tilesCanvas.detailLevel = self._detailLevel
+		self.tilesCanvas.SetShownDescriptorIndexes(list(range(len(descs))), len(descs))
+		self.tilesCanvas.tileHovered.connect(self._onTileHovered)
+		self.tilesCanvas.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+		self.tilesCanvas.customContextMenuRequested.connect(self._onCanvasContextMenuRequested)
+		self.scrollArea: QScrollArea = self._wrapWidgetInScrollArea(self.tilesCanvas)
+		self.scrollArea.viewport().installEventFilter(self)
+		self.scrollArea.verticalScrollBar().valueChanged.connect(self._scheduleVisibleTilesUpdate)
 
 		layout = QVBoxLayout(self)
 		layout.setContentsMargins(0, 0, 0, 0)
-		layout.addWidget(scrollWidget)
+		layout.setSpacing(0)
+		layout.addWidget(self.scrollArea)
+		layout.addWidget(self._createDetailLevelBar())
+
+		self._relayoutTiles()
+		self._scheduleVisibleTilesUpdate()
+
+	def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+		if obj is self.scrollArea.viewport() and event.type() == QEvent.Type.Resize:
+			self._relayoutTiles()
+			self._scheduleVisibleTilesUpdate()
+		return super().eventFilter(obj, event)
+
+	def showEvent(self, event):
+		super().showEvent(event)
+		self._scheduleVisibleTilesUpdate()
 
 	def dragEnterEvent(self, event):
 		if event.mimeData().hasFormat(TAG_MIME_TYPE):
@@ -67,7 +313,7 @@ class TilesWidget(QWidget):
 			event.ignore()
 			return
 		tagUID: str = bytes(event.mimeData().data(TAG_MIME_TYPE).data()).decode('utf-8')
-		desc: BaseDescriptor | None = self._findDescriptorForChild(self.childAt(event.position().toPoint()))
+		desc: BaseDescriptor | None = self._findDescriptorAt(event.position().toPoint())
 		if desc is None:
 			event.ignore()
 			return
@@ -79,10 +325,25 @@ class TilesWidget(QWidget):
 		while w is not None and w is not self:
 			descUID = w.property("descriptor_uid")
 			if descUID:
-				return next((d for d in self.descs if d.GetUID() == descUID), None)
+				return self._descsByUID.get(descUID)
 			w = w.parentWidget()
 		return None
 
+	def _findDescriptorAt(self, pos: QPoint) -> BaseDescriptor | None:
+		child: QWidget | None = self.childAt(pos)
+		if child is self.tilesCanvas:  # a tile painted as a pixmap
+			descIdx: int = self.tilesCanvas.GetTileAt(self.tilesCanvas.mapFrom(self, pos))
+			return self.descs[descIdx] if descIdx >= 0 else None
+		return self._findDescriptorForChild(child)
+
+	def _onTileContextMenuRequested(self, pos):
+		if desc := self._findDescriptorForChild(self.sender()):
+			self._showContextMenu(desc)
+
+	def _onCanvasContextMenuRequested(self, pos: QPoint):
+		if (descIdx := self.tilesCanvas.GetTileAt(pos)) >= 0:
+			self._showContextMenu(self.descs[descIdx])
+
 	def _showContextMenu(self, desc: BaseDescriptor):
 		if menu := self.tileBuilder.GetContextMenu(desc):
 			tagUnderCursor: 'BaseTagImpl | None' = self._tagUnderCursor()
@@ -102,70 +363,341 @@ class TilesWidget(QWidget):
 	def _setupTileWidget(self, desc: BaseDescriptor, tileWidget: QWidget) -> QWidget:
 		tileWidget.setProperty("descriptor_uid", desc.GetUID())  # Store descriptor UID in widget property for later reference
 		tileWidget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-		tileWidget.customContextMenuRequested.connect(lambda pos, d=desc: self._showContextMenu(d))
+		tileWidget.customContextMenuRequested.connect(self._onTileContextMenuRequested)
 		return tileWidget
 
-	def _createTiles(self, descs: list[BaseDescriptor]) -> list[QWidget]:
-		tiles = []
+	def _acquireTile(self, descIdx: int) -> QWidget | None:
+		""" Returns a tile widget for the descriptor, recycling a spare one if the tile builder supports it. Below the
+		FULL detail level, None means that the tile is painted generically. """
+		desc: BaseDescriptor = self.descs[descIdx]
+		if self._detailLevel != TileDetailLevel.FULL:
+			tileWidget: QWidget | None = self._resolveTileWidget(desc, self.tileBuilder.CreateDetailLevelTileWidget(desc, self._detailLevel, self.mainWindow))
+			if tileWidget is None:
+				return None
+			tileWidget.setParent(self.tilesCanvas)
+			return self._setupTileWidget(desc, tileWidget)
+		while self._spareTiles:
+			tileWidget: QWidget = self._spareTiles.pop()
+			if self.tileBuilder.UpdateTileWidget(tileWidget, desc):
+				tileWidget.setProperty("descriptor_uid", desc.GetUID())
+				return tileWidget
+			self._recyclingSupported = False
+			tileWidget.deleteLater()
+		tileWidget: QWidget | None = self._resolveTileWidget(desc, self.tileBuilder.CreateTileWidget(desc, self.mainWindow))
+		if tileWidget is None:
+			return None
+		tileWidget.setParent(self.tilesCanvas)
+		return self._setupTileWidget(desc, tileWidget)
 
-		for desc in descs:
-			tileWidget = self.tileBuilder.CreateTileWidget(desc, self.mainWindow)
-			self._setupTileWidget(desc, tileWidget)
-			# Connect to the bound method (a QObject slot) rather than a partial so Qt auto-disconnects
-			# this connection when the widget is destroyed (e.g. on workspace switch). Otherwise the
-			# descriptor outlives the widget and keeps firing into a deleted widget/mainWindow.
-			desc.descDataUpdated.connect(self._onDescDataUpdated)
-			tiles.append(tileWidget)
+	def _resolveTileWidget(self, desc: BaseDescriptor, tileWidget: QWidget | AsyncValue | None) -> QWidget | None:
+		""" Returns the tile widget made by the builder, or the placeholder of an AsyncValue that is not computed yet. """
+		if not isinstance(tileWidget, AsyncValue):
+			return tileWidget
+		isReady, tileWidget = QApplication.instance().GetAsyncValuesLoader().Resolve(desc, tileWidget)
+		if isReady:
+			return tileWidget
+		self._asyncTileDescUIDs.add(desc.GetUID())
+		if tileWidget is None and self._detailLevel == TileDetailLevel.FULL:
+			tileWidget = QLabel(desc.dirPath.name, self.tilesCanvas)
+		if tileWidget is not None:
+			tileWidget.setProperty('async_placeholder', True)  # neither recycled nor cached as a pixmap
+		return tileWidget
 
-		return tiles
-	
-	def _onDescDataUpdated(self):
-		desc = self.sender()
-		if not isinstance(desc, BaseDescriptor):
+	def _releaseTile(self, descIdx: int):
+		self.tilesCanvas.tilePixmaps.pop(descIdx, None)
+		self.tilesCanvas.genericTiles.pop(descIdx, None)
+		if descIdx in self._promotedTiles:
+			self._promotedTiles.remove(descIdx)
+		if (tileWidget := self._liveTiles.pop(descIdx, None)) is not None:
+			self._recycleTileWidget(tileWidget)
+
+	def _recycleTileWidget(self, tileWidget: QWidget):
+		if self._detailLevel == TileDetailLevel.FULL and self._recyclingSupported and len(self._spareTiles) < self.MAX_SPARE_TILES \
+				and not tileWidget.property('async_placeholder'):
+			tileWidget.hide()
+			self._spareTiles.append(tileWidget)
+		else:
+			tileWidget.setParent(None)
+			tileWidget.deleteLater()
+
+	def _getTileSizeHint(self, desc: BaseDescriptor) -> QSize | None:
+		if self._detailLevel != TileDetailLevel.FULL:
+			return None  # the builder only hints the size of its full tiles
+		hintedSize: QSize = self.tileBuilder.GetTileSizeHint(desc)
+		return hintedSize if hintedSize.isValid() else None
+
+	def _getTileSize(self, descIdx: int) -> QSize:
+		if (size := self._tileSizes[descIdx]) is not None:
+			return size
+		return self._estimatedTileSize if self._estimatedTileSize is not None else self.DEFAULT_TILE_SIZE
+
+	def _relayoutTiles(self):
+		""" Recomputes the tile positions for the current viewport width and resizes the canvas accordingly. """
+		shownDescIdxs: list[int] = self.tilesCanvas.shownDescIdxs
+		if self._estimatedTileSize is None and shownDescIdxs:
+			if self._measuringFirstTile:
+				return  # rendering the tile flushed pending resize events; the width is read once it is measured
+			self._measuringFirstTile = True
+			try:
+				self._materializeTile(shownDescIdxs[0])  # measure one tile so the others can be estimated
+			finally:
+				self._measuringFirstTile = False
+		viewportWidth: int = self.scrollArea.viewport().width()
+		height: int = self.flowGrid.Layout([self._getTileSize(descIdx) for descIdx in shownDescIdxs], viewportWidth)
+		self.tilesCanvas.resize(max(viewportWidth, self.flowGrid.GetWidth()), height)
+		for descIdx, tileWidget in self._liveTiles.items():
+			tileWidget.setGeometry(self.tilesCanvas.GetTileRect(descIdx))
+		self.tilesCanvas.update()
+
+	def _materializeTile(self, descIdx: int) -> bool:
+		""" Makes the tile of a descriptor exist, as a cached pixmap or as a live widget, and returns whether its
+		measured size differs from the laid out one. """
+		if descIdx not in self._promotedTiles and (pixmap := self._getTilePixmap(descIdx)) is not None:
+			self.tilesCanvas.tilePixmaps[descIdx] = pixmap
+			return self._setMeasuredTileSize(descIdx, pixmap.deviceIndependentSize().toSize())
+		tileWidget: QWidget | None = self._acquireTile(descIdx)
+		if tileWidget is None:
+			if self._detailLevel == TileDetailLevel.FULL:
+				return False
+			self.tilesCanvas.genericTiles[descIdx] = self.descs[descIdx].dirPath
+			return self._setMeasuredTileSize(descIdx, self.GENERIC_TILE_SIZES[self._detailLevel])
+		self._liveTiles[descIdx] = tileWidget  # sized by its FlowGrid rect (see _relayoutTiles/_updateVisibleTiles)
+		return self._setMeasuredTileSize(descIdx, tileWidget.sizeHint())
+
+	def _setMeasuredTileSize(self, descIdx: int, size: QSize) -> bool:
+		if self._estimatedTileSize is None:
+			self._estimatedTileSize = size
+		changed: bool = size != self._getTileSize(descIdx)
+		self._tileSizes[descIdx] = size
+		return changed
+
+	def _getTilePixmapKey(self, descIdx: int) -> str | None:
+		""" Returns the cache key of a tile in pixmap mode, None for live tiles. The descriptor's fingerprint keeps the
+		pixmaps of rescanned descriptors whose content changed from being reused. The tile size is the builder's size
+		hint: without one, the size follows from the other parts of the key. """
+		desc: BaseDescriptor = self.descs[descIdx]
+		builderKey: str | None = self.tileBuilder.GetTilePixmapCacheKey(desc)
+		if builderKey is None:
+			return None
+		descDataVersion: str = self.tileBuilder.descDataAccessor.GetDescriptorData(desc).GetVersion()
+		hintedSize: QSize | None = self._getTileSizeHint(desc)
+		sizeKey: str = f'{hintedSize.width()}x{hintedSize.height()}' if hintedSize is not None else ''
+		if self._detailLevel != TileDetailLevel.FULL:
+			sizeKey += self._detailLevel.name  # the keys of full tiles stay as they were, so their disk cache is kept
+		return TilePixmapCache.MakeKey(desc.GetUID(), desc.GetFingerprint(), descDataVersion, GetThemeName(), f'{sizeKey}@{self.devicePixelRatioF()}', builderKey)
+
+	def _getTilePixmap(self, descIdx: int) -> QPixmap | None:
+		""" Returns the pixmap of a tile in pixmap mode, rendering the tile on a cache miss; None for live tiles. """
+		key: str | None = self._getTilePixmapKey(descIdx)
+		if key is None:
+			return None
+		tilePixmapCache: TilePixmapCache = GetTilePixmapCache()
+		useDisk: bool = self.tileBuilder.IsTilePixmapDiskCacheEnabled()
+		if (pixmap := tilePixmapCache.Get(key, useDisk, self.devicePixelRatioF())) is not None:
+			return pixmap
+		tileWidget: QWidget | None = self._acquireTile(descIdx)
+		if tileWidget is None:
+			return None
+		if tileWidget.property('async_placeholder'):
+			self._recycleTileWidget(tileWidget)
+			return None  # shown as a live widget until the tile can be rendered
+		tileWidget.resize(tileWidget.sizeHint())
+		pixmap = tileWidget.grab()
+		self._recycleTileWidget(tileWidget)
+		tilePixmapCache.Put(key, pixmap, useDisk)
+		return pixmap
+
+	def _scheduleVisibleTilesUpdate(self, *args):
+		""" Coalesces visible tiles updates (scrolling, resizing, data updates) into one pass on the next event loop tick. """
+		if self._visibleTilesUpdatePending:
 			return
-		updatedWidget = self.tileBuilder.CreateTileWidget(desc, self.mainWindow)
-		if updatedWidget:
-			self._replaceTileWidget(desc, updatedWidget)
-	
-	def _replaceTileWidget(self, desc: BaseDescriptor, newWidget: QWidget):
-		if self.flowLayout is None:
+		self._visibleTilesUpdatePending = True
+		QTimer.singleShot(0, self._updateVisibleTiles)
+
+	def _updateVisibleTiles(self):
+		""" Instantiates the tiles around the viewport, places them and releases the ones far from it. """
+		self._visibleTilesUpdatePending = False
+		while True:
+			top: int = self.scrollArea.verticalScrollBar().value()
+			visibleItems: range = self.flowGrid.GetItemsInRange(top - self.OVERSCAN, top + self.scrollArea.viewport().height() + self.OVERSCAN)
+			visibleIdxs: list[int] = self.tilesCanvas.shownDescIdxs[visibleItems.start:visibleItems.stop]
+			visibleIdxsSet: set[int] = set(visibleIdxs)
+			for descIdx in [descIdx for descIdx in self._liveTiles if descIdx not in visibleIdxsSet]:
+				self._releaseTile(descIdx)
+			sizesChanged: bool = False
+			for descIdx in visibleIdxs:
+				if not self._isTileMaterialized(descIdx):
+					sizesChanged = self._materializeTile(descIdx) or sizesChanged
+			if not sizesChanged:
+				break
+			self._relayoutTiles()  # measured tiles differ from the estimate: the tiles after them moved
+		for descIdx in visibleIdxs:
+			if tileWidget := self._liveTiles.get(descIdx):
+				tileWidget.setGeometry(self.tilesCanvas.GetTileRect(descIdx))
+				tileWidget.show()
+		self.tilesCanvas.update()
+
+	def _isTileMaterialized(self, descIdx: int) -> bool:
+		return descIdx in self._liveTiles or descIdx in self.tilesCanvas.tilePixmaps or descIdx in self.tilesCanvas.genericTiles
+
+	def _onTileHovered(self, descIdx: int):
+		""" Promotes a pixmap tile to a live widget, so that it reacts to hover and clicks as usual. """
+		if descIdx not in self.tilesCanvas.tilePixmaps:
 			return
+		del self.tilesCanvas.tilePixmaps[descIdx]
+		self._promotedTiles.append(descIdx)
+		if self._materializeTile(descIdx):
+			self._relayoutTiles()
+		if tileWidget := self._liveTiles.get(descIdx):
+			tileWidget.setGeometry(self.tilesCanvas.GetTileRect(descIdx))
+			tileWidget.show()
+		while len(self._promotedTiles) > self.MAX_PROMOTED_TILES:
+			self._releaseTile(self._promotedTiles[0])  # painted as a pixmap again by the next update
+		self._scheduleVisibleTilesUpdate()
+
+	def SetDescriptorFilter(self, descUIDs: set[str] | None):
+		""" Only shows the tiles of the descriptors whose UID is in descUIDs, None shows all tiles. """
+		self._descFilter = descUIDs
+		shownDescIdxs: list[int] = self._getShownDescriptorIndexes()
+		if shownDescIdxs != self.tilesCanvas.shownDescIdxs:
+			self._showDescriptorIndexes(shownDescIdxs)
 
-		descUID = desc.GetUID()
-		for index in range(self.flowLayout.count()):
-			item = self.flowLayout.itemAt(index)
-			if item is None:
-				continue
-			oldWidget = item.widget()
-			if oldWidget is None or oldWidget.property("descriptor_uid") != descUID:
-				continue
-
-			# Found the matching tile: remove the old one and insert the new one at the same position
-			self.flowLayout.takeAt(index)
-			oldWidget.setParent(None)
-			oldWidget.deleteLater()
-
-			self._setupTileWidget(desc, newWidget)
-			newWidget.setFixedWidth(newWidget.sizeHint().width())
-			self.flowLayout.insertWidget(index, newWidget)
+	def _getShownDescriptorIndexes(self) -> list[int]:
+		if self._descFilter is None:
+			return list(range(len(self.descs)))
+		return [descIdx for descIdx, descUID in enumerate(self._descUIDs) if descUID in self._descFilter]
+
+	def _showDescriptorIndexes(self, shownDescIdxs: list[int]):
+		shownDescIdxsSet: set[int] = set(shownDescIdxs)
+		for descIdx in [descIdx for descIdx in (*self._liveTiles, *self.tilesCanvas.tilePixmaps, *self.tilesCanvas.genericTiles) if descIdx not in shownDescIdxsSet]:
+			self._releaseTile(descIdx)
+		self.tilesCanvas.SetShownDescriptorIndexes(shownDescIdxs, len(self.descs))
+		if self._isDetailLevelAuto and (detailLevel := GetAutoTileDetailLevel(len(shownDescIdxs))) != self._detailLevel:
+			self._applyDetailLevel(detailLevel)
 			return
+		self._relayoutTiles()
+		self._scheduleVisibleTilesUpdate()
+
+	def UpdateDescriptors(self, descs: list[BaseDescriptor]):
+		""" Shows the given descriptors instead of the current ones, keeping the tiles (and their measured sizes) of
+		the descriptors present in both lists. Descriptors are matched by identity: a changed descriptor is expected
+		to be a new object (see DescriptorsDiff), so its tile is rebuilt. """
+		oldDescToIdx: dict[BaseDescriptor, int] = self._descToIdx
+		newDescToIdx: dict[BaseDescriptor, int] = {desc: descIdx for descIdx, desc in enumerate(descs)}
+		for desc, descIdx in oldDescToIdx.items():
+			if desc not in newDescToIdx:
+				self._releaseTile(descIdx)
+
+		# The kept tiles move to the new indexes of their descriptors
+		oldToNewIdx: dict[int, int] = {oldDescToIdx[desc]: descIdx for desc, descIdx in newDescToIdx.items() if desc in oldDescToIdx}
+		self._tileSizes = [self._tileSizes[oldDescToIdx[desc]] if desc in oldDescToIdx else self._getTileSizeHint(desc) for desc in descs]
+		self._liveTiles = {oldToNewIdx[descIdx]: tileWidget for descIdx, tileWidget in self._liveTiles.items()}
+		self._promotedTiles = [oldToNewIdx[descIdx] for descIdx in self._promotedTiles]
+		self.tilesCanvas.tilePixmaps = {oldToNewIdx[descIdx]: pixmap for descIdx, pixmap in self.tilesCanvas.tilePixmaps.items()}
+		self.tilesCanvas.genericTiles = {oldToNewIdx[descIdx]: dirPath for descIdx, dirPath in self.tilesCanvas.genericTiles.items()}
+
+		self.descs = descs
+		self._descUIDs = [desc.GetUID() for desc in descs]
+		self._descsByUID = dict(zip(self._descUIDs, descs))
+		self._descToIdx = newDescToIdx
+		self._showDescriptorIndexes(self._getShownDescriptorIndexes())
+
+	def RefreshTiles(self):
+		""" Rebuilds all tiles (e.g. after a setting they depend on changed). The tiles around the viewport are rebuilt
+		right away, the other ones are re-measured once they get near it. """
+		for descIdx in [*self._liveTiles, *self.tilesCanvas.tilePixmaps, *self.tilesCanvas.genericTiles]:
+			self._releaseTile(descIdx)
+		for tileWidget in self._spareTiles:
+			tileWidget.deleteLater()  # may still be styled after the old settings
+		self._spareTiles = []
+		self._tileSizes = [self._getTileSizeHint(desc) for desc in self.descs]
+		self._estimatedTileSize = None
+		self._relayoutTiles()
+		self._scheduleVisibleTilesUpdate()
 
-		logger.warning(f"No tile widget found for descriptor {descUID} to replace")
+	def GetDetailLevel(self) -> TileDetailLevel:
+		return self._detailLevel
 
-	def _createFlowLayoutWithFromWidgets(self, widgets: list[QWidget]) -> QWidget:
-		flWidget = QWidget(self)
-		flowLayout = FlowLayout(flWidget, margin=5, hspacing=5, vspacing=5)
-		flowLayout.setSpacing(0)
+	def SetDetailLevel(self, detailLevel: TileDetailLevel | None):
+		""" Shows the tiles with the given level of detail, None picks it automatically from the number of shown tiles. """
+		self._isDetailLevelAuto = detailLevel is None
+		if detailLevel is None:
+			detailLevel = GetAutoTileDetailLevel(len(self.tilesCanvas.shownDescIdxs))
+		self._updateDetailLevelBar()
+		if detailLevel != self._detailLevel:
+			self._applyDetailLevel(detailLevel)
+
+	def _applyDetailLevel(self, detailLevel: TileDetailLevel):
+		self._detailLevel = detailLevel
+		self.tilesCanvas.detailLevel = detailLevel
+		self._updateDetailLevelBar()
+		self.RefreshTiles()
+
+	def _createDetailLevelBar(self) -> QWidget:
+		barWidget = QWidget(self)
+		barLayout = QHBoxLayout(barWidget)
+		barLayout.setContentsMargins(5, 2, 5, 2)
+		barLayout.addStretch()
+		barLayout.addWidget(QLabel('Detail', barWidget))
+
+		self.detailLevelSlider: QSlider = QSlider(Qt.Orientation.Horizontal, barWidget)
+		self.detailLevelSlider.setRange(min(TileDetailLevel), max(TileDetailLevel))
+		self.detailLevelSlider.setPageStep(1)
+		self.detailLevelSlider.setFixedWidth(80)
+		self.detailLevelSlider.setToolTip('Level of detail of the tiles: icons grid, compact or full tiles')
+		self.detailLevelSlider.valueChanged.connect(lambda value: self.SetDetailLevel(TileDetailLevel(value)))
+		barLayout.addWidget(self.detailLevelSlider)
+
+		self.detailLevelAutoCheckbox: QCheckBox = QCheckBox('Auto', barWidget)
+		self.detailLevelAutoCheckbox.setToolTip('Lower the level of detail when many tiles are shown')
+		self.detailLevelAutoCheckbox.toggled.connect(lambda checked: self.SetDetailLevel(None if checked else self._detailLevel))
+		barLayout.addWidget(self.detailLevelAutoCheckbox)
+
+		self._updateDetailLevelBar()
+		return barWidget
+
+	def _updateDetailLevelBar(self):
+		for widget in (self.detailLevelSlider, self.detailLevelAutoCheckbox):
+			widget.blockSignals(True)
+		self.detailLevelSlider.setValue(self._detailLevel)
+		self.detailLevelAutoCheckbox.setChecked(self._isDetailLevelAuto)
+		for widget in (self.detailLevelSlider, self.detailLevelAutoCheckbox):
+			widget.blockSignals(False)
+
+	def _onDescriptorsUpdated(self, descUIDs: set[str]):
+		""" Rebuilds the tiles of a batch of updated descriptors (see DescriptorUpdateBus) in one pass: the canvas is
+		repainted and the tiles are laid out once for the whole batch. """
+		descIdxs: list[int] = [self._descToIdx[desc] for descUID in descUIDs if (desc := self._descsByUID.get(descUID)) is not None]
+		if not descIdxs:
+			return
+		self.tilesCanvas.setUpdatesEnabled(False)
+		sizesChanged: bool = False
+		for descIdx in descIdxs:
+			sizesChanged = self._rebuildTile(descIdx) or sizesChanged
+		if sizesChanged:
+			self._relayoutTiles()
+		self.tilesCanvas.setUpdatesEnabled(True)
+		self._scheduleVisibleTilesUpdate()
 
-		for widget in widgets:
-			widget.setFixedWidth(widget.sizeHint().width())
-			flowLayout.addWidget(widget)
+	def _onAsyncValuesReady(self, descUIDs: set[str]):
+		""" Rebuilds the tiles that show the placeholder of an async value that got computed. """
+		if readyDescUIDs := descUIDs & self._asyncTileDescUIDs:
+			self._asyncTileDescUIDs -= readyDescUIDs
+			self._onDescriptorsUpdated(readyDescUIDs)
 
-		self.flowLayout = flowLayout
-		return flWidget
+	def _rebuildTile(self, descIdx: int) -> bool:
+		""" Rebuilds the tile of a descriptor if it exists and returns whether its measured size changed. """
+		if not self._isTileMaterialized(descIdx):
+			self._tileSizes[descIdx] = self._getTileSizeHint(self.descs[descIdx])  # re-measured once it gets near the viewport
+			return False
+		isPromoted: bool = descIdx in self._promotedTiles
+		self._releaseTile(descIdx)
+		if isPromoted:
+			self._promotedTiles.append(descIdx)
+		return self._materializeTile(descIdx)
 
 	def _wrapWidgetInScrollArea(self, widget: QWidget) -> QScrollArea:
 		scrollWidget = QScrollArea(self)
-		scrollWidget.setWidgetResizable(True)
+		scrollWidget.setWidgetResizable(False)  # the canvas is sized after the flow grid
 		scrollWidget.setWidget(widget)
-		return scrollWidget
\ No newline at end of file
+		return scrollWidget
@@ -3,7 +3,7 @@ from pathlib import Path
 from functools import partial
 from typing import Type, Optional
 
-from PyQt6.QtCore import Qt, QMargins, QPoint, QByteArray, pyqtSignal
+from PyQt6.QtCore import Qt, QMargins, QPoint, QByteArray, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QIcon, QKeySequence, QCursor, QColor, QBrush, QPainter, QMouseEvent
 from PyQt6.QtWidgets import (
 	QMainWindow, QWidget, QLabel, QTabWidget, QScrollArea, QStatusBar, QTableWidgetItem, QTableWidget,
@@ -15,8 +15,10 @@ from PyQt6.QtWidgets import (
 from qavm.manager_plugin import PluginManager, SoftwareHandler, UID, QAVMWorkspace
 from qavm.manager_settings import SettingsManager, QAVMGlobalSettings
 from qavm.widget_tiles import TilesWidget
-from qavm.manager_descriptor_data import DescriptorDataManager, DescriptorDataImpl
+from qavm.manager_descriptor_data import DescriptorDataManager, DescriptorDataImpl, DescriptorDataCompactionReport
 from qavm.manager_tags import TagsManager, BaseTagImpl
+from qavm.manager_search import DescriptorSearchIndex
+from qavm.utils_descriptors import ProcessedDescriptorsCache
 
 from qavm.window_note_editor import NoteEditorDialog
 from qavm.window_about import AboutDialog
@@ -68,6 +70,9 @@ class MyTabWidget(QTabWidget):
 			self.setCurrentWidget(widget)
 
 class MainWindow(QMainWindow):
+	VIEW_PREFETCH_DELAY_MS: int = 200  # idle time after showing the window (or building a view) before building the next pending view
+	SETTING_UPDATES_DELAY_MS: int = 150  # settings changes (e.g. while dragging a slider) are applied to the views once they settle
+
 	def __init__(self, parent: QWidget | None = None) -> None:
 		super(MainWindow, self).__init__(parent)
 
@@ -79,9 +84,9 @@ class MainWindow(QMainWindow):
 		self.descDataManager: DescriptorDataManager = app.GetDescriptorDataManager()
 		self.tagsManager: TagsManager = app.GetTagsManager()
 
-		workspace: QAVMWorkspace = app.GetWorkspace()
-		self.workspaceID: str = workspace.GetID()
-		swHandlers, _ = workspace.GetInvolvedSoftwareHandlers()
+		self.workspace: QAVMWorkspace = app.GetWorkspace()
+		self.workspaceID: str = self.workspace.GetID()
+		swHandlers, _ = self.workspace.GetInvolvedSoftwareHandlers()
 		swTitle: str = ', '.join([f'{sw.GetName()}' for sw in swHandlers])[:50]
 
 		self.setWindowTitle(f'QAVM {GetQAVMVersionVariant()} - [{swTitle}]')
@@ -90,6 +95,28 @@ class MainWindow(QMainWindow):
 
 		self.pluginMenuItems: list[QMenu | QAction] = list()  # for some reason QMenu and QAction need to live in the MainWindow, otherwise Qt gets rid of them
 
+		# The filter bar narrows the tiles/table views down to the descriptors matching its text and the tags selected in
+		# the tags palette. Only the current tab is filtered on every change, the other ones when they get shown.
+		self.searchIndex: DescriptorSearchIndex = DescriptorSearchIndex(self.descDataManager, self.tagsManager, self)
+		self.searchIndex.indexChanged.connect(self._scheduleFilterUpdate)
+		self.filterableViews: dict[QWidget, list[BaseDescriptor]] = dict()  # tiles/table view -> its descriptors
+		self._filterText: str = ''
+		self._filterTagUIDs: tuple[frozenset[str], frozenset[str]] = (frozenset(), frozenset())  # (required, excluded)
+		self._appliedFilters: dict[QWidget, tuple | None] = dict()  # view -> filter it is filtered by (None: outdated)
+		self._filterUpdatePending: bool = False
+
+		# Tiles/table tabs start as placeholders: a view is built (and its software scanned) when its tab gets shown
+		# first, or once the window is idle (see _schedulePendingViewPrefetch)
+		self.pendingViews: dict[QWidget, partial] = dict()  # placeholder tab -> builds its view
+		self._viewPrefetchScheduled: bool = False
+
+		# (settings, builder class) -> names of the changed settings, applied to the views in one pass
+		self._pendingSettingUpdates: dict[tuple[BaseSettings, type[BaseBuilder]], set[str]] = dict()
+		self._settingUpdatesTimer: QTimer = QTimer(self)
+		self._settingUpdatesTimer.setSingleShot(True)
+		self._settingUpdatesTimer.setInterval(self.SETTING_UPDATES_DELAY_MS)
+		self._settingUpdatesTimer.timeout.connect(self._applyPendingSettingUpdates)
+
 		self._setupActions()
 		self._setupMenuBar()
 		self._setupStatusBar()
@@ -116,6 +143,13 @@ class MainWindow(QMainWindow):
 		self.actionRescan.setShortcut("Ctrl+F5")
 		self.actionRescan.triggered.connect(self._rescanSoftware)
 
+		self.actionCompactDescData = QAction("Compact Descriptor Data...", self)
+		self.actionCompactDescData.triggered.connect(self._compactDescriptorData)
+
+		self.actionFilter = QAction("&Filter Descriptors", self)
+		self.actionFilter.setShortcut(QKeySequence.StandardKey.Find)
+		self.actionFilter.triggered.connect(self._focusFilterBar)
+
 		self.actionAbout = QAction("&About", self)
 		self.actionAbout.triggered.connect(self._showAboutDialog)
 
@@ -126,6 +160,7 @@ class MainWindow(QMainWindow):
 		fileMenu: QMenu = QMenu("&File", self)
 		fileMenu.addAction(self.actionPluginSelection)
 		fileMenu.addAction(self.actionRescan)
+		fileMenu.addAction(self.actionCompactDescData)
 		fileMenu.addSeparator()
 		fileMenu.addAction(self.actionPrefs)
 		fileMenu.addSeparator()
@@ -164,6 +199,7 @@ class MainWindow(QMainWindow):
 							logger.warning(f"Menu item {menu} is not a valid QMenu or QAction. Skipping.")
 
 		self.viewMenu: QMenu = QMenu("&View", self)
+		self.viewMenu.addAction(self.actionFilter)
 		menuBar.addMenu(self.viewMenu)
 
 		helpMenu: QMenu = QMenu("&Help", self)
@@ -190,17 +226,24 @@ class MainWindow(QMainWindow):
 	def _setupCentralWidget(self):
 		self.tabsWidget: MyTabWidget = MyTabWidget(self)
 		self.tableWidgets: list[MyTableWidget] = []
+		self.filterableViews = dict()
+		self.pendingViews = dict()
+		self.viewBuilders: dict[QWidget, BaseBuilder] = dict()  # tiles/table view -> its builder
+		self.customViews: dict[QWidget, tuple[SoftwareHandler, str]] = dict()  # custom view -> (its software, viewUID)
+		self.descriptorsMaps: dict[SoftwareHandler, dict[str, list[BaseDescriptor]]] = dict()  # the scan results the views are built from
+		self.viewSettings: set[SoftwareBaseSettings] = set()  # settings of the views, whose changes update them
+		self._appliedFilters = dict()
 
 		app = QApplication.instance()
 		workspace: QAVMWorkspace = app.GetWorkspace()
 
 		for swHandler, tilesViewsUIDs in workspace.GetTilesViews().items():
 			for viewUID in tilesViewsUIDs:
-				self._createTilesView(swHandler, viewUID)
+				self._addTilesView(swHandler, viewUID)
 
 		for swHandler, tilesViewsUIDs in workspace.GetTableViews().items():
 			for viewUID in tilesViewsUIDs:
-				self._createTableView(swHandler, viewUID)
+				self._addTableView(swHandler, viewUID)
 
 		for swHandler, customViews in workspace.GetCustomViews().items():
 			for viewUID in customViews:
@@ -208,70 +251,205 @@ class MainWindow(QMainWindow):
 
 		# TODO: FreeMove view is currently not implemented
 
+		self._setupFilterBar()
+
 		self.setCentralWidget(self.tabsWidget)
 
 		self.tabsWidget.currentChanged.connect(self._onTabChanged)
 		lastOpenedTab: int = self.qavmSettings.GetWorkspaceLastOpenedTab(self.workspaceID)
 		if lastOpenedTab >= 0 and lastOpenedTab < self.tabsWidget.count():
 			self.tabsWidget.setCurrentIndex(lastOpenedTab)
+		self._buildPendingView(self.tabsWidget.currentWidget())
+
+	def _setupFilterBar(self):
+		""" The filter bar lives in the tabs corner, it is recreated with the tabs (e.g. on rescan) keeping its text. """
+		self.filterEdit: QLineEdit = QLineEdit(self._filterText, self.tabsWidget)
+		self.filterEdit.setPlaceholderText(f'Filter ({self.actionFilter.shortcut().toString(QKeySequence.SequenceFormat.NativeText)})')
+		self.filterEdit.setToolTip('Shows only the descriptors whose path, notes or tag names contain all the words typed in')
+		self.filterEdit.setClearButtonEnabled(True)
+		self.filterEdit.setMinimumWidth(250)
+		self.filterEdit.textChanged.connect(self._onFilterTextChanged)
+		self.tabsWidget.setCornerWidget(self.filterEdit, Qt.Corner.TopRightCorner)
+		if self._filterText:
+			self._scheduleFilterUpdate()
+
+	def _focusFilterBar(self):
+		self.searchIndex.Build()  # before the first keystroke rather than on it
+		self.filterEdit.setFocus(Qt.FocusReason.ShortcutFocusReason)
+		self.filterEdit.selectAll()
+
+	def _onFilterTextChanged(self, text: str):
+		self._filterText = text
+		self._applyFilter(self.tabsWidget.currentWidget())
+
+	def _onTagFilterChanged(self):
+		requiredTagUIDs, excludedTagUIDs = self.tagsPalette.GetTagFilter()
+		self._filterTagUIDs = (frozenset(requiredTagUIDs), frozenset(excludedTagUIDs))
+		self._applyFilter(self.tabsWidget.currentWidget())
+
+	def _applyFilter(self, view: QWidget | None):
+		""" Filters the view by the filter bar text and the palette tags, unless it is already filtered by them. """
+		viewFilter: tuple = (self._filterText, *self._filterTagUIDs)
+		if view not in self.filterableViews or self._appliedFilters.get(view, ('', frozenset(), frozenset())) == viewFilter:
+			return
+		view.SetDescriptorFilter(self.searchIndex.Search(*viewFilter))
+		self._appliedFilters[view] = viewFilter
+
+	def _scheduleFilterUpdate(self):
+		""" Re-filters the views once the pending descriptor data updates have been indexed (their text may have stopped
+		or started matching). """
+		self._appliedFilters = dict.fromkeys(self._appliedFilters)  # filtered views are outdated, unfiltered ones are not
+		if self._filterUpdatePending:
+			return
+		self._filterUpdatePending = True
+		QTimer.singleShot(0, self._updateFilter)
 
+	def _updateFilter(self):
+		self._filterUpdatePending = False
+		self._applyFilter(self.tabsWidget.currentWidget())
 
-	def _prepareDescriptors(self, swHandler: SoftwareHandler, viewUID: str, builder: BaseBuilder):
-		# TODO: consider having some more understandable scheme for fetching descriptor types from dataPaths
-		descTypes: list[str] = [t for t in map(UID.DataPathGetLastPart, swHandler.GetDescriptorClasses().keys()) if t]
-		descTypes = builder.GetSupportedDescriptorTypes(descTypes)
-		if not descTypes:
-			return []
 
+	def _prepareDescriptors(self, swHandler: SoftwareHandler, viewUID: str, builder: BaseBuilder):
 		app = QApplication.instance()
-		descsMap: dict[str, list[BaseDescriptor]] = app.GetSoftwareDescriptors(swHandler)  # TODO: check to not iterate unnecessarily over unsupported descriptors
-		
-		descs: list[BaseDescriptor] = []
-		for descUID, descsCur in descsMap.items():
-			descType: Optional[str] = UID.DataPathGetLastPart(descUID)
-			if descType in descTypes:
-				descs.extend(builder.ProcessDescriptors(descType, descsCur))
+		processedDescsCache: ProcessedDescriptorsCache = app.GetProcessedDescriptorsCache()
+		if not processedDescsCache.GetSupportedDescriptorTypes(swHandler, viewUID, builder):
+			return []
 
-		return descs
+		descsMap: dict[str, list[BaseDescriptor]] = app.GetSoftwareDescriptors(swHandler)
+		self.descriptorsMaps[swHandler] = descsMap
+		return processedDescsCache.GetDescriptors(swHandler, viewUID, builder, descsMap)
 		
-	def _createTilesView(self, swHandler: SoftwareHandler, viewUID: str):
+	def _addTilesView(self, swHandler: SoftwareHandler, viewUID: str):
 		tileBuilderClass: Type[BaseTileBuilder] | None = swHandler.GetTileBuilderClass(viewUID)
 		if tileBuilderClass is None or not issubclass(tileBuilderClass, BaseTileBuilder):
 			return
 		tileBuilder: BaseTileBuilder = tileBuilderClass(swHandler.GetSettings(), self.descDataManager.GetDescriptorDataAccessor())
-		
+		self._connectViewSettings(tileBuilder.settings)
+		self._addPendingView(swHandler, viewUID, tileBuilder, self._createTilesView)
+
+	def _createTilesView(self, swHandler: SoftwareHandler, viewUID: str, tileBuilder: BaseTileBuilder) -> QWidget:
 		descs: list[BaseDescriptor] = self._prepareDescriptors(swHandler, viewUID, tileBuilder)
 
-		if tilesView := TilesWidget(descs, tileBuilder, swHandler, viewUID, parent=self):
-			self.tabsWidget.insertTab(0, tilesView, tileBuilder.GetName())
-			# self.tabsWidget.addTabWithUid(tilesView, tileBuilder.GetName(), viewUID+descUID)
-			
-	def _createTableView(self, swHandler: SoftwareHandler, viewUID: str):
+		tilesView: TilesWidget = TilesWidget(descs, tileBuilder, swHandler, viewUID, parent=self)
+		self.filterableViews[tilesView] = descs
+		self.viewBuilders[tilesView] = tileBuilder
+		return tilesView
+
+	def _addTableView(self, swHandler: SoftwareHandler, viewUID: str):
 		tableBuilderClass: Type[BaseTableBuilder] | None = swHandler.GetTableBuilderClass(viewUID)
 		if tableBuilderClass is None or not issubclass(tableBuilderClass, BaseTableBuilder):
 			return
-		
 		tableBuilder: BaseTableBuilder = tableBuilderClass(swHandler.GetSettings(), self.descDataManager.GetDescriptorDataAccessor())
-		
+		self._connectViewSettings(tableBuilder.settings)
+		self._addPendingView(swHandler, viewUID, tableBuilder, self._createTableView)
+
+	def _createTableView(self, swHandler: SoftwareHandler, viewUID: str, tableBuilder: BaseTableBuilder) -> QWidget:
 		descs: list[BaseDescriptor] = self._prepareDescriptors(swHandler, viewUID, tableBuilder)
 		
-		self.tableWidget: MyTableWidget = MyTableWidget(descs, tableBuilder, swHandler, viewUID, parent=self)
-		self.tabsWidget.insertTab(0, self.tableWidget, tableBuilder.GetName())
-		# self.tabsWidget.addTabWithUid(tableWidget, tableBuilder.GetName(), viewUID+descUID)
-		self.tableWidgets.append(self.tableWidget)
-
+		# The saved state is applied by the table itself, so that the getters of hidden columns are never called
 		savedState: dict = self.qavmSettings.GetWorkspaceTableViewState(self.workspaceID, viewUID)
-		if savedState:
-			self.tableWidget.ApplyViewState(savedState)
+		self.tableWidget: MyTableWidget = MyTableWidget(descs, tableBuilder, swHandler, viewUID, parent=self, viewState=savedState)
+		self.tableWidgets.append(self.tableWidget)
+		self.filterableViews[self.tableWidget] = descs
+		self.viewBuilders[self.tableWidget] = tableBuilder
+		return self.tableWidget
 
-	def _createCustomView(self, swHandler: SoftwareHandler, viewUID: str):
+	def _connectViewSettings(self, settings: SoftwareBaseSettings | None):
+		if settings is None or settings in self.viewSettings:
+			return
+		self.viewSettings.add(settings)
+		# Bound methods, so that Qt disconnects them once the window is destroyed (the settings outlive it)
+		settings.tilesUpdateRequired.connect(self._onTilesUpdateRequired)
+		settings.tablesUpdateRequired.connect(self._onTablesUpdateRequired)
+
+	def _onTilesUpdateRequired(self, settingName: str):
+		self._scheduleSettingUpdate(self.sender(), settingName, BaseTileBuilder)
+
+	def _onTablesUpdateRequired(self, settingName: str):
+		self._scheduleSettingUpdate(self.sender(), settingName, BaseTableBuilder)
+
+	def _scheduleSettingUpdate(self, settings: BaseSettings, settingName: str, builderClass: type[BaseBuilder]):
+		""" Coalesces the changes of settings into one views update, once no change came for SETTING_UPDATES_DELAY_MS. """
+		self._pendingSettingUpdates.setdefault((settings, builderClass), set()).add(settingName)
+		self._settingUpdatesTimer.start()
+
+	def _applyPendingSettingUpdates(self):
+		pendingSettingUpdates, self._pendingSettingUpdates = self._pendingSettingUpdates, dict()
+		for (settings, builderClass), settingNames in pendingSettingUpdates.items():
+			self._updateViewsOnSettingChanged(settings, settingNames, builderClass)
+
+	def _updateViewsOnSettingChanged(self, settings: BaseSettings, settingNames: set[str], builderClass: type[BaseBuilder]):
+		""" Updates the views depending on changed settings: their descriptors are processed again (see
+		ProcessedDescriptorsCache) and patched in, then the tiles are rebuilt, or only the table columns depending on
+		the settings are re-evaluated. Views not built yet pick the settings up once they are. """
+		descsChanged: bool = False
+		for view, builder in self.viewBuilders.items():
+			if builder.settings is not settings or not isinstance(builder, builderClass):
+				continue
+			descs: list[BaseDescriptor] = self._prepareDescriptors(view.swHandler, view.viewUID, builder)
+			if descs != self.filterableViews[view]:
+				view.UpdateDescriptors(descs)
+				self.filterableViews[view] = descs
+				descsChanged = True
+			if isinstance(view, TilesWidget):
+				view.RefreshTiles()
+			elif isinstance(view, MyTableWidget):
+				view.InvalidateColumns(sorted({col for settingName in settingNames for col in view.GetSettingColumns(settingName)}))
+		if descsChanged:
+			self.searchIndex.SetDescriptors([desc for descs in self.filterableViews.values() for desc in descs])
+
+	def _addPendingView(self, swHandler: SoftwareHandler, viewUID: str, builder: BaseBuilder, createView):
+		""" Adds a placeholder tab for a view, createView(swHandler, viewUID, builder) builds it once needed. """
+		placeholder: QWidget = QWidget(self.tabsWidget)
+		placeholder.swHandler = swHandler  # the tags palette takes its active context from the current tab
+		placeholder.viewUID = viewUID
+		self.tabsWidget.insertTab(0, placeholder, builder.GetName())
+		# self.tabsWidget.addTabWithUid(view, builder.GetName(), viewUID+descUID)
+		self.pendingViews[placeholder] = partial(createView, swHandler, viewUID, builder)
+
+	def _buildPendingView(self, tab: QWidget | None) -> QWidget | None:
+		""" Builds the view of a placeholder tab and puts it in place of the placeholder. Returns the tab's view. """
+		if (createView := self.pendingViews.pop(tab, None)) is None:
+			return tab
+		view: QWidget = createView()
+		index: int = self.tabsWidget.indexOf(tab)
+		isCurrent: bool = self.tabsWidget.currentIndex() == index
+		self.tabsWidget.blockSignals(True)  # the current tab stays the same, only its widget changes
+		self.tabsWidget.insertTab(index, view, self.tabsWidget.tabText(index))
+		self.tabsWidget.removeTab(index + 1)
+		if isCurrent:
+			self.tabsWidget.setCurrentIndex(index)
+		self.tabsWidget.blockSignals(False)
+		tab.deleteLater()
+		if view in self.filterableViews:
+			self.searchIndex.SetDescriptors([desc for descs in self.filterableViews.values() for desc in descs])
+		return view
+
+	def _schedulePendingViewPrefetch(self):
+		if self.pendingViews and not self._viewPrefetchScheduled:
+			self._viewPrefetchScheduled = True
+			QTimer.singleShot(self.VIEW_PREFETCH_DELAY_MS, self._prefetchPendingView)
+
+	def _prefetchPendingView(self):
+		""" Builds the first pending view (in tabs order), one per idle tick so that the window stays responsive. """
+		self._viewPrefetchScheduled = False
+		if not self.isVisible():
+			return  # resumed once shown again
+		for index in range(self.tabsWidget.count()):
+			if (tab := self.tabsWidget.widget(index)) in self.pendingViews:
+				self._buildPendingView(tab)
+				break
+		self._schedulePendingViewPrefetch()
+
+	def _createCustomView(self, swHandler: SoftwareHandler, viewUID: str, tabIndex: int = 0):
 		customViewClass: Type[BaseCustomView] | None = swHandler.GetCustomViewClass(viewUID)
 		if customViewClass is None or not issubclass(customViewClass, BaseCustomView):
 			return
 		
 		softwareSettings: SoftwareBaseSettings = swHandler.GetSettings()
 		if customViewWidget := customViewClass(softwareSettings, self):
-			self.tabsWidget.insertTab(0, customViewWidget, customViewWidget.GetName())
+			self.tabsWidget.insertTab(tabIndex, customViewWidget, customViewWidget.GetName())
+			self.customViews[customViewWidget] = (swHandler, viewUID)
 
 	def _setupTagsDock(self):
 		self.tagsPalette: TagsPaletteWidget = TagsPaletteWidget(self)
@@ -291,6 +469,7 @@ class MainWindow(QMainWindow):
 
 		# Keep the palette's active-context filter in sync with the current tab
 		self.tabsWidget.currentChanged.connect(lambda _idx: self.tagsPalette.OnActiveContextChanged())
+		self.tagsPalette.tagFilterChanged.connect(self._onTagFilterChanged)
 
 		# Restore the tags palette dock layout (visibility / floating / docked side) from the last session.
 		savedWindowState: str = self.qavmSettings.GetMainWindowState()
@@ -306,9 +485,17 @@ class MainWindow(QMainWindow):
 		self.qavmSettings.SetWorkspaceLastOpenedTab(self.workspaceID, index)
 		self.qavmSettings.Save()  # TODO: should save now or later once per all changes?
 
+		view: QWidget | None = self._buildPendingView(self.tabsWidget.widget(index))
+
 		if getattr(self, 'tableWidget', None) is not None:
 			self.tableWidget.clearFocus()
 
+		self._applyFilter(view)
+
+	def showEvent(self, event):
+		super().showEvent(event)
+		self._schedulePendingViewPrefetch()
+
 	def closeEvent(self, event):
 		self._saveUIState()
 		super().closeEvent(event)
@@ -329,6 +516,24 @@ class MainWindow(QMainWindow):
 
 		self.qavmSettings.Save()
 
+	def IsUpToDate(self) -> bool:
+		""" Returns False if software shown in the window has been rescanned since its views were built (e.g. from
+		another workspace sharing the software). """
+		app = QApplication.instance()
+		return all(app.softwareDescriptors.get(swHandler) is descsMap for swHandler, descsMap in self.descriptorsMaps.items())
+
+	def GetDescriptorsCount(self) -> int:
+		""" Returns the number of descriptors shown in the tiles/table views, i.e. roughly how heavy the window is. """
+		return sum(len(descs) for descs in self.filterableViews.values())
+
+	def RestoreUIState(self):
+		""" Re-applies the global window geometry and dock layout, which may have been changed by the windows of other
+		workspaces while this one was hidden. """
+		savedWindowState: str = self.qavmSettings.GetMainWindowState()
+		if savedWindowState:
+			self.restoreState(QByteArray.fromBase64(savedWindowState.encode('ascii')))
+		self._restoreWindowGeometry()
+
 	def _restoreWindowGeometry(self):
 		""" Restores the window position/size onto the same screen; falls back to centering on the primary screen. """
 		geometryB64: str = self.qavmSettings.GetMainWindowGeometry()
@@ -419,14 +624,42 @@ class MainWindow(QMainWindow):
 		self.dialogsManager.ShowWorkspaceManager()
 	
 	def _rescanSoftware(self):
+		""" Rescans the workspace software and patches the tiles/table views with the differences, so they keep their
+		state (scroll position, selection, sorting) and only build the tiles and rows of new or changed descriptors.
+		Custom views get no descriptors from the window, they are recreated in place. """
 		app = QApplication.instance()
 		swHandlers, _ = app.GetWorkspace().GetInvolvedSoftwareHandlers()
 		for swHandler in swHandlers:
 			app.LoadSoftwareDescriptors(swHandler)
-		oldWidget = self.takeCentralWidget()
-		if oldWidget:
-			oldWidget.deleteLater()
-		self._setupCentralWidget()
+
+		self.descriptorsMaps = dict()
+		for view, builder in self.viewBuilders.items():
+			descs: list[BaseDescriptor] = self._prepareDescriptors(view.swHandler, view.viewUID, builder)
+			view.UpdateDescriptors(descs)
+			self.filterableViews[view] = descs
+
+		currentTabIndex: int = self.tabsWidget.currentIndex()
+		for customView, (swHandler, viewUID) in list(self.customViews.items()):
+			tabIndex: int = self.tabsWidget.indexOf(customView)
+			del self.customViews[customView]
+			self.tabsWidget.removeTab(tabIndex)
+			customView.deleteLater()
+			self._createCustomView(swHandler, viewUID, tabIndex)
+		self.tabsWidget.setCurrentIndex(currentTabIndex)
+
+		self.searchIndex.SetDescriptors([desc for descs in self.filterableViews.values() for desc in descs])
+
+	def _compactDescriptorData(self):
+		report: DescriptorDataCompactionReport = self.descDataManager.CompactData(prune=False)
+		if not report.orphanedEntries and not report.emptyEntries:
+			QMessageBox.information(self, "Compact Descriptor Data", f'Nothing to prune.\n\n{report.GetSummary()}')
+			return
+		answer = QMessageBox.question(self, "Compact Descriptor Data", f'{report.GetSummary()}\n\nPrune these entries now?',
+								QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
+		if answer != QMessageBox.StandardButton.Yes:
+			return
+		report = self.descDataManager.CompactData(prune=True)
+		self.statusBar.showMessage(f'Descriptor data compacted: {len(report.orphanedEntries)} orphaned and {len(report.emptyEntries)} empty entries pruned', 5000)
 
 	def _showAboutDialog(self):
 		aboutDialog: AboutDialog = AboutDialog(self, self.pluginManager)
@@ -3,12 +3,12 @@ import uuid
 from enum import IntEnum
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import Qt, QPoint, pyqtSignal, QMimeData
+from PyQt6.QtCore import Qt, QPoint, QTimer, pyqtSignal, QMimeData
 from PyQt6.QtWidgets import (
 	QApplication, QMenu, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton,
 	QScrollArea, QMessageBox, QDialog, QTreeWidget, QTreeWidgetItem, QDialogButtonBox,
 )
-from PyQt6.QtGui import QAction, QColor, QDrag, QPainter, QPixmap, QMouseEvent
+from PyQt6.QtGui import QAction, QColor, QDrag, QPainter, QPixmap, QMouseEvent, QPen
 
 from qavm.qavmapi import BaseDescriptor
 from qavm.manager_tags import TagsManager, BaseTagImpl, TagScope
@@ -33,6 +33,13 @@ class ScopePreset(IntEnum):
 	CUSTOM = 3
 
 
+class TagFilterState(IntEnum):
+	""" How a tag selected in the palette filters the views. Clicking a bubble cycles through the states. """
+	NONE = 0
+	REQUIRED = 1  # only descriptors having the tag are shown
+	EXCLUDED = 2  # only descriptors not having the tag are shown
+
+
 def _viewMatches(scopeView: str, filterView: str) -> bool:
 	""" Returns True if a scope's viewUID is compatible with the selected view filter. """
 	if not scopeView or not filterView:
@@ -64,10 +71,12 @@ class TagBubbleWidget(HoverFadeTooltipMixin, BubbleWidget):
 	""" A colorful bubble representing a tag. Supports drag (to assign), hover tooltip and a context menu. """
 	editRequested = pyqtSignal(object)    # emits BaseTagImpl
 	deleteRequested = pyqtSignal(object)  # emits BaseTagImpl
+	filterToggleRequested = pyqtSignal(object)  # emits BaseTagImpl
 	
 	BUBBLE_ROUNDING: float = 17.0
 	BUBBLE_MARGIN: int = 11
 	TOOLTIP_DELAY_MS: int = 500
+	FILTER_OUTLINE_WIDTH: int = 3
 
 	def __init__(self, tag: BaseTagImpl, draggable: bool = True, contextMenuEnabled: bool = True, parent: QWidget | None = None):
 		bgColor: QColor | None = QColor(tag.GetColor()) if tag.GetColor() else None
@@ -86,11 +95,36 @@ class TagBubbleWidget(HoverFadeTooltipMixin, BubbleWidget):
 		self._ctrlHeldOnPress: bool = False
 		self._shiftHeldOnPress: bool = False
 
+		self._filterState: TagFilterState = TagFilterState.NONE
+		# A plain click toggles the filter once it is known not to be the first click of a double click (edit)
+		self._filterToggleTimer: QTimer = QTimer(self)
+		self._filterToggleTimer.setSingleShot(True)
+		self._filterToggleTimer.setInterval(QApplication.doubleClickInterval())
+		self._filterToggleTimer.timeout.connect(lambda: self.filterToggleRequested.emit(self.tag))
+
 		self._InitHoverTooltip(persistentTooltip=True)
 
 	def GetTag(self) -> BaseTagImpl:
 		return self.tag
 
+	def SetFilterState(self, state: TagFilterState):
+		self._filterState = state
+		self.update()
+
+	def paintEvent(self, evt):
+		super().paintEvent(evt)
+		if self._filterState == TagFilterState.NONE:
+			return
+		themeData = GetThemeData()
+		color: QColor = QColor(themeData.get('primaryColor', '#ffffff')) if themeData else QColor('#ffffff')
+		p: QPainter = QPainter(self)
+		p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+		p.setPen(QPen(color, self.FILTER_OUTLINE_WIDTH))
+		inset: float = self.FILTER_OUTLINE_WIDTH / 2
+		p.drawRoundedRect(self.rect().toRectF().adjusted(inset, inset, -inset, -inset), self.rounding, self.rounding)
+		if self._filterState == TagFilterState.EXCLUDED:
+			p.drawLine(self.rect().bottomLeft() + QPoint(self.roundingMargin, -self.roundingMargin), self.rect().topRight() + QPoint(-self.roundingMargin, self.roundingMargin))
+
 	def _CollectTagUsages(self) -> list[tuple[str, str, list[BaseDescriptor]]]:
 		""" Returns [(pluginName, softwareName, [descriptors])] for every loaded descriptor that has this tag assigned. """
 		app = QApplication.instance()
@@ -132,6 +166,9 @@ class TagBubbleWidget(HoverFadeTooltipMixin, BubbleWidget):
 			# Ctrl+click (released without having started a drag) → open editor
 			elif self._ctrlHeldOnPress and self._dragStartPos is not None:
 				self.editRequested.emit(self.tag)
+			# Plain click → cycle the tag's filter state
+			elif self._dragStartPos is not None:
+				self._filterToggleTimer.start()
 			self._dragStartPos = None
 			self._ctrlHeldOnPress = False
 			self._shiftHeldOnPress = False
@@ -140,6 +177,7 @@ class TagBubbleWidget(HoverFadeTooltipMixin, BubbleWidget):
 	def mouseDoubleClickEvent(self, event):
 		if event.button() == Qt.MouseButton.LeftButton:
 			self._CancelTooltip()
+			self._filterToggleTimer.stop()
 			self._dragStartPos = None
 			self._ctrlHeldOnPress = False
 			self._shiftHeldOnPress = False
@@ -219,6 +257,7 @@ class TagBubbleWidget(HoverFadeTooltipMixin, BubbleWidget):
 		# Number of descriptors that currently have this tag assigned.
 		usageCount: int = self._CountTagUsages()
 		rows.append(f'<tr><td colspan="2" style="padding-top:6px; color:{colorPrimary.name()};"><i>Usages: {usageCount}</i></td></tr>')
+		rows.append(f'<tr><td colspan="2" style="padding-top:6px; color:{colorPrimary.name()};"><i>Click to filter the views: with the tag / without it / off</i></td></tr>')
 
 		# Use theme: table background = secondary, text = primary. Keep swatch color intact.
 		table_style = f'border-collapse:collapse; margin:0; background-color:{colorSecondary.name()}; color:{colorPrimary.name()}; padding:6px; border-radius:6px;'
@@ -350,9 +389,13 @@ class _TagFlowContainer(QWidget):
 
 
 class TagsPaletteWidget(QWidget):
-	""" Palette listing available tags as colorful bubbles, with management and scope filtering. """
+	""" Palette listing available tags as colorful bubbles, with management and scope filtering.
+	The bubbles also select the tags the views are filtered by (see TagFilterState and GetTagFilter). """
+	tagFilterChanged = pyqtSignal()
+
 	def __init__(self, mainWindow: 'MainWindow', parent: QWidget | None = None) -> None:
 		super().__init__(parent)
+		self._tagFilterStates: dict[str, TagFilterState] = dict()  # tagUID -> state, only for the tags not in NONE state
 
 		app = QApplication.instance()
 		self.tagsManager: TagsManager = app.GetTagsManager()
@@ -602,6 +645,24 @@ class TagsPaletteWidget(QWidget):
 		self.tagsManager.AddTag(cloneTag)        # appends at end; tagsChanged suppressed
 		self.tagsManager.blockSignals(False)
 		self.tagsManager.ReorderTags(orderedUIDs, True)  # moves clone to correct position, emits tagsChanged once
+
+	def _onFilterToggleRequested(self, tag: BaseTagImpl):
+		tagUID: str = tag.GetUID()
+		state: TagFilterState = TagFilterState((self._tagFilterStates.get(tagUID, TagFilterState.NONE) + 1) % len(TagFilterState))
+		if state == TagFilterState.NONE:
+			del self._tagFilterStates[tagUID]
+		else:
+			self._tagFilterStates[tagUID] = state
+		if isinstance(bubble := self.sender(), TagBubbleWidget):
+			bubble.SetFilterState(state)
+		self.tagFilterChanged.emit()
+	# endregion
+
+	# region Tag filter
+	def GetTagFilter(self) -> tuple[list[str], list[str]]:
+		""" Returns the UIDs of the (required, excluded) tags selected for filtering the views. """
+		return ([tagUID for tagUID, state in self._tagFilterStates.items() if state == TagFilterState.REQUIRED],
+			[tagUID for tagUID, state in self._tagFilterStates.items() if state == TagFilterState.EXCLUDED])
 	# endregion
 
 	def OnActiveContextChanged(self):
@@ -628,11 +689,21 @@ class TagsPaletteWidget(QWidget):
 		softwareFilter: str = self.softwareCombo.currentData() or ''
 		viewFilter: str = self.viewCombo.currentData() or ''
 
+		shownTagUIDs: set[str] = set()
 		for tag in self.tagsManager.GetTagsOrdered():
 			if not _tagMatchesFilter(tag, pluginFilter, softwareFilter, viewFilter):
 				continue
 			bubble = TagBubbleWidget(tag)
 			bubble.editRequested.connect(self._onEditTag)
 			bubble.deleteRequested.connect(self._onDeleteTag)
+			bubble.filterToggleRequested.connect(self._onFilterToggleRequested)
+			bubble.SetFilterState(self._tagFilterStates.get(tag.GetUID(), TagFilterState.NONE))
 			bubble.setFixedWidth(bubble.sizeHint().width())
 			flow.addWidget(bubble)
+			shownTagUIDs.add(tag.GetUID())
+
+		# Views are only filtered by the tags one can see (and unselect) in the palette
+		if hiddenTagUIDs := [tagUID for tagUID in self._tagFilterStates if tagUID not in shownTagUIDs]:
+			for tagUID in hiddenTagUIDs:
+				del self._tagFilterStates[tagUID]
+			self.tagFilterChanged.emit()
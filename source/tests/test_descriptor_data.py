@@ -0,0 +1,256 @@
+import sys, json, tempfile, unittest
+from pathlib import Path
+
+qavmPath = Path("./source").resolve()
+if str(qavmPath) not in sys.path:
+	sys.path.insert(0, str(qavmPath))
+
+from qavm.manager_descriptor_data import DescriptorDataManager, DescriptorDataImpl
+
+
+class _FakeDescriptor:
+	def __init__(self, uid: str, dirPath: Path | None = None) -> None:
+		self.uid = uid
+		self.dirPath = dirPath
+
+	def GetUID(self) -> str:
+		return self.uid
+
+
+class TestDescriptorData_Record(unittest.TestCase):
+	def test_record_is_compact(self):
+		descData = DescriptorDataImpl()
+		self.assertFalse(hasattr(descData, "__dict__"))
+		self.assertIs(descData.tags, DescriptorDataImpl().tags)
+		self.assertTrue(descData.IsEmpty())
+
+	def test_tag_uids_are_interned(self):
+		tagUID = "".join(["tag", "-uid"])  # built at runtime, so not interned by the compiler
+		data = [DescriptorDataImpl.Deserialize(json.loads(json.dumps({"tags": [tagUID]}))) for _ in range(2)]
+		self.assertIs(data[0].tags[0], data[1].tags[0])
+
+	def test_tag_uid_modifications(self):
+		descData = DescriptorDataImpl()
+		descData.AddTagUID("a")
+		descData.AddTagUID("b")
+		descData.AddTagUID("a")
+		self.assertEqual(descData.tags, ("a", "b"))
+		descData.RemoveTagUID("a")
+		self.assertEqual(descData.tags, ("b",))
+		descData.SetTagUIDs(["c", "b"])
+		self.assertEqual(DescriptorDataImpl.Deserialize(descData.Serialize()).tags, ("c", "b"))
+		with self.assertRaises(TypeError):
+			DescriptorDataImpl.Deserialize({"tags": [1]})
+
+	def test_version_follows_data(self):
+		descData = DescriptorDataImpl()
+		version: str = descData.GetVersion()
+		self.assertEqual(version, DescriptorDataImpl().GetVersion())
+		descData.noteSmall = "note"
+		self.assertNotEqual(descData.GetVersion(), version)
+		descData.noteSmall = ""
+		self.assertEqual(descData.GetVersion(), version)
+
+
+class TestDescriptorData_Shards(unittest.TestCase):
+	PLUGIN_ID = "com.example.plugin"
+	SOFTWARE_ID = "software.example"
+
+	def setUp(self):
+		self.tmpDir = tempfile.TemporaryDirectory()
+		self.dataFilepath = Path(self.tmpDir.name) / "descdata.json"
+		self.shardKey = DescriptorDataManager.GetShardKey(self.PLUGIN_ID, self.SOFTWARE_ID)
+
+	def tearDown(self):
+		self.tmpDir.cleanup()
+
+	def _makeManager(self) -> DescriptorDataManager:
+		manager = DescriptorDataManager(self.dataFilepath)
+		manager.LoadData()
+		return manager
+
+	def test_shard_is_loaded_lazily(self):
+		manager = self._makeManager()
+		self.assertEqual(manager.GetLoadedShardKeys(), [])
+
+		desc = _FakeDescriptor("desc1")
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [desc])
+		manager.GetDescriptorData(desc).noteSmall = "note"
+		manager.SaveData()
+		self.assertTrue((manager.shardsFolderPath / f"{self.shardKey}.json").exists())
+
+		manager = self._makeManager()
+		self.assertEqual(manager.GetLoadedShardKeys(), [])
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [desc])
+		self.assertIn(self.shardKey, manager.GetLoadedShardKeys())
+		self.assertEqual(manager.GetDescriptorData(desc).noteSmall, "note")
+
+	def test_legacy_data_is_migrated(self):
+		self.dataFilepath.write_text(json.dumps({"desc1": {"noteSmall": "legacy"}, "desc2": {"noteSmall": "other"}}), encoding="utf-8")
+		manager = self._makeManager()
+		desc = _FakeDescriptor("desc1")
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [desc])
+		self.assertEqual(manager.GetDescriptorData(desc).noteSmall, "legacy")
+
+		legacyData: dict = json.loads(self.dataFilepath.read_text(encoding="utf-8"))
+		self.assertEqual(list(legacyData.keys()), ["desc2"])
+		shardData: dict = json.loads((manager.shardsFolderPath / f"{self.shardKey}.json").read_text(encoding="utf-8"))
+		self.assertEqual(shardData["desc1"]["noteSmall"], "legacy")
+
+	def test_legacy_shard_is_not_reloaded_after_migration(self):
+		self.dataFilepath.write_text(json.dumps({"desc1": {"noteSmall": "legacy"}, "other": {"noteSmall": "other"}}), encoding="utf-8")
+		manager = self._makeManager()
+		desc1, desc2 = _FakeDescriptor("desc1"), _FakeDescriptor("desc2")
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [desc1, desc2])
+		manager.SHARD_IDLE_TIMEOUT = 0.0
+		manager.UnloadIdleShards()
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [desc1, desc2])
+		self.assertEqual(manager.GetLoadedShardKeys(), [self.shardKey])
+		self.assertEqual(manager.GetDescriptorData(desc1).noteSmall, "legacy")
+
+	def test_legacy_data_is_migrated_once_root_is_back_online(self):
+		root = Path(self.tmpDir.name) / "root"
+		desc1, desc2 = _FakeDescriptor("desc1", root / "1"), _FakeDescriptor("desc2", root / "2")
+		self.dataFilepath.write_text(json.dumps({"desc2": {"noteSmall": "legacy"}}), encoding="utf-8")
+		manager = self._makeManager()
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [], [root])  # the root is offline
+		manager.SaveData()
+
+		(root / "1").mkdir(parents=True)
+		(root / "2").mkdir()
+		manager = self._makeManager()
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [desc1], [root])
+		manager.SHARD_IDLE_TIMEOUT = 0.0
+		manager.UnloadIdleShards()
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [desc1, desc2], [root])  # e.g. a search path added
+		self.assertEqual(manager.GetDescriptorData(desc2).noteSmall, "legacy")
+		self.assertEqual(json.loads(self.dataFilepath.read_text(encoding="utf-8")), {})
+
+	def test_idle_shards_are_unloaded(self):
+		manager = self._makeManager()
+		desc = _FakeDescriptor("desc1")
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [desc])
+		manager.GetDescriptorData(desc).noteDetail = "detail"
+
+		manager.UnloadIdleShards()  # nothing is idle yet
+		self.assertIn(self.shardKey, manager.GetLoadedShardKeys())
+
+		manager.SHARD_IDLE_TIMEOUT = 0.0
+		manager.UnloadIdleShards(keepShardKeys=[self.shardKey])
+		self.assertEqual(manager.GetLoadedShardKeys(), [self.shardKey])
+		manager.UnloadIdleShards()
+		self.assertEqual(manager.GetLoadedShardKeys(), [])
+
+		# Unloaded shards are saved and transparently reloaded on access
+		self.assertEqual(manager.GetDescriptorData(desc).noteDetail, "detail")
+
+	def test_iter_descriptor_data_load_all(self):
+		manager = self._makeManager()
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [_FakeDescriptor("desc1")])
+		manager.SetDescriptorData(_FakeDescriptor("desc1"), DescriptorDataImpl())
+		manager.SaveData()
+
+		manager = self._makeManager()
+		self.assertEqual(list(manager.IterDescriptorData()), [])
+		self.assertEqual([uid for uid, _ in manager.IterDescriptorData(loadAll=True)], ["desc1"])
+
+
+class TestDescriptorData_Compaction(unittest.TestCase):
+	PLUGIN_ID = "com.example.plugin"
+	SOFTWARE_ID = "software.example"
+
+	def setUp(self):
+		self.tmpDir = tempfile.TemporaryDirectory()
+		self.dataFilepath = Path(self.tmpDir.name) / "descdata.json"
+		self.root = Path(self.tmpDir.name) / "root"
+		(self.root / "a").mkdir(parents=True)
+		(self.root / "b").mkdir(parents=True)
+		self.descA = _FakeDescriptor("descA", self.root / "a")
+		self.descB = _FakeDescriptor("descB", self.root / "b")
+
+		manager = self._makeManager()
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [self.descA, self.descB], [self.root])
+		manager.GetDescriptorData(self.descA).noteSmall = "a"
+		manager.GetDescriptorData(self.descB).noteSmall = "b"
+		manager.SaveData()
+
+	def tearDown(self):
+		self.tmpDir.cleanup()
+
+	def _makeManager(self) -> DescriptorDataManager:
+		manager = DescriptorDataManager(self.dataFilepath)
+		manager.LoadData()
+		return manager
+
+	def _readFiles(self) -> dict[Path, bytes]:
+		return {path: path.read_bytes() for path in Path(self.tmpDir.name).rglob("*.json")}
+
+	def _storedUIDs(self) -> list[str]:
+		return sorted(uid for uid, _ in self._makeManager().IterDescriptorData(loadAll=True))
+
+	def test_orphans_are_pruned_after_retention(self):
+		(self.root / "b").rmdir()
+		manager = self._makeManager()
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [self.descA], [self.root])
+
+		report = self._makeManager().CompactData(retentionDays=1.0)
+		self.assertEqual(report.orphanedEntries, [])
+		self.assertEqual(self._storedUIDs(), ["descA", "descB"])
+
+		dryReport = self._makeManager().CompactData(retentionDays=0.0, prune=False)
+		self.assertEqual([uid for _, uid, _ in dryReport.orphanedEntries], ["descB"])
+		self.assertEqual(self._storedUIDs(), ["descA", "descB"])
+
+		report = self._makeManager().CompactData(retentionDays=0.0)
+		self.assertEqual([(uid, path) for _, uid, path in report.orphanedEntries], [("descB", str(self.root / "b"))])
+		self.assertEqual(self._storedUIDs(), ["descA"])
+
+	def test_unreachable_roots_are_kept(self):
+		otherRoot = Path(self.tmpDir.name) / "other"
+		(otherRoot / "c").mkdir(parents=True)
+		descC = _FakeDescriptor("descC", otherRoot / "c")
+		manager = self._makeManager()
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [self.descA, self.descB, descC], [self.root, otherRoot])
+		manager.GetDescriptorData(descC).noteSmall = "c"
+		manager.SaveData()
+
+		# The whole root goes offline (e.g. unplugged drive) during the next scan
+		(otherRoot / "c").rmdir()
+		otherRoot.rmdir()
+		self._makeManager().RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [self.descA, self.descB], [self.root, otherRoot])
+
+		report = self._makeManager().CompactData(retentionDays=0.0)
+		self.assertEqual([uid for _, uid, _ in report.unreachableRootEntries], ["descC"])
+		self.assertEqual(report.orphanedEntries, [])
+		self.assertIn("descC", self._storedUIDs())
+
+	def test_empty_and_unknown_root_entries(self):
+		manager = self._makeManager()
+		manager.RegisterDescriptors(self.PLUGIN_ID, self.SOFTWARE_ID, [self.descA, self.descB], [self.root])
+		manager.GetDescriptorData(self.descB).noteSmall = ""
+		manager.SaveData()
+		legacyDesc = _FakeDescriptor("descLegacy")  # never registered, so it lives in the legacy shard
+		manager.GetDescriptorData(legacyDesc).noteDetail = "legacy"
+		manager.SaveData()
+
+		filesBefore: dict[Path, bytes] = self._readFiles()
+		dryReport = self._makeManager().CompactData(retentionDays=0.0, prune=False)
+		self.assertEqual([uid for _, uid, _ in dryReport.emptyEntries], ["descB"])
+		self.assertEqual(self._readFiles(), filesBefore)  # a dry run neither prunes nor starts the retention window
+
+		report = self._makeManager().CompactData(retentionDays=0.0)
+		self.assertEqual([uid for _, uid, _ in report.emptyEntries], ["descB"])
+		self.assertEqual(report.unknownRootEntries, [])  # the first compaction only starts the retention window
+		self.assertEqual(self._storedUIDs(), ["descA", "descLegacy"])
+
+		report = self._makeManager().CompactData(retentionDays=0.0)
+		self.assertEqual([uid for _, uid, _ in report.unknownRootEntries], ["descLegacy"])
+		self.assertEqual(self._storedUIDs(), ["descA", "descLegacy"])
+
+		report = self._makeManager().CompactData(retentionDays=0.0, pruneUnknownRoots=True)
+		self.assertEqual([uid for _, uid, _ in report.orphanedEntries], ["descLegacy"])
+		self.assertEqual(self._storedUIDs(), ["descA"])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,88 @@
+import gc, pickle, sys, unittest, weakref
+from pathlib import Path
+
+qavmPath = Path("./source").resolve()
+if str(qavmPath) not in sys.path:
+	sys.path.insert(0, str(qavmPath))
+
+from qavm.qavmapi import BaseDescriptor
+from qavm.qavmapi.descriptor_signals import GetDescriptorSignalsHub
+from qavm.manager_descriptor_updates import DescriptorUpdateBus
+from qavm.utils_descriptors import DescriptorsDiff
+
+
+class TestDescriptorUpdateBus(unittest.TestCase):
+	def setUp(self):
+		self.bus = DescriptorUpdateBus()
+		self.batches: list[set[str]] = []
+		self.bus.descriptorsUpdated.connect(self.batches.append)
+		self.descs: list[BaseDescriptor] = [BaseDescriptor(Path("/sw") / name, None, {}) for name in ("a", "b", "c")]
+
+	def test_updates_are_batched(self):
+		for desc in (self.descs[0], self.descs[2], self.descs[0]):
+			desc.descDataUpdated.emit()
+		self.bus.NotifyDescriptorsUpdated([self.descs[1].GetUID()])
+		self.assertEqual(self.batches, [])
+		self.bus.Flush()
+		self.assertEqual(self.batches, [{desc.GetUID() for desc in self.descs}])
+		self.bus.Flush()
+		self.assertEqual(len(self.batches), 1)
+
+
+class _Receiver:
+	def __init__(self) -> None:
+		self.calls: int = 0
+
+	def OnUpdated(self) -> None:
+		self.calls += 1
+
+
+class TestDescriptorSignals(unittest.TestCase):
+	def test_signals_are_routed_by_uid(self):
+		desc, rescannedDesc = BaseDescriptor(Path("/sw/a"), None, {}), BaseDescriptor(Path("/sw/a"), None, {"version.txt": "2"})
+		receiver, calls = _Receiver(), []
+		desc.descDataUpdated.connect(receiver.OnUpdated)
+		desc.descDataUpdated.connect(lambda: calls.append("lambda"))
+		rescannedDesc.descDataUpdated.emit()  # same UID
+		self.assertEqual((receiver.calls, calls), (1, ["lambda"]))
+
+		desc.descDataUpdated.disconnect(receiver.OnUpdated)
+		with self.assertRaises(TypeError):
+			desc.descDataUpdated.disconnect(receiver.OnUpdated)
+		desc.descDataUpdated.emit()
+		self.assertEqual((receiver.calls, calls), (1, ["lambda", "lambda"]))
+		desc.descDataUpdated.disconnect()
+
+		desc.descDataUpdated.connect(receiver.OnUpdated)
+		del receiver  # bound methods are referenced weakly
+		desc.descDataUpdated.emit()
+		self.assertEqual(calls, ["lambda", "lambda"])
+
+	def test_slots_of_removed_descriptors_are_released(self):
+		keptDesc, removedDesc = BaseDescriptor(Path("/sw/kept"), None, {}), BaseDescriptor(Path("/sw/removed"), None, {})
+		calls: list[str] = []
+		keptSlot, removedSlot = lambda: calls.append("kept"), lambda: calls.append("removed")
+		keptDesc.descDataUpdated.connect(keptSlot)
+		removedDesc.descDataUpdated.connect(removedSlot)
+		keptSlotRef, removedSlotRef = weakref.ref(keptSlot), weakref.ref(removedSlot)
+		del keptSlot, removedSlot
+
+		diff = DescriptorsDiff([keptDesc, removedDesc], [BaseDescriptor(Path("/sw/kept"), None, {})])
+		GetDescriptorSignalsHub().DisconnectDescriptors(desc.GetUID() for desc in diff.removed)
+		gc.collect()
+		self.assertIsNone(removedSlotRef())
+		self.assertIsNotNone(keptSlotRef())
+		removedDesc.descDataUpdated.emit()
+		keptDesc.descDataUpdated.emit()
+		self.assertEqual(calls, ["kept"])
+		keptDesc.descDataUpdated.disconnect()
+
+	def test_descriptors_are_plain_objects(self):
+		desc = BaseDescriptor(Path("/sw/a"), object(), {"version.txt": "1"})
+		self.assertFalse(hasattr(desc, "__dict__"))
+		copy: BaseDescriptor = pickle.loads(pickle.dumps(desc))
+		self.assertEqual((copy.GetUID(), copy.GetFingerprint(), copy.dirPath, copy.settings), (desc.GetUID(), desc.GetFingerprint(), desc.dirPath, None))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,111 @@
+import sys, unittest
+from pathlib import Path
+
+qavmPath = Path("./source").resolve()
+if str(qavmPath) not in sys.path:
+	sys.path.insert(0, str(qavmPath))
+
+from qavm.qavmapi import BaseDescriptor, BaseSettingsEntry, SoftwareBaseSettings
+from qavm.utils_descriptors import DescriptorsDiff, ProcessedDescriptorsCache
+
+
+class _FakeSoftwareHandler:
+	def GetDescriptorClasses(self) -> dict:
+		return {"descriptors/app": None, "descriptors/lib": None}
+
+
+class _FakeSettings(SoftwareBaseSettings):
+	SETTINGS_ENTRIES = {
+		"sort_reversed": BaseSettingsEntry(False, "Reversed", isTileUpdateRequired=True),
+		"unrelated": BaseSettingsEntry(0, "Unrelated"),
+	}
+	CONTAINER_DEFAULTS = {"sort_reversed": False, "unrelated": 0}
+
+	def GetSettingsVersion(self) -> int:
+		return 1
+
+
+class _FakeBuilder:
+	def __init__(self, settings: SoftwareBaseSettings) -> None:
+		self.settings: SoftwareBaseSettings = settings
+		self.processedTypes: list[str] = []
+
+	def GetSupportedDescriptorTypes(self, descriptorTypes: list[str]) -> list[str]:
+		return ["app"]
+
+	def ProcessDescriptors(self, descriptorType: str, descriptors: list[BaseDescriptor]) -> list[BaseDescriptor]:
+		self.processedTypes.append(descriptorType)
+		return sorted(descriptors, key=lambda desc: desc.dirPath.name, reverse=self.settings.GetSetting("sort_reversed"))
+
+
+class TestDescriptorsDiff(unittest.TestCase):
+	def _scan(self, versions: dict[str, str]) -> list[BaseDescriptor]:
+		return [BaseDescriptor(Path("/sw") / name, None, {"version.txt": version}) for name, version in versions.items()]
+
+	def test_fingerprint(self):
+		desc, same, changed = self._scan({"app": "1.0"})[0], self._scan({"app": "1.0"})[0], self._scan({"app": "1.1"})[0]
+		self.assertEqual(desc.GetFingerprint(), same.GetFingerprint())
+		self.assertNotEqual(desc.GetFingerprint(), changed.GetFingerprint())
+		self.assertEqual(desc.GetUID(), changed.GetUID())
+		self.assertNotEqual(BaseDescriptor(Path("/sw/app"), None, {"version.txt": b"1.0"}).GetFingerprint(),
+			BaseDescriptor(Path("/sw/app"), None, {"other.txt": b"1.0"}).GetFingerprint())
+
+	def test_unchanged_descriptors_are_kept(self):
+		oldDescs: list[BaseDescriptor] = self._scan({"a": "1", "b": "1", "c": "1"})
+		newDescs: list[BaseDescriptor] = self._scan({"d": "1", "b": "2", "a": "1"})
+		diff = DescriptorsDiff(oldDescs, newDescs)
+		self.assertFalse(diff.IsEmpty())
+		self.assertEqual(diff.added, [newDescs[0]])
+		self.assertEqual(diff.changed, [(oldDescs[1], newDescs[1])])
+		self.assertEqual(diff.removed, [oldDescs[2]])
+		self.assertEqual(diff.descs, [newDescs[0], newDescs[1], oldDescs[0]])  # in the new order, unchanged ones reused
+
+		self.assertTrue(DescriptorsDiff(oldDescs, self._scan({"a": "1", "b": "1", "c": "1"})).IsEmpty())
+
+
+class TestProcessedDescriptorsCache(unittest.TestCase):
+	def test_processed_descriptors_are_cached(self):
+		swHandler, cache = _FakeSoftwareHandler(), ProcessedDescriptorsCache()
+		builder = _FakeBuilder(_FakeSettings("fake-settings"))
+		descs: list[BaseDescriptor] = [BaseDescriptor(Path("/sw") / name, None, {}) for name in ("b", "a")]
+		descsMap: dict[str, list[BaseDescriptor]] = {"descriptors/app": descs, "descriptors/lib": descs[:1]}
+
+		self.assertEqual(cache.GetSupportedDescriptorTypes(swHandler, "view", builder), ["app"])
+		self.assertEqual(cache.GetDescriptors(swHandler, "view", builder, descsMap), [descs[1], descs[0]])
+		self.assertEqual(cache.GetDescriptors(swHandler, "view", builder, dict(descsMap)), [descs[1], descs[0]])
+		self.assertEqual(builder.processedTypes, ["app"])
+
+		# Unflagged settings keep the cache, flagged ones and new scan results invalidate it
+		builder.settings.SetSetting("unrelated", 1)
+		cache.GetDescriptors(swHandler, "view", builder, descsMap)
+		self.assertEqual(builder.processedTypes, ["app"])
+		builder.settings.SetSetting("sort_reversed", True)
+		self.assertEqual(cache.GetDescriptors(swHandler, "view", builder, descsMap), [descs[0], descs[1]])
+		builder.settings.SetSetting("sort_reversed", True)  # unchanged value
+		cache.GetDescriptors(swHandler, "view", builder, descsMap)
+		self.assertEqual(builder.processedTypes, ["app"] * 2)
+		cache.GetDescriptors(swHandler, "view", builder, {"descriptors/app": list(descs)})
+		cache.GetDescriptors(swHandler, "other_view", builder, descsMap)
+		self.assertEqual(builder.processedTypes, ["app"] * 4)
+
+	def test_reloading_unchanged_settings_keeps_cache(self):
+		swHandler, cache = _FakeSoftwareHandler(), ProcessedDescriptorsCache()
+		builder = _FakeBuilder(_FakeSettings("fake-settings-reload"))
+		builder.settings.Save()
+		descsMap: dict[str, list[BaseDescriptor]] = {"descriptors/app": [BaseDescriptor(Path("/sw") / name, None, {}) for name in ("b", "a")]}
+		cache.GetDescriptors(swHandler, "view", builder, descsMap)
+
+		builder.settings.Load()  # e.g. on a workspace switch
+		cache.GetDescriptors(swHandler, "view", builder, descsMap)
+		self.assertEqual(builder.processedTypes, ["app"])
+
+		otherSettings = _FakeSettings("fake-settings-reload")
+		otherSettings.container.Set("sort_reversed", not builder.settings.GetSetting("sort_reversed"))
+		otherSettings.Save()
+		builder.settings.Load()
+		cache.GetDescriptors(swHandler, "view", builder, descsMap)
+		self.assertEqual(builder.processedTypes, ["app"] * 2)
+
+
+if __name__ == "__main__":
+	unittest.main()
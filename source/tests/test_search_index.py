@@ -0,0 +1,113 @@
+import sys, tempfile, unittest
+from pathlib import Path
+
+qavmPath = Path("./source").resolve()
+if str(qavmPath) not in sys.path:
+	sys.path.insert(0, str(qavmPath))
+
+from qavm.qavmapi import BaseDescriptor
+from qavm.manager_descriptor_data import DescriptorDataManager
+from qavm.manager_tags import BaseTagImpl
+from qavm.manager_search import DescriptorSearchIndex
+
+
+class _FakeTagsManager:
+	def __init__(self) -> None:
+		self.tags: dict[str, BaseTagImpl] = dict()
+
+	def GetTag(self, tagUID: str) -> BaseTagImpl | None:
+		return self.tags.get(tagUID)
+
+
+class TestDescriptorSearchIndex(unittest.TestCase):
+	def setUp(self):
+		self.tmpDir = tempfile.TemporaryDirectory()
+		self.descDataManager = DescriptorDataManager(Path(self.tmpDir.name) / "descdata.json")
+		self.descDataManager.LoadData()
+		self.tagsManager = _FakeTagsManager()
+		self.index = DescriptorSearchIndex(self.descDataManager, self.tagsManager)
+		self.descs: list[BaseDescriptor] = [BaseDescriptor(Path("/sw") / name, None, {}) for name in ("Blender-4.1", "blender-3.6_LTS", "Houdini-20.0")]
+		self.index.SetDescriptors(self.descs)
+
+	def tearDown(self):
+		self.tmpDir.cleanup()
+
+	def _search(self, query: str) -> set[int] | None:
+		descUIDs: set[str] | None = self.index.Search(query)
+		return None if descUIDs is None else {descIdx for descIdx, desc in enumerate(self.descs) if desc.GetUID() in descUIDs}
+
+	def test_terms_match_substrings(self):
+		self.assertIsNone(self._search("  "))
+		self.assertEqual(self._search("BLEND"), {0, 1})
+		self.assertEqual(self._search("nder-4"), {0})
+		self.assertEqual(self._search("ble lts"), {1})
+		self.assertEqual(self._search("0.0"), {2})
+		self.assertEqual(self._search("-"), {0, 1, 2})
+		self.assertEqual(self._search("e"), {0, 1})
+		self.assertEqual(self._search("sw"), {0, 1, 2})
+		self.assertEqual(self._search("maya"), set())
+
+	def test_refined_query(self):
+		self.assertEqual(self._search("b"), {0, 1})
+		self.assertEqual(self._search("bl"), {0, 1})
+		self.assertEqual(self._search("blender-3"), {1})
+		self.assertEqual(self._search("blender"), {0, 1})  # not a refinement of the previous query
+		self.assertEqual(self._search("blender 4"), {0})
+
+	def test_notes_and_tags_are_indexed(self):
+		self.assertEqual(self._search("blender"), {0, 1})
+		self.tagsManager.tags["t1"] = BaseTagImpl("t1", "Production", "#ff0000")
+		descData = self.descDataManager.GetDescriptorData(self.descs[2])
+		descData.noteSmall = "Broken license"
+		descData.AddTagUID("t1")
+		self.descs[2].descDataUpdated.emit()
+		self.assertEqual(self._search("license"), {2})
+		self.assertEqual(self._search("product"), {2})
+		self.assertEqual(self._search("blender"), {0, 1})
+
+		descData.noteSmall = ""
+		self.index.UpdateDescriptor(self.descs[2])
+		self.assertEqual(self._search("license"), set())
+
+	def test_descriptors_are_updated_incrementally(self):
+		self.assertEqual(self._search("houdini"), {2})
+		newDesc = BaseDescriptor(Path("/sw") / "Houdini-20.5", None, {})
+		self.descs = [self.descs[0], newDesc]
+		self.index.SetDescriptors(self.descs)
+		self.assertEqual(self.index.GetDescriptorsCount(), 2)
+		self.assertEqual(self._search("houdini"), {1})
+		self.assertEqual(self._search("lts"), set())
+		self.assertEqual(self._search("20.5"), {1})
+
+	def test_tag_combinations(self):
+		for descIdx, tagUIDs in enumerate([("a", "b"), ("a",), ("a", "b", "c")]):
+			self.descDataManager.GetDescriptorData(self.descs[descIdx]).SetTagUIDs(tagUIDs)
+		self.index.SetDescriptors(self.descs)
+		self.assertIsNone(self.index.Search(""))
+		self.assertEqual(self._searchTags(["a", "b"], ["c"]), {0})
+		self.assertEqual(self._searchTags(["a"], []), {0, 1, 2})
+		self.assertEqual(self._searchTags([], ["b"]), {1})
+		self.assertEqual(self._searchTags(["unknown"], []), set())
+		self.assertEqual(self._searchTags([], ["unknown"]), {0, 1, 2})
+
+		# Bitsets follow descriptor data updates and removed descriptors
+		self.descDataManager.GetDescriptorData(self.descs[1]).SetTagUIDs(("b",))
+		self.descs[1].descDataUpdated.emit()
+		self.assertEqual(self._searchTags(["b"], ["c"]), {0, 1})
+		self.assertEqual(self._searchTags([], ["a"]), {1})
+		self.descs = self.descs[1:]
+		self.index.SetDescriptors(self.descs)
+		self.assertEqual(self._searchTags(["b"], []), {0, 1})
+		self.assertEqual(self._searchTags([], ["c"]), {0})
+
+		# Combined with a text query
+		self.assertEqual(set(self.index.Search("houdini", ["b"])), {self.descs[1].GetUID()})
+		self.assertEqual(self.index.Search("blender", [], ["b"]), set())
+
+	def _searchTags(self, requiredTagUIDs: list[str], excludedTagUIDs: list[str]) -> set[int]:
+		descUIDs: set[str] = self.index.Search("", requiredTagUIDs, excludedTagUIDs)
+		return {descIdx for descIdx, desc in enumerate(self.descs) if desc.GetUID() in descUIDs}
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,190 @@
+import sys, unittest
+from pathlib import Path
+
+qavmPath = Path("./source").resolve()
+if str(qavmPath) not in sys.path:
+	sys.path.insert(0, str(qavmPath))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QTableWidgetItem
+
+from qavm.qavmapi import TableColumnInfo, AsyncValue
+from qavm.qavmapi.gui import NumberTableWidgetItem, DescNotesCellData, TABLE_ROLE_DESCRIPTOR_INDEX, TABLE_ROLE_CELL_DATA, TABLE_ROLE_SORT_KEY
+from qavm.widget_table import DescriptorTableModel, DescriptorTableProxyModel
+from qavm.manager_async_values import AsyncValuesLoader
+
+
+class _FakeDescriptor:
+	def __init__(self, name: str, size: int) -> None:
+		self.name = name
+		self.size = size
+
+	def GetUID(self) -> str:
+		return self.name
+
+	def GetFingerprint(self) -> str:
+		return str(self.size)
+
+
+class _ReversedItem(QTableWidgetItem):
+	""" An item that only defines its ordering through __lt__. """
+	def __lt__(self, other):
+		return self.text() > other.text()
+
+
+class TestDescriptorTableModel(unittest.TestCase):
+	def setUp(self):
+		self.calls: list[str] = []
+		self.descs = [_FakeDescriptor("b", 10), _FakeDescriptor("", 2), _FakeDescriptor("a", 100)]
+		self.model = DescriptorTableModel(self.descs, [
+			TableColumnInfo("Name", self._getName),
+			TableColumnInfo("Size", lambda desc: NumberTableWidgetItem(desc.size)),
+		])
+		self.proxy = DescriptorTableProxyModel(self.model)
+
+	def _getName(self, desc: _FakeDescriptor) -> str:
+		self.calls.append(desc.name)
+		return desc.name
+
+	def _column(self, col: int) -> list:
+		return [self.proxy.data(self.proxy.index(row, col)) for row in range(self.proxy.rowCount())]
+
+	def test_cells_are_computed_on_demand(self):
+		self.assertEqual(self.calls, ["b"])  # only the first descriptor is probed for widget columns
+		self.assertEqual(self.model.data(self.model.index(2, 0)), "a")
+		self.assertEqual(self.model.data(self.model.index(2, 0)), "a")
+		self.assertEqual(self.calls, ["b", "a"])
+
+		self.model.InvalidateDescriptor(2)
+		self.model.data(self.model.index(2, 0))
+		self.assertEqual(self.calls, ["b", "a", "a"])
+
+	def test_sort_uses_item_ordering(self):
+		self.proxy.sort(1, Qt.SortOrder.AscendingOrder)
+		self.assertEqual(self._column(1), ["2", "10", "100"])  # numeric, not lexicographic
+		self.assertEqual([self.proxy.data(self.proxy.index(row, 0), TABLE_ROLE_DESCRIPTOR_INDEX) for row in range(3)], [1, 0, 2])
+
+		self.proxy.sort(0, Qt.SortOrder.DescendingOrder)
+		self.assertEqual(self._column(0), ["b", "a", ""])
+		self.assertIs(self.proxy.GetDescriptor(0), self.descs[0])
+		self.assertEqual(self.proxy.GetDescriptorRow(1), 2)
+		self.assertEqual([self.model.data(self.model.index(row, 0)) for row in range(3)], ["b", "", "a"])  # source rows never move
+
+	def test_sort_keys_are_computed_once(self):
+		self.proxy.sort(0, Qt.SortOrder.AscendingOrder)
+		self.proxy.sort(0, Qt.SortOrder.DescendingOrder)
+		self.assertEqual(sorted(self.calls), ["", "a", "b"])
+		self.assertEqual(self.model.data(self.model.index(2, 1), TABLE_ROLE_SORT_KEY), 100)
+
+		self.descs[2].name = "c"
+		self.model.InvalidateDescriptor(2)  # the proxy re-sorts the updated row on its own
+		self.assertEqual(self._column(0), ["c", "b", ""])
+		self.assertEqual(sorted(self.calls), ["", "a", "b", "c"])
+
+	def test_sort_falls_back_to_ranks(self):
+		model = DescriptorTableModel(self.descs, [TableColumnInfo("Name", lambda desc: _ReversedItem(desc.name))])
+		proxy = DescriptorTableProxyModel(model)
+		proxy.sort(0, Qt.SortOrder.AscendingOrder)
+		self.assertEqual([proxy.data(proxy.index(row, 0)) for row in range(3)], ["b", "a", ""])
+		self.assertEqual([model.data(model.index(row, 0), TABLE_ROLE_SORT_KEY) for row in range(3)], [0, 2, 1])
+
+	def test_descriptor_row_maps(self):
+		self.proxy.sort(1, Qt.SortOrder.DescendingOrder)
+		for desc in self.descs:
+			descIdx: int = self.model.GetDescriptorIndexOf(desc)
+			self.assertIs(self.proxy.GetDescriptor(self.proxy.GetDescriptorRow(descIdx)), desc)
+		self.assertEqual(self.model.GetDescriptorIndexOf(_FakeDescriptor("b", 10)), -1)
+
+		newDesc = _FakeDescriptor("c", 1)
+		self.model.AppendDescriptors([newDesc, self.descs[0]])
+		self.assertEqual(self.proxy.rowCount(), 4)
+		self.assertEqual(self.proxy.GetDescriptorRow(self.model.GetDescriptorIndexOf(newDesc)), 3)  # sorted in, smallest size
+		self.assertEqual(len(self.descs), 3)  # the caller's list is left untouched
+
+	def test_rows_are_patched(self):
+		self.proxy.sort(1, Qt.SortOrder.DescendingOrder)
+		self.assertEqual(self._column(0), ["a", "b", ""])
+		self.proxy.SetDescriptorFilter({"a", "b", "c"})
+		self.assertEqual(self.proxy.rowCount(), 2)
+
+		changedDesc, newDesc = _FakeDescriptor("a", 5), _FakeDescriptor("c", 50)
+		self.calls.clear()
+		self.assertEqual(self.model.UpdateDescriptors([self.descs[0], changedDesc, newDesc]), [1])
+		self.assertEqual(self.model.rowCount(), 3)
+		self.assertEqual(self._column(1), ["50", "10", "5"])  # sorted in, the kept row's cached values moved up with it
+		self.assertEqual(self._column(0), ["c", "b", "a"])
+		self.assertEqual(sorted(self.calls), ["a", "c"])
+		self.assertIs(self.proxy.GetDescriptor(2), changedDesc)
+		self.assertEqual(self.model.GetDescriptorIndexOf(self.descs[2]), -1)
+		self.assertEqual(self.model.GetDescriptorUIDs(), ["b", "a", "c"])
+		self.assertEqual([self.model.GetDescriptorIndexOfUID(descUID) for descUID in ["b", "a", "c", ""]], [0, 1, 2, -1])
+
+	def test_columns_are_invalidated(self):
+		self.proxy.sort(0, Qt.SortOrder.AscendingOrder)
+		self.assertEqual(self._column(1), ["2", "100", "10"])
+		for desc in self.descs:
+			desc.size *= 2
+		self.calls.clear()
+		self.model.InvalidateColumns([1])  # re-sorting by the name column needs no names
+		self.assertEqual(self._column(1), ["4", "200", "20"])
+		self.assertEqual(self.calls, [])
+
+		self.descs[1].name = "z"
+		self.model.InvalidateColumns([0])
+		self.assertEqual(self._column(0), ["a", "b", "z"])
+		self.assertEqual(sorted(self.calls), ["a", "b", "z"])
+
+	def test_lazy_columns(self):
+		slowCalls: list[str] = []
+		model = DescriptorTableModel(self.descs, [
+			TableColumnInfo("Name", self._getName),
+			TableColumnInfo("Hidden", lambda desc: self.fail("hidden columns are not probed")),
+			TableColumnInfo("Slow", lambda desc: slowCalls.append(desc.name) or desc.name.upper(), isExpensive=True),
+		], hiddenColumns={1})
+		self.assertEqual(slowCalls, [])
+
+		self.assertEqual(model.data(model.index(2, 2)), DescriptorTableModel.PENDING_CELL_TEXT)
+		self.assertEqual(slowCalls, [])
+		filled: list[set[int]] = []
+		model.pendingCellsFilled.connect(filled.append)
+		model._fillPendingCells()  # the next event loop tick
+		self.assertEqual((slowCalls, filled, model.data(model.index(2, 2))), (["a"], [{2}], "A"))
+
+		proxy = DescriptorTableProxyModel(model)
+		proxy.sort(2, Qt.SortOrder.AscendingOrder)  # sorting evaluates the column right away
+		self.assertEqual([proxy.data(proxy.index(row, 2)) for row in range(3)], ["", "A", "B"])
+
+	def test_async_cells(self):
+		getterCalls: list[str] = []
+		def getSize(desc: _FakeDescriptor) -> AsyncValue:
+			return AsyncValue(lambda: getterCalls.append(desc.name) or desc.size, 'size', '…', NumberTableWidgetItem)
+		loader = AsyncValuesLoader()
+		self.addCleanup(loader.Shutdown)
+		model = DescriptorTableModel(self.descs, [TableColumnInfo("Size", getSize)], asyncValuesLoader=loader)
+		proxy = DescriptorTableProxyModel(model)
+		proxy.sort(0, Qt.SortOrder.AscendingOrder)
+		self.assertEqual([proxy.data(proxy.index(row, 0)) for row in range(3)], ["…"] * 3)
+
+		filled: list[set[int]] = []
+		model.pendingCellsFilled.connect(filled.append)
+		loader.Flush()
+		self.assertEqual(filled, [{0, 1, 2}])
+		self.assertEqual([proxy.data(proxy.index(row, 0)) for row in range(3)], ["2", "10", "100"])  # re-sorted numerically
+
+		model.InvalidateDescriptors([0, 1, 2])  # results are cached per descriptor
+		self.assertEqual([proxy.data(proxy.index(row, 0)) for row in range(3)], ["2", "10", "100"])
+		self.assertEqual(sorted(getterCalls), ["", "a", "b"])
+
+	def test_painted_cells(self):
+		model = DescriptorTableModel(self.descs, [TableColumnInfo("Note", lambda desc: DescNotesCellData(desc.name))])
+		self.assertEqual(model.GetPaintedColumns(), {0: DescNotesCellData})
+		self.assertIsNone(model.data(model.index(0, 0)))
+		self.assertIsInstance(model.data(model.index(0, 0), TABLE_ROLE_CELL_DATA), DescNotesCellData)
+
+		proxy = DescriptorTableProxyModel(model)
+		proxy.sort(0, Qt.SortOrder.AscendingOrder)
+		self.assertEqual([proxy.data(proxy.index(row, 0), TABLE_ROLE_CELL_DATA).GetText() for row in range(3)], ["a", "b", "-"])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,23 @@
+import sys, unittest
+from pathlib import Path
+
+qavmPath = Path("./source").resolve()
+if str(qavmPath) not in sys.path:
+	sys.path.insert(0, str(qavmPath))
+
+from qavm.qavmapi import TileDetailLevel
+from qavm.widget_tiles import TilesWidget, GetAutoTileDetailLevel
+
+
+class TestAutoTileDetailLevel(unittest.TestCase):
+	def test_level_follows_tiles_count(self):
+		self.assertEqual(GetAutoTileDetailLevel(0), TileDetailLevel.FULL)
+		self.assertEqual(GetAutoTileDetailLevel(TilesWidget.AUTO_COMPACT_TILES_COUNT - 1), TileDetailLevel.FULL)
+		self.assertEqual(GetAutoTileDetailLevel(TilesWidget.AUTO_COMPACT_TILES_COUNT), TileDetailLevel.COMPACT)
+		self.assertEqual(GetAutoTileDetailLevel(TilesWidget.AUTO_DENSE_TILES_COUNT), TileDetailLevel.DENSE)
+		self.assertEqual(GetAutoTileDetailLevel(10**6), TileDetailLevel.DENSE)
+
+
+
+if __name__ == "__main__":
+	unittest.main()
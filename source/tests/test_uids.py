@@ -1,4 +1,4 @@
-import sys, unittest
+import re, sys, unittest
 from pathlib import Path
 
 qavmPath = Path("./source").resolve()
@@ -206,6 +206,66 @@ class TestUID_Basic(unittest.TestCase):
 			self.assertFalse(UID.MatchDataPath(pattern, path), f"Pattern '{pattern}' should not match path '{path}'")
 
 
+class TestUID_Parsed(unittest.TestCase):
+	# uid -> (pluginID, softwareID, dataPath, pluginSoftwareID, softwareIDDataPath, dataPathParts, isWildcard)
+	EXPECTED_PARTS = {
+		"com.plugin-id#software_name.c4d#view/tiles-c4d": ("com.plugin-id", "software_name.c4d", "view/tiles-c4d", "com.plugin-id#software_name.c4d", "software_name.c4d#view/tiles-c4d", ["view", "tiles-c4d"], False),
+		"bad id#software.c4d#view/tiles": (None, "software.c4d", "view/tiles", None, "software.c4d#view/tiles", ["view", "tiles"], False),
+		"com.plugin#bad/id#view/tiles": ("com.plugin", None, "view/tiles", None, None, ["view", "tiles"], False),
+		"com.plugin#software.c4d#bad..path": ("com.plugin", "software.c4d", None, "com.plugin#software.c4d", None, [], False),
+		"onlyonepart": ("onlyonepart", "onlyonepart", "onlyonepart", None, None, ["onlyonepart"], False),
+		"": (None, None, None, None, None, [], False),
+		"a#b": ("a", "b", "b", "a#b", "a#b", ["b"], False),
+		"com.plugin-id#software.abc#path/*": ("com.plugin-id", "software.abc", "path/*", "com.plugin-id#software.abc", "software.abc#path/*", ["path", "*"], True),
+		"com.plugin-id#software.abc#path/?": ("com.plugin-id", "software.abc", "path/?", "com.plugin-id#software.abc", "software.abc#path/?", ["path", "?"], True),
+		"software.abc#tiles/c4d": (None, "software.abc", "tiles/c4d", None, "software.abc#tiles/c4d", ["tiles", "c4d"], False),
+		"software.abc#bad..path": (None, None, None, None, None, [], False),
+		"a#b#c#d": (None, None, None, None, None, [], False),
+		"com.plugin-id#software?abc#path/with?question_mark": ("com.plugin-id", None, "path/with?question_mark", None, None, ["path", "with?question_mark"], True),
+		"views/tiles/c4d": (None, None, "views/tiles/c4d", None, None, ["views", "tiles", "c4d"], False),
+		"views/*": (None, None, "views/*", None, None, ["views", "*"], True),
+	}
+
+	def test_parsed_parts(self):
+		for uid, expected in self.EXPECTED_PARTS.items():
+			parsed = UID.Parse(uid)
+			self.assertEqual(parsed.pluginID, expected[0], f"Plugin ID mismatch for {uid}")
+			self.assertEqual(parsed.softwareID, expected[1], f"Software ID mismatch for {uid}")
+			self.assertEqual(parsed.dataPath, expected[2], f"Data path mismatch for {uid}")
+			self.assertEqual(parsed.pluginSoftwareID, expected[3], f"Plugin#Software ID mismatch for {uid}")
+			self.assertEqual(parsed.softwareIDDataPath, expected[4], f"Software#DataPath ID mismatch for {uid}")
+			self.assertEqual(list(parsed.dataPathParts), expected[5], f"Data path parts mismatch for {uid}")
+			self.assertEqual(parsed.isWildcard, expected[6], f"Wildcard flag mismatch for {uid}")
+
+	def test_parsed_uid_is_interned_and_hashable(self):
+		uid = "com.plugin-id#software.abc#path/tiles"
+		parsed = UID.Parse(uid)
+		self.assertIs(parsed, UID.Parse(uid))
+		self.assertIs(parsed, UID.Parse(parsed))
+		self.assertEqual(parsed, uid)
+		self.assertEqual(str(parsed), uid)
+		self.assertEqual(hash(parsed), hash(uid))
+		self.assertEqual({parsed: 1}[uid], 1)
+		self.assertNotEqual(parsed, UID.Parse("com.plugin-id#software.abc#path/table"))
+		# Static helpers accept parsed UIDs as well
+		self.assertEqual(UID.FetchDataPath(parsed), "path/tiles")
+		self.assertEqual(UID.DataPathGetLastPart(parsed), "tiles")
+		with self.assertRaises(TypeError):
+			UID.Parse(None)
+
+	def test_match_data_path_cached_matcher(self):
+		cases = [
+			("path/*", "path/subpath"), ("path/?", "path/too_long"), ("path/*/sub", "path/sub"),
+			("com.plugin#software.abc#views/*", "com.plugin#software.abc#views/tiles"),
+			("com.plugin#software.abc#views/*", "com.plugin#software.xyz#views/tiles"),
+		]
+		for pattern, path in cases:
+			expected = re.compile(UID._datapath_wildcard_to_regex(pattern)).fullmatch(path) is not None
+			for _ in range(2):  # second call is served by the cached matcher
+				self.assertEqual(UID.MatchDataPath(pattern, path), expected, f"Pattern '{pattern}' vs path '{path}'")
+			self.assertEqual(UID.MatchDataPath(UID.Parse(pattern), UID.Parse(path)), expected)
+
+
 
 if __name__ == "__main__":
 	unittest.main()
\ No newline at end of file
@@ -0,0 +1,66 @@
+import sys, random, unittest
+from pathlib import Path
+
+qavmPath = Path("./source").resolve()
+if str(qavmPath) not in sys.path:
+	sys.path.insert(0, str(qavmPath))
+
+from PyQt6.QtCore import QSize, QRect, QPoint
+
+from qavm.utils_gui import FlowGrid
+
+
+class TestFlowGrid(unittest.TestCase):
+	def setUp(self):
+		self.grid = FlowGrid(margin=5, hspacing=5, vspacing=5)
+		self.sizes = [QSize(40, 20), QSize(40, 30), QSize(40, 20), QSize(100, 10), QSize(40, 20)]
+
+	def test_items_wrap_like_flow_layout(self):
+		height: int = self.grid.Layout(self.sizes, 100)
+		self.assertEqual([self.grid.GetItemRect(i).topLeft().x() for i in range(5)], [5, 50, 5, 5, 5])
+		self.assertEqual([self.grid.GetItemRect(i).topLeft().y() for i in range(5)], [5, 5, 40, 65, 80])
+		self.assertEqual(height, 105)
+		self.assertEqual(self.grid.GetWidth(), 110)  # the wide item doesn't fit and sticks out
+
+	def test_items_in_range(self):
+		self.grid.Layout(self.sizes, 100)
+		self.assertEqual(self.grid.GetItemsInRange(0, 5), range(0, 2))
+		self.assertEqual(self.grid.GetItemsInRange(0, 4), range(0))  # the top margin
+		self.assertEqual(self.grid.GetItemsInRange(36, 39), range(0))  # between the rows
+		self.assertEqual(self.grid.GetItemsInRange(30, 70), range(0, 4))
+		self.assertEqual(self.grid.GetItemsInRange(95, 1000), range(4, 5))
+		self.assertEqual(self.grid.GetItemRect(4), QRect(5, 80, 40, 20))
+
+	def test_item_at(self):
+		self.grid.Layout(self.sizes, 100)
+		self.assertEqual(self.grid.GetItemAt(QPoint(60, 30)), 1)
+		self.assertEqual(self.grid.GetItemAt(QPoint(60, 27)), 1)  # the taller item of the row
+		self.assertEqual(self.grid.GetItemAt(QPoint(20, 27)), -1)  # below the shorter one
+		self.assertEqual(self.grid.GetItemAt(QPoint(20, 37)), -1)  # between the rows
+		self.assertEqual(self.grid.GetItemAt(QPoint(104, 70)), 3)
+		self.assertEqual(self.grid.GetItemAt(QPoint(2, 2)), -1)
+
+	def test_partial_relayout(self):
+		rnd: random.Random = random.Random(7)
+		sizes: list[QSize] = [QSize(rnd.randint(10, 60), rnd.randint(5, 30)) for _ in range(200)]
+		self.grid.Layout(sizes, 300)
+		for _ in range(50):
+			index: int = rnd.randrange(len(sizes) + 1)
+			if index == len(sizes) or rnd.random() < 0.3:
+				sizes.insert(index, QSize(rnd.randint(10, 60), rnd.randint(5, 30)))
+			elif rnd.random() < 0.5:
+				del sizes[index]
+			else:
+				sizes[index] = QSize(rnd.randint(10, 60), rnd.randint(5, 30))
+			height: int = self.grid.Layout(sizes, 300, fromIndex=index)
+			fullGrid = FlowGrid(margin=5, hspacing=5, vspacing=5)
+			self.assertEqual(height, fullGrid.Layout(sizes, 300))
+			self.assertEqual([self.grid.GetItemRect(i) for i in range(len(sizes))], [fullGrid.GetItemRect(i) for i in range(len(sizes))])
+
+	def test_empty(self):
+		self.assertEqual(self.grid.Layout([], 100), 10)
+		self.assertEqual(self.grid.GetItemsInRange(0, 100), range(0))
+
+
+if __name__ == "__main__":
+	unittest.main()